@@ -7,12 +7,18 @@ File based database interface
 
 import datetime
 from abc import ABCMeta
+from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import os
 import pandas
+import sqlite3
 from pyfileindex import PyFileIndex
 from pyiron_base.database.interface import IsDatabase
+from pyiron_base.state.logger import logger
+from pyiron_base.state.settings import settings
+from pyiron_base.storage.hdfpool import hdf_file_pool
 from h5io_browser.base import _read_hdf, _write_hdf
 
 __author__ = "Jan Janssen"
@@ -83,19 +89,70 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
     re-initialized, it is important to keep the (re)instantiation cost for this class
     as minimal as possible.
 
+    New HDF5 files are indexed in a pool of processes once there are more than
+    `extract_parallel_min_files` of them. HDF5 files which can not be indexed, for example
+    because they were not written by pyiron, are skipped and recorded in `extract_errors`.
+
+    With the `file_table_index` configuration enabled, the metadata read from the HDF5
+    files is stored in a :class:`FileTableIndex` at the root of the index, so new
+    processes only read the HDF5 files which changed since they were indexed last.
+
+    The lookups by job ID, by project and job name and by master ID use a :class:`JobTableLookup`,
+    which is rebuilt on the first lookup after the job table was modified.
+
     Args:
          index_from (str): The file path to start indexing at, i.e. the project path.
          fileindex (PyFileIndex): In case the file path in index_from is already indexed,
                                   then the index can be provided as additional input parameter.
     """
 
+    extract_parallel_min_files = 1000
+
     def __init__(self, index_from: str, fileindex: PyFileIndex = None):
         self._fileindex = None
-        self._job_table = None
+        self._job_table_df = None
+        self._lookup = None
+        self._extract_error_dict = {}
+        self._index = None
+        # metadata of the HDF5 files with the path as key and the modification time, the metadata and the error as value
+        self._metadata_dict = {}
+        # modification time of each HDF5 file when the status of its jobs was read last
+        self._file_mtime_dict = {}
         self._path = os.path.abspath(index_from)
         self._columns = list(table_columns.keys())
         self.force_reset(fileindex=fileindex)
 
+    @property
+    def _job_table(self):
+        return self._job_table_df
+
+    @_job_table.setter
+    def _job_table(self, df):
+        self._job_table_df = df
+        self._lookup = None
+
+    @property
+    def lookup(self):
+        """
+        JobTableLookup: hash indexes of the job table, kept in sync with the job table
+        """
+        if self._lookup is None:
+            self._lookup = JobTableLookup(df=self._job_table)
+        return self._lookup
+
+    def _get_position(self, job_id):
+        position = self.lookup.id_dict.get(int(job_id))
+        if position is None:
+            raise IndexError("There is no job with the job ID " + str(job_id))
+        return position
+
+    def _append_to_job_table(self, df):
+        lookup, start = self._lookup, len(self._job_table)
+        self._job_table = pandas.concat([self._job_table, df]).reset_index(drop=True)
+        if lookup is not None:
+            lookup.append(df=df, start=start)
+            self._lookup = lookup
+
     def add_item_dict(self, par_dict):
         """
         Create a new database item
@@ -135,11 +192,47 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         par_dict_merged = table_columns.copy()
         par_dict_merged.update(default_values)
         par_dict_merged.update(par_dict)
-        self._job_table = pandas.concat(
-            [self._job_table, pandas.DataFrame([par_dict_merged])[self._columns]]
-        ).reset_index(drop=True)
+        self._append_to_job_table(df=pandas.DataFrame([par_dict_merged])[self._columns])
         return int(par_dict_merged["id"])
 
+    def add_items_dicts(self, par_dict_lst):
+        """
+        Create multiple new database items at once
+
+        Args:
+            par_dict_lst (list): list of dictionaries with the item values and column names as keys, see
+                                 :meth:`add_item_dict` for the format of the individual dictionaries
+
+        Returns:
+            list: Database IDs of the items created in the order of the input dictionaries, like: [3, 4, 5]
+        """
+        if len(par_dict_lst) == 0:
+            return []
+        if len(self._job_table) != 0:
+            first_job_id = np.max(self._job_table.id.values) + 1
+        else:
+            first_job_id = 1
+        time_now = datetime.datetime.now()
+        par_dict_merged_lst = []
+        for job_id, par_dict in enumerate(par_dict_lst, start=int(first_job_id)):
+            par_dict_merged = table_columns.copy()
+            par_dict_merged.update(
+                {
+                    "id": job_id,
+                    "status": "initialized",
+                    "chemicalformula": None,
+                    "timestart": time_now,
+                }
+            )
+            par_dict_merged.update(
+                dict((key.lower(), value) for key, value in par_dict.items())
+            )
+            par_dict_merged_lst.append(par_dict_merged)
+        self._append_to_job_table(
+            df=pandas.DataFrame(par_dict_merged_lst)[self._columns]
+        )
+        return [int(par_dict["id"]) for par_dict in par_dict_merged_lst]
+
     def delete_item(self, item_id):
         """
         Delete Item from database
@@ -148,13 +241,24 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             item_id (int): Databse Item ID (Integer), like: 38
         """
         item_id = int(item_id)
-        if item_id in [int(v) for v in self._job_table.id.values]:
+        if item_id in self.lookup.id_dict:
             self._job_table = self._job_table[
                 self._job_table.id != item_id
             ].reset_index(drop=True)
         else:
             raise ValueError
 
+    @property
+    def extract_errors(self):
+        """
+        HDF5 files in the file index which could not be added to the job table, for example because they were not
+        written by pyiron.
+
+        Returns:
+            dict: error message with the path of the HDF5 file as key
+        """
+        return self._extract_error_dict.copy()
+
     def force_reset(self, fileindex=None):
         """
         Reset cache of the FileTable object
@@ -168,6 +272,18 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             self._fileindex = PyFileIndex(
                 path=self._path, filter_function=filter_function
             )
+        self._file_mtime_dict = {}
+        self._extract_error_dict = {}
+        if settings.configuration["file_table_index"]:
+            self._index = FileTableIndex(path=self._path)
+            self._metadata_dict = self._index.load()
+            path_lst = set(self._fileindex.dataframe.path.values)
+            self._index.update(
+                remove_lst=[p for p in self._metadata_dict.keys() if p not in path_lst]
+            )
+        else:
+            self._index = None
+            self._metadata_dict = {}
         df = pandas.DataFrame(self.init_table(fileindex=self._fileindex.dataframe))
         if len(df) != 0:
             df.id = df.id.astype(int)
@@ -194,17 +310,15 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         if id_master is None:
             return []
         else:
-            df_tmp = self._job_table[self._job_table.id == id_master]
+            df_tmp = self._job_table.iloc[[self.lookup.id_dict[id_master]]]
             working_directory = (df_tmp["project"] + df_tmp["job"] + "_hdf5/").values[0]
+            df = self._job_table.iloc[
+                self.lookup.project_dict.get(working_directory, [])
+            ]
             if status is not None:
-                id_lst = self._job_table[
-                    (self._job_table.project == working_directory)
-                    & (self._job_table.status == status)
-                ].id.values
+                id_lst = df[df.status == status].id.values
             else:
-                id_lst = self._job_table[
-                    (self._job_table.project == working_directory)
-                ].id.values
+                id_lst = df.id.values
             return sorted(id_lst)
 
     def get_item_by_id(self, item_id):
@@ -233,10 +347,11 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
                      'totalcputime': 0.117788,
                      'username': u'Test'}
         """
-        item_id = int(item_id)
         return {
             k: list(v.values())[0]
-            for k, v in self._job_table[self._job_table.id == item_id].to_dict().items()
+            for k, v in self._job_table.iloc[[self._get_position(job_id=item_id)]]
+            .to_dict()
+            .items()
         }
 
     def get_items_dict(self, item_dict, return_all_columns=True):
@@ -298,9 +413,9 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
                   'totalcputime': 0.034,
                   'username': u'test'},.......]
         """
-        df = self._job_table
         if not isinstance(item_dict, dict):
             raise TypeError
+        df = self._job_table.iloc[self.lookup.get_positions(item_dict=item_dict)]
         for k, v in item_dict.items():
             if k in ["id", "parentid", "masterid"]:
                 df = df[df[k] == int(v)]
@@ -369,15 +484,12 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         if len(self._job_table) == 0:
             return None
         job_specifier.replace(".", "_")
-        job_id_lst = self._job_table[
-            (self._job_table.project == project)
-            & (self._job_table.job == job_specifier)
-        ].id.values
+        job_id_lst = self._job_table.id.values[
+            self.lookup.project_job_dict.get((project, job_specifier), [])
+        ]
         if len(job_id_lst) == 0:
-            job_id_lst = self._job_table[
-                self._job_table.project.str.contains(project)
-                & (self._job_table.job == job_specifier)
-            ].id.values
+            df = self._job_table.iloc[self.lookup.job_dict.get(job_specifier, [])]
+            job_id_lst = df[df.project.str.contains(project)].id.values
         if len(job_id_lst) == 0:
             return None
         elif len(job_id_lst) == 1:
@@ -397,7 +509,34 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         Returns:
             str: status of the job
         """
-        return self._job_table[self._job_table.id == job_id].status.values[0]
+        return self._job_table.status.values[self._get_position(job_id=job_id)]
+
+    def get_job_status_dict(self, job_id_lst):
+        """
+        Get the status of multiple jobs selected by their job IDs
+
+        Args:
+            job_id_lst (list): job IDs as integers
+
+        Returns:
+            dict: status of each job with the job ID as key, jobs which are not in the table are skipped
+        """
+        df = self._job_table[self._job_table.id.isin([int(j) for j in job_id_lst])]
+        return dict(zip(df.id.values.tolist(), df.status.values.tolist()))
+
+    def get_child_status_lst(self, master_id):
+        """
+        Get the status of all child jobs of a master job
+
+        Args:
+            master_id (int): job ID of the master job
+
+        Returns:
+            list: status of each child job
+        """
+        return self._job_table.status.values[
+            self.lookup.master_dict.get(int(master_id), [])
+        ].tolist()
 
     def get_job_working_directory(self, job_id):
         """
@@ -439,12 +578,47 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         fileindex = fileindex[~fileindex.is_directory]
         fileindex = fileindex.iloc[fileindex.path.values.argsort()]
         job_lst = []
-        for path, mtime in zip(fileindex.path, fileindex.mtime):
-            try:  # Ignore HDF5 files which are not created by pyiron
-                job_dict = self.get_extract(path, mtime)
-            except (ValueError, OSError):
-                pass
+        metadata_dict = {
+            path: self._metadata_dict[path][1:]
+            for path, mtime in zip(fileindex.path.values, fileindex.mtime.values)
+            if path in self._metadata_dict.keys()
+            and self._metadata_dict[path][0] == mtime
+        }
+        extract_path_lst = [
+            path for path in fileindex.path.values if path not in metadata_dict.keys()
+        ]
+        if len(extract_path_lst) > self.extract_parallel_min_files:
+            with ProcessPoolExecutor() as executor:
+                extract_lst = list(
+                    executor.map(_get_metadata_or_error, extract_path_lst, chunksize=64)
+                )
+        else:
+            extract_lst = [_get_metadata_or_error(path) for path in extract_path_lst]
+        metadata_dict.update(dict(zip(extract_path_lst, extract_lst)))
+        self._update_metadata(
+            metadata_dict={
+                path: (mtime,) + metadata_dict[path]
+                for path, mtime in zip(fileindex.path.values, fileindex.mtime.values)
+                if path in extract_path_lst
+            }
+        )
+        for path, mtime in zip(fileindex.path.values, fileindex.mtime.values):
+            metadata, error = metadata_dict[path]
+            if error is None:
+                try:
+                    job_dict = _get_extract_from_metadata(
+                        path=path, mtime=mtime, metadata=metadata
+                    )
+                except (ValueError, OSError) as e:
+                    error = type(e).__name__ + ": " + str(e)
+            if error is not None:  # Skip HDF5 files which are not created by pyiron
+                logger.debug("FileTable skips " + path + ": " + error)
+                self._extract_error_dict[path] = error
             else:
+                self._extract_error_dict.pop(path, None)
+                self._file_mtime_dict[job_dict["project"] + job_dict["job"] + ".h5"] = (
+                    mtime
+                )
                 job_dict["id"] = len(working_dir_lst) + 1
                 working_dir_lst.append(
                     job_dict["project"][:-1] + job_dict["subjob"] + "_hdf5/"
@@ -458,6 +632,17 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
                 job_lst.append(job_dict)
         return job_lst
 
+    def _update_metadata(self, metadata_dict):
+        """
+        Store the metadata of HDF5 files, in the persistent index if it is enabled.
+
+        Args:
+            metadata_dict (dict): modification time, metadata and error with the path of the HDF5 file as key
+        """
+        self._metadata_dict.update(metadata_dict)
+        if self._index is not None and len(metadata_dict) > 0:
+            self._index.update(metadata_dict=metadata_dict)
+
     def _item_update(self, par_dict, item_id):
         """
         Modify Item in database
@@ -471,8 +656,28 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         """
         if isinstance(item_id, str):
             item_id = float(item_id)
+        position = self.lookup.id_dict.get(int(item_id))
+        if position is None:
+            return
+        label = self._job_table.index[position]
         for k, v in par_dict.items():
-            self._job_table.loc[self._job_table.id == int(item_id), k] = v
+            self._job_table.loc[label, k] = v
+        if not JobTableLookup.columns.isdisjoint(par_dict.keys()):
+            self._lookup = None
+
+    def _items_update(self, par_dict, item_ids):
+        """
+        Modify multiple items in database at once
+
+        Args:
+            par_dict (dict): Dictionary of the parameters to be modified, where the key is the column name.
+            item_ids (list): Database Item IDs (Integer) - [38, 39]
+        """
+        mask = self._job_table.id.isin([int(float(i)) for i in item_ids])
+        for k, v in par_dict.items():
+            self._job_table.loc[mask, k] = v
+        if not JobTableLookup.columns.isdisjoint(par_dict.keys()):
+            self._lookup = None
 
     def set_job_status(self, job_id, status):
         """
@@ -482,21 +687,37 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             job_id (int): job ID as integer
             status (str): job status
         """
+        if isinstance(job_id, Iterable):
+            # all job IDs are validated before the first job is modified
+            job_id = [int(j) for j in job_id]
+            self._check_job_ids(job_id_lst=job_id)
         super().set_job_status(job_id=job_id, status=status)
         self._update_hdf5_status(job_id=job_id, status=status)
 
+    def _check_job_ids(self, job_id_lst):
+        missing_id_lst = sorted(set(job_id_lst) - set(self._job_table.id.values))
+        if len(missing_id_lst) > 0:
+            raise IndexError(
+                "Error when trying to find elements by given Job IDs: ",
+                missing_id_lst,
+            )
+
     def _update_hdf5_status(self, job_id, status):
         if isinstance(job_id, Iterable):
-            for j_id in job_id:
-                db_entry = self.get_item_by_id(item_id=j_id)
+            job_id_lst = [int(j) for j in job_id]
+            self._check_job_ids(job_id_lst=job_id_lst)
+            df = self._job_table[self._job_table.id.isin(job_id_lst)]
+            for project, subjob in zip(df.project.values, df.subjob.values):
+                hdf_file_pool.release(project + subjob + ".h5")
                 _write_hdf(
-                    hdf_filehandle=db_entry["project"] + db_entry["subjob"] + ".h5",
+                    hdf_filehandle=project + subjob + ".h5",
                     data=status,
-                    h5_path=db_entry["subjob"][1:] + "/status",
+                    h5_path=subjob[1:] + "/status",
                     overwrite="update",
                 )
         else:
             db_entry = self.get_item_by_id(item_id=job_id)
+            hdf_file_pool.release(db_entry["project"] + db_entry["subjob"] + ".h5")
             _write_hdf(
                 hdf_filehandle=db_entry["project"] + db_entry["subjob"] + ".h5",
                 data=status,
@@ -507,27 +728,28 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
     def update(self):
         """
         Update the filetable cache
+
+        The status is only read again from the HDF5 files which were modified since the status was read last, based on
+        the modification times in the file index.
         """
-        self._job_table.status = [
-            self._get_job_status_from_hdf5(job_id)
-            for job_id in self._job_table.id.values
-        ]
         self._fileindex.update()
         if len(self._job_table) != 0:
-            files_lst, working_dir_lst = zip(
-                *[
-                    [project + subjob[1:] + ".h5", project + subjob[1:] + "_hdf5"]
-                    for project, subjob in zip(
-                        self._job_table.project.values, self._job_table.subjob.values
-                    )
-                ]
-            )
-            sanitized_paths = self._fileindex.dataframe.path.str.replace("\\", "/")
+            job_path = self._job_table.project + self._job_table.subjob.str[1:]
+            files_lst = (job_path + ".h5").values
+            working_dir_lst = (job_path + "_hdf5").values
             # The files_list is generated using project path values
             # In pyiron, these are all forced to be posix-like with /
             # But _fileindex is of type PyFileIndex, which does _not_ modify paths
             # so to get the two compatible for an isin check, we need to sanitize the
             # _fileindex.dataframe.path results
+            sanitized_paths = self._fileindex.dataframe.path.str.replace("\\", "/")
+            self._update_changed_status(
+                files_lst=files_lst,
+                mtime_lst=pandas.Series(
+                    self._fileindex.dataframe.mtime.values,
+                    index=sanitized_paths.values,
+                ),
+            )
             df_new = self._fileindex.dataframe[
                 ~self._fileindex.dataframe.is_directory
                 & ~sanitized_paths.isin(files_lst)
@@ -542,47 +764,70 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
             if len(job_lst) > 0:
                 df = pandas.DataFrame(job_lst)[self._columns]
                 if len(files_lst) != 0 and len(working_dir_lst) != 0:
-                    self._job_table = pandas.concat([self._job_table, df]).reset_index(
-                        drop=True
-                    )
+                    self._append_to_job_table(df=df)
                 else:
                     self._job_table = df
 
+    def _update_changed_status(self, files_lst, mtime_lst):
+        """
+        Read the status of the jobs again, whose HDF5 files were modified, created or removed since the status was read
+        last.
+
+        Args:
+            files_lst (numpy.ndarray): HDF5 file of each job in the job table
+            mtime_lst (pandas.Series): modification time of the files in the file index, with the path as index
+        """
+        mtime_lst = mtime_lst[~mtime_lst.index.duplicated()]
+        mtime_current = pandas.Series(files_lst).map(mtime_lst)
+        mtime_previous = pandas.Series(files_lst).map(self._file_mtime_dict)
+        changed = ~(
+            (mtime_current == mtime_previous)
+            | (mtime_current.isna() & mtime_previous.isna())
+        ).values
+        if not changed.any():
+            return
+        df_changed = self._job_table[changed]
+        status_lst = [
+            get_job_status_from_file(hdf5_file=file_name, job_name=subjob[1:])
+            for file_name, subjob in zip(files_lst[changed], df_changed.subjob.values)
+        ]
+        self._job_table.loc[changed, "status"] = status_lst
+        if self._index is not None:
+            self._update_metadata(
+                metadata_dict={
+                    file_name: (
+                        mtime,
+                        {
+                            "status": status,
+                            "hamilton": hamilton,
+                            "hamversion": hamversion,
+                        },
+                        None,
+                    )
+                    for file_name, mtime, status, hamilton, hamversion in zip(
+                        files_lst[changed],
+                        mtime_current.values[changed],
+                        status_lst,
+                        df_changed.hamilton.values,
+                        df_changed.hamversion.values,
+                    )
+                    if not np.isnan(mtime)
+                }
+            )
+        for file_name, mtime in zip(files_lst[changed], mtime_current.values[changed]):
+            if np.isnan(mtime):
+                self._file_mtime_dict.pop(file_name, None)
+            else:
+                self._file_mtime_dict[file_name] = mtime
+
     @staticmethod
     def get_extract(path, mtime):
-        basename = os.path.basename(path)
-        job = os.path.splitext(basename)[0]
-        time = datetime.datetime.fromtimestamp(mtime)
-        return_dict = table_columns.copy()
-        return_dict.update(
-            {
-                "status": get_job_status_from_file(hdf5_file=path, job_name=job),
-                "job": job,
-                "subjob": "/" + job,
-                "project": os.path.dirname(path).replace("\\", "/") + "/",
-                # pyiron Project paths are forced to be posix-like with / instead of \
-                # in order for the contains and endswith tests down in _get_job_table
-                # to work on windows, we need to make sure that the file table obeys
-                # this conversion
-                "timestart": time,
-                "timestop": time,
-                "totalcputime": 0.0,
-                "hamilton": get_hamilton_from_file(hdf5_file=path, job_name=job),
-                "hamversion": get_hamilton_version_from_file(
-                    hdf5_file=path, job_name=job
-                ),
-            }
-        )
-        del return_dict["id"]
-        del return_dict["masterid"]
-        return return_dict
-
-    def _get_job_status_from_hdf5(self, job_id):
-        db_entry = self.get_item_by_id(job_id)
-        job_name = db_entry["subjob"][1:]
-        return get_job_status_from_file(
-            hdf5_file=os.path.join(db_entry["project"], job_name + ".h5"),
-            job_name=job_name,
+        return _get_extract_from_metadata(
+            path=path,
+            mtime=mtime,
+            metadata=get_job_metadata_from_file(
+                hdf5_file=path, job_name=_get_job_name_from_path(path=path)
+            ),
         )
 
     def _get_job_table(
@@ -593,7 +838,9 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         recursive=True,
         columns=None,
         element_lst=None,
+        filter_dict=None,
     ):
+        # the filters are applied on the returned table by IsDatabase._get_filtered_job_table()
         self.update()
         if project_path is None:
             project_path = self._path
@@ -641,15 +888,284 @@ class FileTable(IsDatabase, metaclass=FileTableSingleton):
         return False
 
 
+class JobTableLookup:
+    """
+    Hash indexes of the job table of a :class:`FileTable`, which map the job ID, the project, the pair of project and
+    job name, the job name and the master ID to the positions of the matching rows in the job table. So looking up a
+    job by its ID or its name does not require a comparison with every row of the job table.
+
+    Args:
+        df (pandas.DataFrame): job table
+    """
+
+    columns = frozenset(["id", "project", "job", "masterid"])
+
+    def __init__(self, df):
+        self.id_dict = {}
+        self.project_dict = defaultdict(list)
+        self.project_job_dict = defaultdict(list)
+        self.job_dict = defaultdict(list)
+        self.master_dict = defaultdict(list)
+        self.append(df=df, start=0)
+
+    def append(self, df, start):
+        """
+        Add the rows appended to the job table to the indexes.
+
+        Args:
+            df (pandas.DataFrame): rows appended to the job table
+            start (int): position of the first appended row in the job table
+        """
+        for position, (job_id, project, job, master_id) in enumerate(
+            zip(df.id.values, df.project.values, df.job.values, df.masterid.values),
+            start=start,
+        ):
+            self.id_dict[int(job_id)] = position
+            self.project_dict[project].append(position)
+            self.project_job_dict[(project, job)].append(position)
+            self.job_dict[job].append(position)
+            if master_id is not None and not pandas.isna(master_id):
+                self.master_dict[int(master_id)].append(position)
+
+    def get_positions(self, item_dict):
+        """
+        Get the positions of the rows which can match a query of :meth:`FileTable.get_items_dict`, based on the
+        equality conditions on the indexed columns. The remaining conditions still have to be applied on these rows.
+
+        Args:
+            item_dict (dict): query as dictionary with the column names as keys
+
+        Returns:
+            list/slice: positions of the rows in the job table
+        """
+        if "id" in item_dict.keys():
+            position = self.id_dict.get(int(item_dict["id"]))
+            return [] if position is None else [position]
+        elif "masterid" in item_dict.keys():
+            return self.master_dict.get(int(item_dict["masterid"]), [])
+        project, job = item_dict.get("project"), item_dict.get("job")
+        project_like, job_like = project is None or "%" in str(
+            project
+        ), job is None or "%" in str(job)
+        if not project_like and not job_like:
+            return self.project_job_dict.get((project, job), [])
+        elif not project_like:
+            return self.project_dict.get(project, [])
+        elif not job_like:
+            return self.job_dict.get(job, [])
+        else:
+            return slice(None)
+
+
+class FileTableIndex:
+    """
+    SQLite file at the root of a :class:`FileTable` index, which stores the metadata read from the HDF5 files together
+    with their modification time. New processes reuse the metadata of all HDF5 files which were not modified since.
+
+    Each update is written in a single transaction and SQLite locks the file while writing, so multiple processes can
+    share the same index. On file systems without working file locks the index should not be enabled. When the index
+    can not be read or written, for example on a read-only file system, the error is logged and the :class:`FileTable`
+    continues without it.
+
+    Args:
+        path (str): root directory of the file table index
+    """
+
+    file_name = ".pyiron_file_table.sqlite"
+
+    def __init__(self, path):
+        self._file_name = os.path.join(path, self.file_name)
+
+    @property
+    def path(self):
+        """
+        Returns:
+            str: path of the SQLite file
+        """
+        return self._file_name
+
+    def _connect(self):
+        connection = sqlite3.connect(self._file_name, timeout=60)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime REAL, status TEXT, hamilton TEXT, "
+            "hamversion TEXT, error TEXT)"
+        )
+        return connection
+
+    def load(self):
+        """
+        Read the metadata of all HDF5 files in the index.
+
+        Returns:
+            dict: modification time, metadata and error with the path of the HDF5 file as key
+        """
+        try:
+            connection = self._connect()
+            try:
+                row_lst = connection.execute(
+                    "SELECT path, mtime, status, hamilton, hamversion, error FROM files"
+                ).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Reading the file table index " + self._file_name + " failed: " + str(e)
+            )
+            return {}
+        return {
+            path: (
+                mtime,
+                (
+                    {"status": status, "hamilton": hamilton, "hamversion": hamversion}
+                    if error is None
+                    else None
+                ),
+                error,
+            )
+            for path, mtime, status, hamilton, hamversion, error in row_lst
+        }
+
+    def update(self, metadata_dict=None, remove_lst=None):
+        """
+        Store and remove the metadata of HDF5 files in a single transaction.
+
+        Args:
+            metadata_dict (dict): modification time, metadata and error with the path of the HDF5 file as key
+            remove_lst (list): paths of HDF5 files to remove from the index
+        """
+        if metadata_dict is None:
+            metadata_dict = {}
+        if remove_lst is None:
+            remove_lst = []
+        if len(metadata_dict) == 0 and len(remove_lst) == 0:
+            return
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute("BEGIN IMMEDIATE")
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?)",
+                        [
+                            (path, float(mtime))
+                            + (
+                                (
+                                    metadata["status"],
+                                    metadata["hamilton"],
+                                    metadata["hamversion"],
+                                )
+                                if metadata is not None
+                                else (None, None, None)
+                            )
+                            + (error,)
+                            for path, (mtime, metadata, error) in metadata_dict.items()
+                        ],
+                    )
+                    connection.executemany(
+                        "DELETE FROM files WHERE path = ?",
+                        [(path,) for path in remove_lst],
+                    )
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logger.warning(
+                "Writing the file table index " + self._file_name + " failed: " + str(e)
+            )
+
+
 def filter_function(file_name):
     return ".h5" in file_name
 
 
+def _get_job_name_from_path(path):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _get_extract_from_metadata(path, mtime, metadata):
+    """
+    Create the job table entry of an HDF5 file from the metadata read from the file.
+
+    Args:
+        path (str): path of the HDF5 file
+        mtime (float): modification time of the HDF5 file
+        metadata (dict): dictionary with the keys status, hamilton and hamversion
+
+    Returns:
+        dict: job table entry without id and masterid
+    """
+    job = _get_job_name_from_path(path=path)
+    time = datetime.datetime.fromtimestamp(mtime)
+    return_dict = table_columns.copy()
+    return_dict.update(metadata)
+    return_dict.update(
+        {
+            "job": job,
+            "subjob": "/" + job,
+            "project": os.path.dirname(path).replace("\\", "/") + "/",
+            # pyiron Project paths are forced to be posix-like with / instead of \
+            # in order for the contains and endswith tests down in _get_job_table
+            # to work on windows, we need to make sure that the file table obeys
+            # this conversion
+            "timestart": time,
+            "timestop": time,
+            "totalcputime": 0.0,
+        }
+    )
+    del return_dict["id"]
+    del return_dict["masterid"]
+    return return_dict
+
+
+def _get_metadata_or_error(path):
+    """
+    Read the metadata of an HDF5 file, catching the errors for HDF5 files not created by pyiron, so it can be executed
+    in a process pool.
+
+    Args:
+        path (str): path of the HDF5 file
+
+    Returns:
+        dict, str: metadata and None or None and the error message
+    """
+    try:
+        return (
+            get_job_metadata_from_file(
+                hdf5_file=path, job_name=_get_job_name_from_path(path=path)
+            ),
+            None,
+        )
+    except (ValueError, OSError, KeyError, TypeError, AttributeError) as e:
+        return None, type(e).__name__ + ": " + str(e)
+
+
+def get_job_metadata_from_file(hdf5_file, job_name):
+    """
+    Read the status, the job type and the version of a job from its HDF5 file, opening the file only once.
+
+    Args:
+        hdf5_file (str): path of the HDF5 file
+        job_name (str): name of the job, which is the group of the job in the HDF5 file
+
+    Returns:
+        dict: dictionary with the keys status, hamilton and hamversion
+    """
+    with hdf_file_pool.open(hdf5_file, mode="r") as hdf:
+        return {
+            "status": _read_hdf(hdf_filehandle=hdf, h5_path=job_name + "/status"),
+            "hamilton": _get_hamilton_from_type(
+                _read_hdf(hdf_filehandle=hdf, h5_path=job_name + "/TYPE")
+            ),
+            "hamversion": _read_hdf(hdf_filehandle=hdf, h5_path=job_name + "/VERSION"),
+        }
+
+
+def _get_hamilton_from_type(type_str):
+    return type_str.split(".")[-1].split("'")[0]
+
+
 def get_hamilton_from_file(hdf5_file, job_name):
-    return (
+    return _get_hamilton_from_type(
         _read_hdf(hdf_filehandle=hdf5_file, h5_path=job_name + "/TYPE")
-        .split(".")[-1]
-        .split("'")[0]
     )
 
 
@@ -15,6 +15,7 @@ from pyiron_base.utils.deprecate import deprecate
 import pandas
 import typing
 import fnmatch
+import time
 
 __author__ = "Murat Han Celik"
 __copyright__ = (
@@ -28,11 +29,44 @@ __status__ = "production"
 __date__ = "Sep 1, 2017"
 
 
+# columns which contain strings, filters on these columns can be evaluated by the database
+_STRING_COLUMNS = [
+    "status",
+    "chemicalformula",
+    "job",
+    "subjob",
+    "projectpath",
+    "project",
+    "computer",
+    "hamilton",
+    "hamversion",
+    "username",
+]
+
+
 class IsDatabase(ABC):
     """
     Captures common interface for all database types in pyiron, e.g. SQL/SQLite/FileTable.
     """
 
+    # number of job status changes made by the current process through any database object
+    _status_write_count = 0
+
+    @staticmethod
+    def get_status_write_count():
+        """
+        Get the number of job status changes made by the current process, so cached job status can be invalidated
+        whenever the status of any job was changed in this process.
+
+        Returns:
+            int: number of job status changes
+        """
+        return IsDatabase._status_write_count
+
+    @staticmethod
+    def _count_status_write():
+        IsDatabase._status_write_count += 1
+
     @abstractmethod
     def _get_view_mode(self):
         pass
@@ -65,9 +99,42 @@ class IsDatabase(ABC):
         recursive=True,
         columns=None,
         element_lst=None,
+        filter_dict=None,
     ):
         pass
 
+    @staticmethod
+    def _get_database_filter_dict(
+        mode: typing.Literal["regex", "glob"] = "glob", **kwargs: dict
+    ) -> dict:
+        """
+        Translate the filters of the job table into a dictionary of conditions which the database can evaluate while
+        selecting the rows, see :meth:`get_items_dict`.
+
+        The conditions select a superset of the matching jobs, wildcards are translated to SQL LIKE patterns and
+        ranges are passed on as tuples, while filters which cannot be expressed this way, like regular expressions or
+        glob character classes, are skipped. The exact filters are applied afterwards by
+        :meth:`_get_filtered_job_table` on the reduced table.
+
+        Args:
+            mode (str): search mode of the filters, "glob" or "regex"
+            **kwargs (dict): filters with keys matching the project database column name (eg. status="finished")
+
+        Returns:
+            dict: conditions with the column names as keys
+        """
+        filter_dict = {}
+        for key, val in kwargs.items():
+            if isinstance(val, tuple):
+                filter_dict[key] = val
+            elif mode == "glob" and key in _STRING_COLUMNS and isinstance(val, str):
+                if "*" not in val and "?" not in val and "[" not in val:
+                    filter_dict[key] = val
+                elif re.fullmatch(r"[\w\-./: *?]*", val) is not None:
+                    # the remaining characters match themselves in the LIKE implementation of all databases
+                    filter_dict[key] = val.replace("*", "%").replace("?", "_")
+        return filter_dict
+
     @staticmethod
     def _get_filtered_job_table(
         df: pandas.DataFrame,
@@ -78,12 +145,14 @@ class IsDatabase(ABC):
         Get a job table in a project based on matching values from any column in the project database
 
         The values in `kwargs` can be wildcards. The matches can be given
-        either via "glob" or "regex".
+        either via "glob" or "regex". Tuples of a lower and an upper bound
+        select a range of values, either bound can be None.
 
         Args:
             df (pandas.DataFrame): DataFrame to be filtered
+            mode (str): search mode of the string values, "glob" or "regex"
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
-                            (eg. status="finished")
+                            (eg. status="finished" or timestart=(datetime(2024, 1, 1), None))
 
         Returns:
             list: DataFrame containing filtered jobs
@@ -97,9 +166,15 @@ class IsDatabase(ABC):
                     f"Column name {key} does not exist in the project database!"
                 )
         for key, val in kwargs.items():
-            if mode == "regex":
-                pattern = re.compile(str(val))
-                update = df[key].apply(pattern.search).astype(bool)
+            if isinstance(val, tuple):
+                lower, upper = val
+                update = np.ones_like(df.index, dtype=bool)
+                if lower is not None:
+                    update &= (df[key] >= lower).values
+                if upper is not None:
+                    update &= (df[key] <= upper).values
+            elif mode == "regex":
+                update = df[key].astype(str).str.contains(str(val), regex=True).values
             elif mode == "glob":
                 if str(val).startswith("!"):
                     logger.warn(
@@ -108,9 +183,9 @@ class IsDatabase(ABC):
                         " `mode='regex' and use a regex convention (such as"
                         " `^(?!term$)`)"
                     )
-                arr = np.asarray(df[key]).astype(str)
-                matches = fnmatch.filter(arr, str(val))
-                update = np.array([k in matches for k in arr])
+                update = (
+                    df[key].astype(str).str.match(fnmatch.translate(str(val))).values
+                )
             mask &= update
         return df[mask]
 
@@ -151,7 +226,9 @@ class IsDatabase(ABC):
             mode (str): search mode when kwargs are given.
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
-                            instances of any character
+                            instances of any character. A tuple of a lower and an upper bound selects a range (eg.
+                            timestop=(datetime(2024, 1, 1), None)). The filters are evaluated by the database as far
+                            as possible and the columns used for filtering do not need to be part of `columns`.
 
         Returns:
             pandas.Dataframe: Return the result as a pandas.Dataframe object
@@ -185,19 +262,23 @@ class IsDatabase(ABC):
             pandas.reset_option("display.max_rows")
             pandas.reset_option("display.max_columns")
         pandas.set_option("display.max_colwidth", max_colwidth)
+        if job_name_contains != "":
+            warnings.warn(
+                "`job_name_contains` is deprecated - use `job='*term*'` instead"
+            )
+            kwargs["job"] = "*{}*".format(job_name_contains)
+        filter_columns = [key for key in kwargs.keys() if key not in columns]
         df = self._get_job_table(
             user=user,
             sql_query=sql_query,
             project_path=project_path,
             recursive=recursive,
-            columns=columns,
+            columns=list(columns) + filter_columns,
+            filter_dict=self._get_database_filter_dict(mode=mode, **kwargs),
         )
-        if job_name_contains != "":
-            warnings.warn(
-                "`job_name_contains` is deprecated - use `job='*term*'` instead"
-            )
-            kwargs["job"] = "*{}*".format(job_name_contains)
         df = self._get_filtered_job_table(df, mode=mode, **kwargs)
+        if len(filter_columns) > 0:
+            df = df.drop(columns=filter_columns)
         if sort_by is not None:
             return df.sort_values(by=sort_by)
         return df
@@ -207,6 +288,8 @@ class IsDatabase(ABC):
         pass
 
     def item_update(self, par_dict, item_id):
+        if "status" in par_dict:
+            self._count_status_write()
         if isinstance(item_id, Iterable):
             return self._items_update(par_dict=par_dict, item_ids=item_id)
         return self._item_update(par_dict=par_dict, item_id=item_id)
@@ -217,17 +300,59 @@ class IsDatabase(ABC):
 
     def _items_update(self, par_dict, item_ids):
         """
-        For now simply loops over all item_ids to call item_update,
-        but can be made more efficient.
-        Should be made an asbtract method when defined in inheriting classes
+        Loops over all item_ids to call item_update, database implementations which support updating multiple items at
+        once should overwrite this method.
 
         Args:
-            par_dict (_type_): _description_
-            item_ids (_type_): _description_
+            par_dict (dict): Dictionary of the parameters to be modified, where the key is the column name.
+            item_ids (list): Database Item IDs (Integer) - [38, 39]
         """
         for i_id in item_ids:
             self._item_update(par_dict=par_dict, item_id=i_id)
 
+    def add_items_dicts(self, par_dict_lst):
+        """
+        Create multiple new database items, database implementations which support inserting multiple items at once
+        should overwrite this method.
+
+        Args:
+            par_dict_lst (list): list of dictionaries with the item values and column names as keys
+
+        Returns:
+            list: Database IDs of the items created in the order of the input dictionaries, like: [3, 4, 5]
+        """
+        return [self.add_item_dict(par_dict=par_dict) for par_dict in par_dict_lst]
+
+    def get_child_status_lst(self, master_id):
+        """
+        Get the status of all child jobs of a master job, database implementations which can query the status column
+        on its own should overwrite this method.
+
+        Args:
+            master_id (int): job ID of the master job
+
+        Returns:
+            list: status of each child job
+        """
+        return [
+            db_entry["status"]
+            for db_entry in self.get_items_dict({"masterid": master_id})
+        ]
+
+    def wait_for_job_status_change(self, timeout):
+        """
+        Block until the status of a job in the database changed or the timeout is reached. Database implementations
+        which are notified about status changes should overwrite this method, by default it waits for the full timeout.
+
+        Args:
+            timeout (float): maximum time to wait in seconds
+
+        Returns:
+            bool: True if a status change was reported, False if the timeout was reached
+        """
+        time.sleep(timeout)
+        return False
+
     def set_job_status(self, status, job_id):
         """
         Set status of a job or multiple jobs if job_id is iterable.
@@ -236,6 +361,7 @@ class IsDatabase(ABC):
             status (str): status
             job_id (int, Iterable): job id
         """
+        self._count_status_write()
         if isinstance(job_id, Iterable):
             return self._items_update(
                 par_dict={"status": status},
@@ -246,6 +372,47 @@ class IsDatabase(ABC):
             item_id=job_id,
         )
 
+    def update_job_status(self, job_id, status, expected_status=None):
+        """
+        Set the status of a job only if it differs from the status in the database and, if expected_status is given,
+        only if the status in the database equals expected_status. Database implementations which can compare and set
+        the status with a single statement should overwrite this method.
+
+        Args:
+            job_id (int): job id
+            status (str): new status
+            expected_status (str/None): status the job is required to have to be updated
+
+        Returns:
+            bool: True if the status was changed, False otherwise
+        """
+        current_status = self.get_job_status(job_id=job_id)
+        if current_status == status or (
+            expected_status is not None and current_status != expected_status
+        ):
+            return False
+        self.set_job_status(status=status, job_id=job_id)
+        return True
+
+    def get_job_status_dict(self, job_id_lst):
+        """
+        Get the status of multiple jobs, database implementations which can query the status of multiple jobs at once
+        should overwrite this method.
+
+        Args:
+            job_id_lst (list): job ids
+
+        Returns:
+            dict: status of each job with the job id as key, jobs which are not in the database are skipped
+        """
+        status_dict = {}
+        for job_id in job_id_lst:
+            try:
+                status_dict[job_id] = self.get_job_status(job_id=job_id)
+            except IndexError:
+                pass
+        return status_dict
+
     def get_table_headings(self, table_name=None):
         """
         Get column names; if given table_name can select one of multiple tables defined in the database, but subclasses
@@ -6,6 +6,10 @@ The Jobtable module provides a set of top level functions to interact with the d
 """
 
 import numpy as np
+import pandas
+from threading import Lock
+import time
+from weakref import WeakKeyDictionary
 from pyiron_base.database.filetable import FileTable
 
 __author__ = "Jan Janssen"
@@ -178,3 +182,148 @@ def get_job_working_directory(database, sql_query, user, project_path, job_speci
             job_specifier=job_specifier,
         )
     )
+
+
+class JobTableCache:
+    """
+    In-process cache of the job table of a project, which is refreshed incrementally.
+
+    The first call of :meth:`job_table` queries the complete job table. The following calls query all columns only
+    for the jobs added since the last call. For the jobs between the lowest and the highest id of the cached jobs
+    which are not yet in a final status only the id and the status are queried, and the complete rows are queried
+    again just for the active jobs whose status changed, while the jobs in a final status are taken from the cache.
+    Jobs which are modified after they reached a final status are only found after the complete job table is queried
+    again, either when the cache is older than `max_age` seconds or after :meth:`invalidate` was called. The same
+    applies to deleted jobs with an id below the lowest id of the active jobs, they remain in the cache until then.
+
+    Args:
+        database (IsDatabase): database to query
+        sql_query (str): SQL query to enter a more specific request
+        user (str): username of the user whoes user space should be searched
+        project_path (str): root_path - this is in contrast to the project_path in GenericPath
+        recursive (bool): search subprojects [True/False]
+        max_age (float): time in seconds after which the complete job table is queried again
+    """
+
+    final_status_lst = ["finished", "not_converged", "warning", "aborted"]
+
+    def __init__(
+        self, database, sql_query, user, project_path, recursive=True, max_age=60
+    ):
+        self._database = database
+        self._sql_query = sql_query
+        self._user = user
+        self._project_path = project_path
+        self._recursive = recursive
+        self.max_age = max_age
+        self._df = None
+        self._last_full_refresh = None
+        self._lock = Lock()
+
+    def _query(self, columns=None, **kwargs):
+        return self._database.job_table(
+            sql_query=self._sql_query,
+            user=self._user,
+            project_path=self._project_path,
+            recursive=self._recursive,
+            columns=columns,
+            all_columns=columns is None,
+            sort_by="id",
+            **kwargs,
+        ).reset_index(drop=True)
+
+    def _refresh(self):
+        df = self._df
+        max_id = int(df.id.max())
+        active_id_lst = df.id[~df.status.isin(self.final_status_lst)].values
+        if len(active_id_lst) > 0:
+            lower_id, upper_id = int(active_id_lst.min()), int(active_id_lst.max())
+            df_status = self._query(columns=["id", "status"], id=(lower_id, upper_id))
+            df_cached = df[(df.id >= lower_id) & (df.id <= upper_id)]
+            df_merged = df_cached[["id", "status"]].merge(
+                df_status, on="id", how="left", suffixes=("", "_new")
+            )
+            # jobs which were deleted in the meantime are dropped from the cache
+            df = df[~df.id.isin(df_merged.id[df_merged.status_new.isna()].values)]
+            changed_id_lst = df_merged.id[
+                df_merged.id.isin(active_id_lst)
+                & df_merged.status_new.notna()
+                & (df_merged.status != df_merged.status_new)
+            ].values
+            if len(changed_id_lst) > 0:
+                df_changed = self._query(
+                    id=(int(changed_id_lst.min()), int(changed_id_lst.max()))
+                )
+                df_changed = df_changed[df_changed.id.isin(changed_id_lst)]
+                df = pandas.concat(
+                    [df[~df.id.isin(changed_id_lst)], df_changed],
+                    ignore_index=True,
+                )
+        df_new = self._query(id=(max_id + 1, None))
+        if len(df_new) > 0:
+            df = pandas.concat([df, df_new], ignore_index=True)
+        return df.sort_values(by="id").reset_index(drop=True)
+
+    def invalidate(self):
+        """
+        Drop the cached job table, so the next call of :meth:`job_table` queries the complete job table.
+        """
+        with self._lock:
+            self._df = None
+
+    def job_table(self):
+        """
+        Get the job table of the project with all columns sorted by the job id.
+
+        Returns:
+            pandas.DataFrame: job table
+        """
+        with self._lock:
+            if (
+                self._df is None
+                or len(self._df) == 0
+                or time.time() - self._last_full_refresh > self.max_age
+            ):
+                self._df = self._query()
+                self._last_full_refresh = time.time()
+            else:
+                self._df = self._refresh()
+            return self._df.copy()
+
+
+_job_table_cache_dict = WeakKeyDictionary()
+_job_table_cache_lock = Lock()
+
+
+def get_job_table_cache(
+    database, sql_query, user, project_path, recursive=True, max_age=60
+):
+    """
+    Get the job table cache of a project, the cache is shared by all calls with the same database and arguments.
+
+    Args:
+        database (IsDatabase): database to query
+        sql_query (str): SQL query to enter a more specific request
+        user (str): username of the user whoes user space should be searched
+        project_path (str): root_path - this is in contrast to the project_path in GenericPath
+        recursive (bool): search subprojects [True/False]
+        max_age (float): time in seconds after which the complete job table is queried again
+
+    Returns:
+        JobTableCache: job table cache
+    """
+    key = (sql_query, user, project_path, recursive)
+    with _job_table_cache_lock:
+        cache_dict = _job_table_cache_dict.setdefault(database, {})
+        if key not in cache_dict:
+            cache_dict[key] = JobTableCache(
+                database=database,
+                sql_query=sql_query,
+                user=user,
+                project_path=project_path,
+                recursive=recursive,
+                max_age=max_age,
+            )
+        else:
+            cache_dict[key].max_age = max_age
+        return cache_dict[key]
@@ -127,6 +127,8 @@ class DatabaseManager(metaclass=Singleton):
                 self.sql_connection_string,
                 self.sql_table_name,
                 timeout=self.connection_timeout,
+                pool_size=s.configuration["sql_pool_size"],
+                pool_recycle=s.configuration["sql_pool_recycle"],
             )
 
     def switch_to_local_database(self, file_name="pyiron.db", cwd=None):
@@ -182,6 +184,8 @@ class DatabaseManager(metaclass=Singleton):
                 self._database = DatabaseAccess(
                     self.sql_view_connection_string,
                     self.sql_view_table_name,
+                    pool_size=s.configuration["sql_pool_size"],
+                    pool_recycle=s.configuration["sql_pool_recycle"],
                 )
                 self._database.view_mode = True
         else:
@@ -202,6 +206,8 @@ class DatabaseManager(metaclass=Singleton):
                 self._database = DatabaseAccess(
                     self.sql_connection_string,
                     self.sql_table_name,
+                    pool_size=s.configuration["sql_pool_size"],
+                    pool_recycle=s.configuration["sql_pool_recycle"],
                 )
                 self._database.view_mode = False
             else:
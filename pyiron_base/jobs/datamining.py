@@ -5,7 +5,10 @@
 import codecs
 import concurrent.futures
 from datetime import datetime
+from functools import lru_cache
 import cloudpickle
+import hashlib
+import importlib.util
 import json
 import numpy as np
 import os
@@ -19,7 +22,7 @@ from pyiron_base.utils.deprecate import deprecate
 from pyiron_base.jobs.job.generic import GenericJob
 from pyiron_base.jobs.job.extension import jobstatus
 from pyiron_base.storage.hdfio import FileHDFio
-
+from pyiron_base.storage.hdfpool import hdf_file_pool
 
 __author__ = "Uday Gajera, Jan Janssen, Joerg Neugebauer"
 __copyright__ = (
@@ -48,6 +51,154 @@ def _from_pickle(hdf, key):
         return dill.loads(codecs.decode(hdf[key].encode(), "base64"))
 
 
+def _get_code_fingerprint(code):
+    consts = [
+        _get_code_fingerprint(c) if isinstance(c, types.CodeType) else repr(c)
+        for c in code.co_consts
+    ]
+    return repr((code.co_code, consts, code.co_names, code.co_varnames))
+
+
+def _get_global_names(code):
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names |= _get_global_names(c)
+    return names
+
+
+def _get_value_fingerprint(value, seen):
+    """
+    Fingerprint of a value a table function depends on, like the content of a closure cell or a global variable.
+
+    Args:
+        value: value to fingerprint
+        seen (set): ids of the code objects which are already being fingerprinted, to stop recursive functions
+
+    Returns:
+        str/None: fingerprint, None if the value can not be represented reliably
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return repr(value)
+    elif isinstance(value, (tuple, list, set, frozenset)):
+        if isinstance(value, (set, frozenset)):
+            try:
+                value = sorted(value)
+            except TypeError:
+                return None
+        item_lst = [_get_value_fingerprint(value=v, seen=seen) for v in value]
+        if None in item_lst:
+            return None
+        return repr(item_lst)
+    elif isinstance(value, dict):
+        item_lst = [_get_value_fingerprint(value=v, seen=seen) for v in value.items()]
+        if None in item_lst:
+            return None
+        return repr(item_lst)
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        return repr((value.dtype.str, value.shape, value.tobytes()))
+    elif isinstance(value, types.ModuleType):
+        return "module " + value.__name__
+    elif isinstance(value, (type, types.BuiltinFunctionType)):
+        return "{} {}".format(value.__module__, value.__qualname__)
+    elif isinstance(value, types.FunctionType):
+        if id(value.__code__) in seen:
+            return "recursive " + value.__qualname__
+        return _get_python_function_fingerprint(function=value, seen=seen)
+    else:
+        return None
+
+
+def _get_python_function_fingerprint(function, seen):
+    seen = seen | {id(function.__code__)}
+    dependency_lst = [
+        _get_value_fingerprint(value=function.__defaults__, seen=seen),
+        _get_value_fingerprint(value=function.__kwdefaults__, seen=seen),
+    ]
+    if function.__closure__ is not None:
+        for cell in function.__closure__:
+            try:
+                dependency_lst.append(
+                    _get_value_fingerprint(value=cell.cell_contents, seen=seen)
+                )
+            except ValueError:  # empty cell
+                dependency_lst.append("empty")
+    for name in sorted(_get_global_names(function.__code__)):
+        if name in function.__globals__:
+            dependency_lst.append(
+                _get_value_fingerprint(value=function.__globals__[name], seen=seen)
+            )
+    if None in dependency_lst:
+        return None
+    return _get_code_fingerprint(function.__code__) + repr(dependency_lst)
+
+
+def _get_function_hash(item):
+    """
+    Hash of a user defined table function, used to detect when a function was redefined. For python functions the
+    byte code, the constants and the default arguments of the function are considered together with the values of the
+    variables of its closure and the global variables it references, so the hash does not depend on the file or the
+    line the function was defined in.
+
+    Args:
+        item (str/function): function as string or python function
+
+    Returns:
+        str/None: sha256 hex digest, None if the function depends on values which can not be represented reliably, so
+                  the function has to be evaluated again on every update
+    """
+    if isinstance(item, str):
+        fingerprint = item
+    elif isinstance(item, types.FunctionType):
+        fingerprint = _get_python_function_fingerprint(function=item, seen=set())
+    else:
+        fingerprint = None
+    if fingerprint is None:
+        return None
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _get_wrapped_function(wrapper):
+    """
+    Get the python function the FunctionContainer wrapped in `lambda job: {key: item(job)}`, so the hash of a stored
+    function matches the hash computed when the function is added.
+
+    Args:
+        wrapper (function): function stored in the FunctionContainer
+
+    Returns:
+        function/None: wrapped python function, None for functions defined as string, which can not be recovered, so
+                       they are evaluated again on the next update
+    """
+    if wrapper.__closure__ is not None and "item" in wrapper.__code__.co_freevars:
+        item = wrapper.__closure__[wrapper.__code__.co_freevars.index("item")]
+        return item.cell_contents
+    return None
+
+
+def _get_job_file_name(db_entry):
+    project_path = db_entry["projectpath"]
+    if not isinstance(project_path, str):
+        project_path = ""
+    return project_path + db_entry["project"] + db_entry["subjob"].split("/")[1] + ".h5"
+
+
+def _get_job_mtime(db_entry):
+    """
+    Modification time of the HDF5 file of a job, used to detect jobs which changed since they were analysed.
+
+    Args:
+        db_entry (dict/pandas.Series): database entry of the job
+
+    Returns:
+        int/None: modification time in nanoseconds, None if the file does not exist
+    """
+    try:
+        return os.stat(_get_job_file_name(db_entry=db_entry)).st_mtime_ns
+    except (OSError, TypeError, IndexError):
+        return None
+
+
 def get_job_id(job):
     return {"job_id": job.job_id}
 
@@ -62,6 +213,7 @@ class FunctionContainer(object):
         if system_function_lst is None:
             system_function_lst = []
         self._user_function_dict = {}
+        self._user_function_hash_dict = {}
         self._system_function_lst = system_function_lst
         self._system_function_dict = {
             func.__name__: False for func in self._system_function_lst
@@ -79,6 +231,9 @@ class FunctionContainer(object):
 
     def _to_hdf(self, hdf):
         _to_pickle(hdf=hdf, key="user_function_dict", value=self._user_function_dict)
+        _to_pickle(
+            hdf=hdf, key="user_function_hash_dict", value=self._user_function_hash_dict
+        )
         _to_pickle(
             hdf=hdf, key="system_function_dict", value=self._system_function_dict
         )
@@ -86,6 +241,15 @@ class FunctionContainer(object):
     def _from_hdf(self, hdf):
         self._user_function_dict = _from_pickle(hdf=hdf, key="user_function_dict")
         self._system_function_dict = _from_pickle(hdf=hdf, key="system_function_dict")
+        if "user_function_hash_dict" in hdf.keys():
+            self._user_function_hash_dict = _from_pickle(
+                hdf=hdf, key="user_function_hash_dict"
+            )
+        else:  # tables stored before the function hashes were introduced
+            self._user_function_hash_dict = {
+                key: _get_function_hash(item=_get_wrapped_function(wrapper=item))
+                for key, item in self._user_function_dict.items()
+            }
 
     def __setitem__(self, key, item):
         if isinstance(item, str):
@@ -96,6 +260,7 @@ class FunctionContainer(object):
             self._user_function_dict[key] = lambda job: {key: item(job)}
         else:
             raise TypeError("unsupported function type!")
+        self._user_function_hash_dict[key] = _get_function_hash(item=item)
 
     def __getitem__(self, key):
         return self._user_function_dict[key]
@@ -115,6 +280,10 @@ class JobFilters(object):
     """
     Certain predefined job filters
 
+    The filters starting with `db_` operate on the job table and can be used as `db_filter_function`, so the jobs do
+    not have to be loaded to filter them. The other filters operate on the job objects and can be used as
+    `filter_function`.
+
     """
 
     @staticmethod
@@ -131,6 +300,20 @@ class JobFilters(object):
 
         return filter_job_name_segment
 
+    @staticmethod
+    def db_job_type(job_type):
+        def filter_db_job_type(job_table):
+            return job_table.hamilton == job_type
+
+        return filter_db_job_type
+
+    @staticmethod
+    def db_job_name_contains(job_name_segment):
+        def filter_db_job_name_segment(job_table):
+            return job_table.job.str.contains(job_name_segment, regex=False)
+
+        return filter_db_job_name_segment
+
 
 class PyironTable:
     """
@@ -140,14 +323,23 @@ class PyironTable:
         project (pyiron.project.Project/None): The project to analyze
         name (str): Name of the pyiron table
         system_function_lst (list/ None): List of built-in functions
+        csv_file_name (str/ None): Name of the csv file the table was stored in by previous versions
+        batch_size (int): Number of jobs which are analysed before the intermediate table is stored
     """
 
     def __init__(
-        self, project, name=None, system_function_lst=None, csv_file_name=None
+        self,
+        project,
+        name=None,
+        system_function_lst=None,
+        csv_file_name=None,
+        batch_size=1000,
     ):
         self._project = project
         self._df = pandas.DataFrame({})
+        self._job_mtime_cache = {}
         self.convert_to_object = False
+        self.batch_size = batch_size
         self._name = name
         self._db_filter_function = always_true_pandas
         self._filter_function = always_true
@@ -206,6 +398,10 @@ class PyironTable:
         """
         Function to filter each job before more expensive functions are applied
 
+        Each job which passes the :attr:`.db_filter_function` and has a matching status has to be loaded to apply this
+        function, so for large projects filters which only depend on columns of the job table should be defined as
+        :attr:`.db_filter_function` instead. Without a job level filter the jobs are not loaded at all.
+
         Example:
 
         >>> def job_filter_function(job):
@@ -240,35 +436,107 @@ class PyironTable:
             new_system_functions = []
         return new_user_functions, new_system_functions
 
-    def create_table(self, file, job_status_list, executor=None, enforce_update=False):
+    def _get_changed_functions(self, file: FileHDFio) -> List:
+        """
+        Get the user functions which were redefined since the table was stored, by comparing the hashes of the
+        functions. Functions which were not stored before are new rather than changed, functions whose hash is None
+        can not be compared and are always considered changed.
+
+        Args:
+            file (FileHDFio): HDF were the previous state of the table is stored
+
+        Returns:
+            list: keys of the changed user functions
+        """
+        try:
+            stored_hash_dict = _from_pickle(hdf=file, key="user_function_hash_dict")
+        except (IndexError, ValueError, TypeError):
+            return []
+        return [
+            key
+            for key, function_hash in self.add._user_function_hash_dict.items()
+            if key in stored_hash_dict
+            and (function_hash is None or stored_hash_dict[key] != function_hash)
+        ]
+
+    def _remove_modified_jobs(self, project_table):
+        """
+        Remove the rows of all jobs whose HDF5 file was modified since they were analysed, so they are analysed again
+        like new jobs.
+
+        Args:
+            project_table (pandas.DataFrame): job table of the analysed project
+        """
+        if len(self._job_mtime_cache) == 0 or len(self._df) == 0:
+            return
+        stored_table = project_table[
+            project_table["id"].isin(list(self._job_mtime_cache.keys()))
+            & project_table["id"].isin(self._get_job_ids())
+        ]
+        modified_job_ids = [
+            db_entry["id"]
+            for _, db_entry in stored_table.iterrows()
+            if _get_job_mtime(db_entry=db_entry)
+            != self._job_mtime_cache[db_entry["id"]]
+        ]
+        if len(modified_job_ids) > 0:
+            for job_id in modified_job_ids:
+                del self._job_mtime_cache[job_id]
+            self._df = self._df[~self._df.job_id.isin(modified_job_ids)].reset_index(
+                drop=True
+            )
+
+    def create_table(
+        self,
+        file,
+        job_status_list,
+        executor=None,
+        enforce_update=False,
+        checkpoint=None,
+        max_workers=None,
+    ):
         """
         Create or update the table.
 
-        If this method has been called before and there are new functions added to :attr:`.add`, apply them on the
-        previously analyzed jobs.
+        If this method has been called before and there are new functions added to :attr:`.add` or functions were
+        redefined, apply them on the previously analyzed jobs.
+        If this method has been called before and the HDF5 file of a previously analyzed job was modified since, apply
+        all functions to it again.
         If this method has been called before and there are new jobs added to :attr:`.analysis_project`, apply all
         functions to them.
 
+        New jobs are analysed in batches of :attr:`.batch_size` jobs and after each batch the `checkpoint` function is
+        called, so a table which is interrupted can continue with the remaining jobs.
+
         The result is available via :meth:`.get_dataframe`.
 
         .. warning::
-            The executor, if given, must not naively pickle the mapped functions or
-            arguments, as PyironTable relies on lambda functions internally.  Use
-            with executors that rely on dill or cloudpickle instead.  Pyiron
-            provides such executors in the `pympipool` sub packages.
+            The executor, if given, has to pickle the job entries and the pickled functions, the functions are passed
+            as cloudpickle bytes, so the :class:`concurrent.futures.ProcessPoolExecutor` can be used as well as the
+            executors provided by `pympipool`.
 
         Args:
             file (FileHDFio): HDF were the previous state of the table is stored
             job_status_list (list of str): only consider jobs with these statuses
             executor (concurrent.futures.Executor): executor for parallel execution
             enforce_update (bool): if True always regenerate the table completely.
+            checkpoint (function/None): function without arguments called after each batch of new jobs
+            max_workers (int/None): number of workers of the executor, used to split the jobs into tasks - by default
+                                    the number of workers of the executor if available, otherwise the number of cores
         """
         # if there's new keys, apply the *new* functions to the old jobs and name the resulting table `df_new_keys`
         # if there's new jobs, apply *all* functions to them and name the resulting table `df_new_ids`
+        project_table = self._project.job_table(recursive=True)
 
         # if enforce_update is given we recalculate the whole table below anyway, no need to patch up new keys
         if not enforce_update:
+            self._remove_modified_jobs(project_table=project_table)
             new_user_functions, new_system_functions = self._get_new_functions(file)
+            new_user_functions += [
+                key
+                for key in self._get_changed_functions(file)
+                if key not in new_user_functions
+            ]
 
             if len(new_user_functions) > 0 or len(new_system_functions) > 0:
                 function_lst = [
@@ -282,22 +550,46 @@ class PyironTable:
                     job_id_lst=self._get_job_ids(),
                     function_lst=function_lst,
                     executor=executor,
+                    max_workers=max_workers,
                 )
                 if len(df_new_keys) > 0:
-                    self._df = pandas.concat([self._df, df_new_keys], axis="columns")
+                    self._df = pandas.concat(
+                        [
+                            self._df.drop(
+                                columns=[
+                                    c for c in df_new_keys.columns if c in self._df
+                                ]
+                            ),
+                            df_new_keys,
+                        ],
+                        axis="columns",
+                    )
 
         new_jobs = self._collect_job_update_lst(
             job_status_list=job_status_list,
             job_stored_ids=self._get_job_ids() if not enforce_update else None,
+            project_table=project_table,
         )
         if len(new_jobs) > 0:
-            df_new_ids = self._iterate_over_job_lst(
-                job_id_lst=new_jobs,
-                function_lst=self.add._function_lst,
-                executor=executor,
-            )
-            if len(df_new_ids) > 0:
-                self._df = pandas.concat([self._df, df_new_ids], ignore_index=True)
+            with tqdm(total=len(new_jobs)) as progress_bar:
+                for batch_start in range(0, len(new_jobs), self.batch_size):
+                    df_new_ids = self._iterate_over_job_lst(
+                        job_id_lst=new_jobs[
+                            batch_start : batch_start + self.batch_size
+                        ],
+                        function_lst=self.add._function_lst,
+                        executor=executor,
+                        progress_bar=progress_bar,
+                        max_workers=max_workers,
+                    )
+                    if len(df_new_ids) > 0:
+                        self._df = pandas.concat(
+                            [self._df, df_new_ids], ignore_index=True
+                        )
+                    if checkpoint is not None and batch_start + self.batch_size < len(
+                        new_jobs
+                    ):
+                        checkpoint()
 
     def get_dataframe(self):
         return self._df
@@ -345,8 +637,13 @@ class PyironTable:
         else:
             return np.array([])
 
-    def _get_filtered_job_ids_from_project(self, recursive=True):
-        project_table = self._project.job_table(recursive=recursive)
+    def _get_filtered_job_ids_from_project(
+        self, recursive=True, project_table=None, job_status_list=None
+    ):
+        if project_table is None:
+            project_table = self._project.job_table(recursive=recursive)
+        if job_status_list is not None:
+            project_table = project_table[project_table.status.isin(job_status_list)]
         filter_funct = self.db_filter_function
         return project_table[filter_funct(project_table)]["id"].tolist()
 
@@ -355,6 +652,8 @@ class PyironTable:
         job_id_lst: List,
         function_lst: List,
         executor: concurrent.futures.Executor = None,
+        progress_bar: tqdm = None,
+        max_workers: int = None,
     ) -> List[dict]:
         """
         Apply functions to job.
@@ -365,32 +664,57 @@ class PyironTable:
             job_id_lst (list of int): all job ids to analyze
             function_lst (list of functions): all functions to apply on jobs. Must return a dictionary.
             executor (concurrent.futures.Executor): executor for parallel execution
+            progress_bar (tqdm/None): progress bar to update, by default a new progress bar is created
+            max_workers (int/None): number of workers of the executor
 
         Returns:
             list of dict: a list of the merged dicts from all functions for each job
         """
-        job_to_analyse_lst = [
-            [
-                self._project.db.get_item_by_id(job_id),
-                function_lst,
-                self.convert_to_object,
-            ]
-            for job_id in job_id_lst
-        ]
+        db_entry_lst = []
+        for job_id in job_id_lst:
+            db_entry = self._project.db.get_item_by_id(job_id)
+            self._job_mtime_cache[job_id] = _get_job_mtime(db_entry=db_entry)
+            db_entry_lst.append(db_entry)
         if executor is not None:
-            diff_dict_lst = list(
-                tqdm(
-                    executor.map(_apply_list_of_functions_on_job, job_to_analyse_lst),
-                    total=len(job_to_analyse_lst),
-                )
+            # the jobs are sent to the executor in shards, so the pickled functions are transferred once per shard
+            # rather than once per job
+            function_bytes = cloudpickle.dumps(function_lst)
+            if max_workers is None:
+                max_workers = getattr(executor, "_max_workers", None)
+            shard_size = _get_shard_size(
+                job_number=len(db_entry_lst), max_workers=max_workers
+            )
+            diff_dict_iter = executor.map(
+                _apply_list_of_functions_on_job_lst,
+                [
+                    [
+                        db_entry_lst[shard_start : shard_start + shard_size],
+                        function_bytes,
+                        self.convert_to_object,
+                    ]
+                    for shard_start in range(0, len(db_entry_lst), shard_size)
+                ],
             )
         else:
-            diff_dict_lst = list(
-                tqdm(
-                    map(_apply_list_of_functions_on_job, job_to_analyse_lst),
-                    total=len(job_to_analyse_lst),
-                )
+            diff_dict_iter = (
+                [
+                    _apply_list_of_functions_on_job(
+                        [db_entry, function_lst, self.convert_to_object]
+                    )
+                ]
+                for db_entry in db_entry_lst
             )
+        if progress_bar is None:
+            progress_bar = tqdm(total=len(db_entry_lst))
+            close_progress_bar = True
+        else:
+            close_progress_bar = False
+        diff_dict_lst = []
+        for diff_dict_shard in diff_dict_iter:
+            diff_dict_lst += diff_dict_shard
+            progress_bar.update(len(diff_dict_shard))
+        if close_progress_bar:
+            progress_bar.close()
         self.refill_dict(diff_dict_lst)
         return pandas.DataFrame(diff_dict_lst)
 
@@ -417,7 +741,9 @@ class PyironTable:
                 if key not in sub_dict.keys():
                     sub_dict[key] = None
 
-    def _collect_job_update_lst(self, job_status_list, job_stored_ids=None):
+    def _collect_job_update_lst(
+        self, job_status_list, job_stored_ids=None, project_table=None
+    ):
         """
         Collect jobs to update the pyiron table.
 
@@ -426,18 +752,22 @@ class PyironTable:
         Args:
             job_status_list (list): List of job status to consider
             job_stored_ids (list/ None): List of already analysed job ids
+            project_table (pandas.DataFrame/ None): job table of the analysed project, queried if not given
 
         Returns:
             list: List of JobCore objects
         """
+        job_id_lst = self._get_filtered_job_ids_from_project(
+            project_table=project_table, job_status_list=job_status_list
+        )
         if job_stored_ids is not None:
+            job_stored_ids = set(job_stored_ids)
             job_id_lst = [
-                job_id
-                for job_id in self._get_filtered_job_ids_from_project()
-                if job_id not in job_stored_ids
+                job_id for job_id in job_id_lst if job_id not in job_stored_ids
             ]
-        else:
-            job_id_lst = self._get_filtered_job_ids_from_project()
+        # without a job level filter there is no need to load the jobs
+        if self.filter_function is None or self.filter_function is always_true:
+            return job_id_lst
 
         job_update_lst = []
         for job_id in tqdm(job_id_lst, desc="Loading and filtering jobs"):
@@ -447,11 +777,7 @@ class PyironTable:
                 IndexError
             ):  # In case the job was deleted while the pyiron table is running
                 job = None
-            if (
-                job is not None
-                and job.status in job_status_list
-                and self.filter_function(job)
-            ):
+            if job is not None and self.filter_function(job):
                 job_update_lst.append(job_id)
         return job_update_lst
 
@@ -506,6 +832,17 @@ class TableJob(GenericJob):
 
     >>> table.filter_function = job_filter_function
 
+    To analyse the jobs in parallel, set the number of cores. By default the `pympipool.Executor` is used if it is
+    installed and the :class:`concurrent.futures.ProcessPoolExecutor` otherwise, other executors can be selected with
+    :attr:`executor_type`.
+
+    >>> table.server.cores = 8
+
+    New jobs are analysed in batches of :attr:`batch_size` jobs and the intermediate table is stored after each batch,
+    so when the analysis is interrupted, calling :meth:`update_table` continues with the remaining jobs. The table also
+    records the modification time of the HDF5 file of each analysed job and the hash of each function, so
+    :meth:`update_table` only re-evaluates jobs which were modified and functions which were redefined.
+
     """
 
     _system_function_lst = [get_job_id]
@@ -576,6 +913,19 @@ class TableJob(GenericJob):
                 )
         self._job_status = status
 
+    @property
+    def batch_size(self):
+        """
+        int: number of jobs which are analysed before the intermediate table is stored
+        """
+        return self._pyiron_table.batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size):
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("The batch_size has to be a positive integer.")
+        self._pyiron_table.batch_size = batch_size
+
     @property
     def pyiron_table(self):
         return self._pyiron_table
@@ -605,6 +955,7 @@ class TableJob(GenericJob):
             project=self._analysis_project,
             system_function_lst=self._system_function_lst,
             csv_file_name=os.path.join(self.working_directory, "pyirontable.csv"),
+            batch_size=self._pyiron_table.batch_size,
         )
 
     @property
@@ -653,9 +1004,19 @@ class TableJob(GenericJob):
 
     def _save_output(self):
         with self.project_hdf5.open("output") as hdf5_output:
+            hdf_file_pool.release(hdf5_output.file_name)
             self.pyiron_table._df.to_hdf(
                 hdf5_output.file_name, key=hdf5_output.h5_path + "/table"
             )
+            job_mtime_dict = {
+                job_id: mtime
+                for job_id, mtime in self.pyiron_table._job_mtime_cache.items()
+                if mtime is not None
+            }
+            if len(job_mtime_dict) > 0:
+                pandas.Series(job_mtime_dict, dtype=np.int64).to_hdf(
+                    hdf5_output.file_name, key=hdf5_output.h5_path + "/job_mtime"
+                )
 
     def to_dict(self):
         job_dict = super().to_dict()
@@ -663,6 +1024,7 @@ class TableJob(GenericJob):
             "enforce_update": self._enforce_update,
             "convert_to_object": self._pyiron_table.convert_to_object,
         }
+        job_dict["input/batch_size"] = self._pyiron_table.batch_size
         if self._analysis_project is not None:
             job_dict["input/project"] = {
                 "path": self._analysis_project.path,
@@ -711,6 +1073,8 @@ class TableJob(GenericJob):
         bool_dict = job_dict["input"]["bool_dict"]
         self._enforce_update = bool_dict["enforce_update"]
         self._pyiron_table.convert_to_object = bool_dict["convert_to_object"]
+        if "batch_size" in job_dict["input"].keys():
+            self._pyiron_table.batch_size = int(job_dict["input"]["batch_size"])
         self._pyiron_table.add._from_hdf(job_dict["input"])
 
     def to_hdf(self, hdf=None, group_name=None):
@@ -742,6 +1106,13 @@ class TableJob(GenericJob):
                     self._pyiron_table._df = pandas.read_hdf(
                         hdf5_output.file_name, hdf5_output.h5_path + "/table"
                     )
+                if "job_mtime" in hdf5_output.list_groups():
+                    self._pyiron_table._job_mtime_cache = {
+                        int(job_id): int(mtime)
+                        for job_id, mtime in pandas.read_hdf(
+                            hdf5_output.file_name, hdf5_output.h5_path + "/job_mtime"
+                        ).items()
+                    }
         else:
             pyiron_table = os.path.join(self.working_directory, "pyirontable.csv")
             if os.path.exists(pyiron_table):
@@ -772,8 +1143,9 @@ class TableJob(GenericJob):
         """
         Update the pyiron table object, add new columns if a new function was added or add new rows for new jobs.
 
-        By default this function does not recompute already evaluated functions on already existing jobs.  To force a
-        complete re-evaluation set :attr:`~.enforce_update` to `True`.
+        By default this function only recomputes already evaluated functions on already existing jobs, when the
+        function was redefined or the HDF5 file of the job was modified.  To force a complete re-evaluation set
+        :attr:`~.enforce_update` to `True`.
 
         Args:
             job_status_list (list/None): List of job status which are added to the table by default ["finished"].
@@ -785,7 +1157,10 @@ class TableJob(GenericJob):
             self.project.db.item_update({"timestart": datetime.now()}, self.job_id)
         with self.project_hdf5.open("input") as hdf5_input:
             if self._executor_type is None and self.server.cores > 1:
-                self._executor_type = "pympipool.Executor"
+                if importlib.util.find_spec("pympipool") is not None:
+                    self._executor_type = "pympipool.Executor"
+                else:
+                    self._executor_type = "concurrent.futures.ProcessPoolExecutor"
             if self._executor_type is not None:
                 with self._get_executor(max_workers=self.server.cores) as exe:
                     self._pyiron_table.create_table(
@@ -793,6 +1168,8 @@ class TableJob(GenericJob):
                         job_status_list=job_status_list,
                         enforce_update=self._enforce_update,
                         executor=exe,
+                        checkpoint=self._save_output,
+                        max_workers=self.server.cores,
                     )
             else:
                 self._pyiron_table.create_table(
@@ -800,6 +1177,7 @@ class TableJob(GenericJob):
                     job_status_list=job_status_list,
                     enforce_update=self._enforce_update,
                     executor=None,
+                    checkpoint=self._save_output,
                 )
         self.to_hdf()
         self._pyiron_table._df.to_csv(
@@ -851,10 +1229,42 @@ def _apply_function_on_job(funct, job):
         return {}
 
 
+@lru_cache(maxsize=1)
+def _load_function_lst(function_bytes):
+    return cloudpickle.loads(function_bytes)
+
+
+def _get_shard_size(job_number, max_workers=None, max_shard_size=100):
+    """
+    Number of jobs which are analysed in a single task of the executor, aiming for a few tasks per worker to balance
+    the load while transferring the pickled functions as rarely as possible.
+
+    Args:
+        job_number (int): number of jobs to analyse
+        max_workers (int/None): number of workers of the executor - by default the number of cores
+        max_shard_size (int): upper limit for the number of jobs per task
+
+    Returns:
+        int: number of jobs per task
+    """
+    task_number = 4 * (max_workers or os.cpu_count() or 1)
+    return max(1, min(max_shard_size, -(-job_number // task_number)))
+
+
+def _apply_list_of_functions_on_job_lst(input_parameters):
+    db_entry_lst, function_lst, convert_to_object = input_parameters
+    return [
+        _apply_list_of_functions_on_job([db_entry, function_lst, convert_to_object])
+        for db_entry in db_entry_lst
+    ]
+
+
 def _apply_list_of_functions_on_job(input_parameters):
     from pyiron_base.jobs.job.path import JobPath
 
     db_entry, function_lst, convert_to_object = input_parameters
+    if isinstance(function_lst, bytes):
+        function_lst = _load_function_lst(function_bytes=function_lst)
     job = JobPath.from_db_entry(db_entry)
     if convert_to_object:
         job = job.to_object()
@@ -32,6 +32,7 @@ from pyiron_base.jobs.job.util import (
     _job_delete_hdf,
     _job_remove_folder,
 )
+from pyiron_base.project.size import invalidate_job_size
 from pyiron_base.state import state
 from pyiron_base.utils.deprecate import deprecate
 from pyiron_base.jobs.job.extension.files import FileBrowser
@@ -575,13 +576,15 @@ class JobCore(HasGroups):
         # Delete database entry
         if self.job_id is not None:
             self.project.db.delete_item(self.job_id)
+        invalidate_job_size(job=self)
 
-    def to_object(self, object_type=None, **qwargs):
+    def to_object(self, object_type=None, lazy=False, **qwargs):
         """
         Load the full pyiron object from an HDF5 file
 
         Args:
             object_type: if the 'TYPE' node is not available in the HDF5 file a manual object type can be set - optional
+            lazy (bool): only read the input, output, server and executable when they are accessed - default=False
             **qwargs: optional parameters ['job_name', 'project'] - to specify the location of the HDF5 path
 
         Returns:
@@ -593,6 +596,8 @@ class JobCore(HasGroups):
                 + self.job_name
                 + '" is empty, so it can not be loaded.'
             )
+        if lazy:
+            qwargs["lazy"] = True
         return self.project_hdf5.to_object(object_type, **qwargs)
 
     def get(self, name, default=None):
@@ -616,6 +621,30 @@ class JobCore(HasGroups):
                 return default
             raise
 
+    def get_many(self, names):
+        """
+        Get/read multiple values of the job at once, see :meth:`__getitem__`.
+
+        All datasets stored directly in the HDF5 file of the job are read with a single file open, only the remaining
+        items like HDF5 groups, data containers, files in the working directory or child jobs are resolved one by one.
+
+        Args:
+            names (list): paths to the data or keys of the data objects
+
+        Returns:
+            dict: dictionary with the names as keys and the corresponding data or data objects as values, if nothing
+                  is found for a given name the value is None
+        """
+        values = self._hdf5.read_many(keys=names, fallback=False)
+        return {
+            name: (
+                values[name]
+                if name in values and not isinstance(values[name], ProjectHDFio)
+                else self.__getitem__(name)
+            )
+            for name in names
+        }
+
     def load(self, job_specifier, convert_to_object=True):
         """
         Load an existing pyiron object - most commonly a job - from the database
@@ -1071,12 +1100,14 @@ class JobCore(HasGroups):
         childs = self.list_childs()
         return list(set(childs) - set(nodes))
 
-    def compress(self, files_to_compress=None, files_to_remove=None):
+    def compress(self, files_to_compress=None, files_to_remove=None, max_workers=None):
         """
         Compress the output files of a job object.
 
         Args:
             files_to_compress (list):
+            files_to_remove (list):
+            max_workers (int): number of compression threads, defaults to the number of CPU cores
         """
         if files_to_compress is None and len(self._files_to_compress) != 0:
             files_to_compress = self._files_to_compress
@@ -1090,6 +1121,7 @@ class JobCore(HasGroups):
             job=self,
             files_to_compress=files_to_compress,
             files_to_remove=files_to_remove,
+            max_workers=max_workers,
         )
 
     def decompress(self):
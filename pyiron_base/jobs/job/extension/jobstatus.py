@@ -5,6 +5,10 @@
 The JobStatus class belongs to the GenericJob object.
 """
 
+import time
+
+from pyiron_base.database.interface import IsDatabase
+from pyiron_base.state import state
 from pyiron_base.utils.instance import static_isinstance
 
 __author__ = "Jan Janssen"
@@ -72,6 +76,10 @@ class JobStatus(object):
     """
     The JobStatus object handles the different states a job could have. The available states are: {}
 
+    The status is kept locally and only read from the database again once the job_status_refresh_interval defined in
+    the settings passed or when the status of any job was changed by the current process. refresh_status() reads the
+    status from the database immediately. Writing the status is a single conditional update of the database.
+
     Args:
         initial_status (str): If no initial status is provided the status is set to 'initialized'
         db (DatabaseAccess): The database which is responsible for this job.
@@ -96,6 +104,9 @@ class JobStatus(object):
         super(JobStatus, self).__setattr__("_status_dict", {})
         self._db = None
         self._job_id = None
+        self._refresh_time = None
+        self._refresh_count = None
+        self._future = None
         self.string = initial_status
         self.database = db
         self.job_id = job_id
@@ -154,7 +165,7 @@ class JobStatus(object):
             (str): status [initialized, appended, created, submitted, running, aborted, collect, suspended, refresh,
                    busy, finished, warning]
         """
-        self.refresh_status()
+        self._refresh_status_if_outdated()
         return self._get_status_from_dict()
 
     @format_docstring_with_statuses(n_tabs=2)
@@ -194,15 +205,85 @@ class JobStatus(object):
                 ) from None
             self._reset()
             self._status_dict[status] = True
+            self._mark_refreshed()
+
+    def expire(self):
+        """
+        Read the job status from the database on the next access, independent of the refresh interval. This is used
+        when the status was changed by another process.
+        """
+        self._refresh_time = None
+
+    def expire_when_done(self, future):
+        """
+        Read the job status from the database on the first access after the future is done, independent of the
+        refresh interval. This is used for jobs executed by another process.
+
+        Args:
+            future (concurrent.futures.Future): future of the job execution
+        """
+        self._future = future
+
+    @staticmethod
+    def refresh_status_lst(status_lst):
+        """
+        Refresh multiple job status objects with a single query per database, job status objects without database or
+        job ID and finished jobs are skipped like in refresh_status().
+
+        Args:
+            status_lst (list): list of JobStatus objects
+        """
+        status_dict = {}
+        for status in status_lst:
+            if (
+                status.database
+                and status.job_id
+                and not any([status._status_dict[i] for i in job_status_finished_lst])
+            ):
+                status_dict.setdefault(id(status.database), []).append(status)
+        for database_status_lst in status_dict.values():
+            job_status_dict = database_status_lst[0].database.get_job_status_dict(
+                job_id_lst=[status.job_id for status in database_status_lst]
+            )
+            for status in database_status_lst:
+                if status.job_id not in job_status_dict:
+                    raise ValueError(
+                        f"The job with ID {status.job_id} is not listed in the database anymore."
+                    )
+                status._reset()
+                status._status_dict[job_status_dict[status.job_id]] = True
+                status._mark_refreshed()
+
+    def _refresh_status_if_outdated(self):
+        """
+        Private function: Refresh the job status when the refresh interval passed or a job status was changed by the
+        current process since the last refresh.
+        """
+        if self._future is not None and self._future.done():
+            self._future = None
+            self._refresh_time = None
+        if (
+            self._refresh_time is None
+            or self._refresh_count != IsDatabase.get_status_write_count()
+            or time.monotonic() - self._refresh_time
+            >= state.settings.configuration["job_status_refresh_interval"]
+        ):
+            self.refresh_status()
+
+    def _mark_refreshed(self):
+        self._refresh_time = time.monotonic()
+        self._refresh_count = IsDatabase.get_status_write_count()
 
     def _status_write(self):
         """
-        Private function: Write the job status to the internal variable _key and store it in the database.
+        Private function: Write the job status to the internal variable _key and store it in the database, the
+        database is only updated if its status differs.
         """
         if self.database and self.job_id:
-            current_status = str(self._get_status_from_dict())
-            if self.database.get_job_status(job_id=self.job_id) != current_status:
-                self.database.set_job_status(job_id=self.job_id, status=current_status)
+            self.database.update_job_status(
+                job_id=self.job_id, status=str(self._get_status_from_dict())
+            )
+            self._mark_refreshed()
 
     def _reset(self):
         """
@@ -245,7 +326,7 @@ class JobStatus(object):
 
     def __getattr__(self, name):
         if name in self._status_dict.keys():
-            self.refresh_status()
+            self._refresh_status_if_outdated()
             return self._status_dict[name]
         raise AttributeError(
             "'{}' object has no attribute '{}'".format(self.__class__.__name__, name)
@@ -5,7 +5,7 @@
 Set of functions to interact with the queuing system directly from within pyiron - optimized for the Sun grid engine.
 """
 
-from concurrent.futures import Future
+from concurrent.futures import Future, wait
 import pandas
 import time
 import numpy as np
@@ -226,6 +226,9 @@ def wait_for_job(job, interval_in_s=5, max_iterations=100):
                     job.project.db.update()
                 job.refresh_job_status()
                 if job.status.string in job_status_finished_lst:
+                    if isinstance(job.server.future, Future):
+                        # the status is written by the executor process before the future is resolved
+                        wait([job.server.future], timeout=interval_in_s)
                     finished = True
                     break
                 elif isinstance(job.server.future, Future):
@@ -17,6 +17,8 @@ from h5io_browser.base import _read_hdf, _write_hdf
 
 from pyiron_base.state import state
 from pyiron_base.state.signal import catch_signals
+from pyiron_base.storage.hdfpool import hdf_file_pool
+from pyiron_base.project.size import invalidate_job_size
 from pyiron_base.jobs.job.core import (
     JobCore,
     _doc_str_job_core_args,
@@ -122,6 +124,10 @@ class GenericJob(JobCore, HasDict):
 
     Sub classes that need to add special behavior after :method:`.copy_to()` can override
     :method:`._after_generic_copy_to()`.
+
+    Jobs loaded with `lazy=True`, e.g. `project.load(job_name, lazy=True)`, only read the server, the executable and
+    the generic input from the HDF5 file when one of them is accessed for the first time. This is only supported for
+    job classes which do not override :meth:`.from_dict()`, all other job classes are loaded completely.
 """
         + "\n"
         + _doc_str_job_core_args
@@ -129,8 +135,23 @@ class GenericJob(JobCore, HasDict):
         + _doc_str_generic_job_attr
     )
 
+    # attributes which are set in from_dict() and are only read from HDF5 on first access for jobs loaded lazily
+    _lazy_attributes = (
+        "_server",
+        "_executable",
+        "_import_directory",
+        "_restart_file_list",
+        "_restart_file_dict",
+        "_exclude_nodes_hdf",
+        "_exclude_groups_hdf",
+        "_executor_type",
+    )
+
     def __init__(self, project, job_name):
         super(GenericJob, self).__init__(project, job_name)
+        self._lazy_load = False
+        self._lazy_hdf = None
+        self._lazy_read_only = False
         self.__name__ = type(self).__name__
         self.__version__ = "0.4"
         self.__hdf_version__ = "0.1.0"
@@ -473,11 +494,10 @@ class GenericJob(JobCore, HasDict):
         Refresh job status by updating the job status with the status from the database if a job ID is available.
         """
         if self.job_id:
-            self._status = JobStatus(
-                initial_status=self.project.db.get_job_status(self.job_id),
-                db=self.project.db,
-                job_id=self.job_id,
-            )
+            # the status is read from the database when the job ID is set
+            self._status = JobStatus(db=self.project.db, job_id=self.job_id)
+            if isinstance(self.server.future, Future):
+                self._status.expire_when_done(future=self.server.future)
         elif state.database.database_is_disabled:
             self._status = JobStatus(
                 initial_status=_read_hdf(
@@ -877,7 +897,7 @@ class GenericJob(JobCore, HasDict):
                         "parentid": None,
                     }
                 )
-            _ = [self.project.db.add_item_dict(d) for d in db_dict_lst]
+            self.project.db.add_items_dicts(db_dict_lst)
         self.status.string = self.project_hdf5["status"]
         if self.master_id is not None:
             self._reload_update_master(project=self.project, master_id=self.master_id)
@@ -1140,6 +1160,18 @@ class GenericJob(JobCore, HasDict):
             group_name (str): HDF5 subgroup name - optional
         """
         self._set_hdf(hdf=hdf, group_name=group_name)
+        if self._lazy_load and type(self).from_dict is GenericJob.from_dict:
+            # the attributes are removed, so the first access is redirected to __getattr__() which reads them
+            for key in self._lazy_attributes:
+                self.__dict__.pop(key, None)
+            self._lazy_hdf = self._hdf5.copy()
+            return
+        self._from_hdf_job_dict()
+
+    def _from_hdf_job_dict(self):
+        """
+        Read the job dictionary from the HDF5 file and restore the job from it.
+        """
         job_dict = self._hdf5.read_dict_from_hdf()
         with self._hdf5.open("input") as hdf5_input:
             job_dict["input"] = hdf5_input.read_dict_from_hdf(recursive=True)
@@ -1150,6 +1182,38 @@ class GenericJob(JobCore, HasDict):
             job_dict["executable"] = {"executable": exe_dict}
         self.from_dict(job_dict=job_dict)
 
+    def _load_lazy_attributes(self):
+        """
+        Read the attributes of a lazily loaded job from the HDF5 file.
+        """
+        hdf, self._lazy_hdf = self._lazy_hdf, None
+        self._server = Server()
+        self._executable = None
+        self._import_directory = None
+        self._restart_file_list = list()
+        self._restart_file_dict = dict()
+        self._exclude_nodes_hdf = list()
+        self._exclude_groups_hdf = list()
+        self._executor_type = None
+        current_hdf, self._hdf5 = self._hdf5, hdf
+        try:
+            self._from_hdf_job_dict()
+        finally:
+            self._hdf5 = current_hdf
+        if self._lazy_read_only:
+            self._server.lock()
+
+    def __getattr__(self, name):
+        if (
+            name in GenericJob._lazy_attributes
+            and self.__dict__.get("_lazy_hdf") is not None
+        ):
+            self._load_lazy_attributes()
+            return self.__dict__[name]
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
+
     def save(self):
         """
         Save the object, by writing the content to the HDF5 file and storing an entry in the database.
@@ -1158,18 +1222,39 @@ class GenericJob(JobCore, HasDict):
             (int): Job ID stored in the database
         """
         self.to_hdf()
+        invalidate_job_size(job=self)
         if not state.database.database_is_disabled:
             job_id = self.project.db.add_item_dict(self.db_entry())
-            self._job_id = job_id
-            _write_hdf(
-                hdf_filehandle=self.project_hdf5.file_name,
-                data=job_id,
-                h5_path=self.job_name + "/job_id",
-                overwrite="update",
-            )
-            self.refresh_job_status()
+            self._store_job_id(job_id=job_id)
         else:
             job_id = self.job_name
+        self._finish_save(job_id=job_id)
+        return job_id
+
+    def _store_job_id(self, job_id):
+        """
+        Assign the job ID received from the database to the job and store it in the HDF5 file.
+
+        Args:
+            job_id (int): Job ID stored in the database
+        """
+        self._job_id = job_id
+        hdf_file_pool.release(self.project_hdf5.file_name)
+        _write_hdf(
+            hdf_filehandle=self.project_hdf5.file_name,
+            data=job_id,
+            h5_path=self.job_name + "/job_id",
+            overwrite="update",
+        )
+        self.refresh_job_status()
+
+    def _finish_save(self, job_id):
+        """
+        Write the input files of a job after it was saved.
+
+        Args:
+            job_id (int/str): Job ID stored in the database or the job name if the database is disabled
+        """
         if self._check_if_input_should_be_written():
             self.project_hdf5.create_working_directory()
             self.write_input()
@@ -1182,7 +1267,6 @@ class GenericJob(JobCore, HasDict):
             + " was saved and received the ID: "
             + str(job_id)
         )
-        return job_id
 
     def convergence_check(self):
         """
@@ -1339,7 +1423,11 @@ class GenericJob(JobCore, HasDict):
         This function enforces read-only mode for the input classes, but it has to be implemented in the individual
         classes.
         """
-        self.server.lock()
+        if self._lazy_hdf is not None:
+            # the server is locked once it is read from the HDF5 file
+            self._lazy_read_only = True
+        else:
+            self.server.lock()
 
     def _run_if_busy(self):
         """
@@ -1428,6 +1516,7 @@ class GenericJob(JobCore, HasDict):
         """
         Internal helper function to store the run_time in the database
         """
+        invalidate_job_size(job=self)
         if not state.database.database_is_disabled and self.job_id is not None:
             self.project.db.item_update(self._runtime(), self.job_id)
 
@@ -5,9 +5,15 @@
 InteractiveBase class extends the Generic Job class with all the functionality to run the job object interactivley.
 """
 
+import posixpath
+from queue import Queue
+from threading import Thread
+import h5py
+from h5io_browser.base import _open_hdf
 import numpy as np
 from pyiron_base.database.filetable import FileTable
 from pyiron_base.jobs.job.generic import GenericJob
+from pyiron_base.storage.hdfpool import hdf_file_pool
 
 __author__ = "Osamu Waseda, Jan Janssen"
 __copyright__ = (
@@ -21,6 +27,206 @@ __status__ = "production"
 __date__ = "Sep 1, 2018"
 
 
+class InteractiveCacheBuffer:
+    """
+    Buffer for the values of a single quantity in the interactive cache. The values are stored in a preallocated numpy
+    array, which is created with the shape and the dtype of the first value and doubles its size when it is full, so
+    storing a step is a single array assignment. Only every write_frequency-th step is stored, the last step is kept
+    separately, so it can be included when the buffer is flushed. Values which do not fit into a numerical array, like
+    strings or arrays with changing shapes, are stored in a python list instead.
+
+    The buffer behaves like the list used previously: append() adds a step, len() returns the number of steps added
+    and index -1 returns the last step added.
+
+    Args:
+        write_frequency (int): store only every write_frequency-th step
+    """
+
+    def __init__(self, write_frequency=1):
+        self._write_frequency = write_frequency
+        self._count = 0
+        self._array = None
+        self._length = 0
+        self._list = None
+        self._last = None
+
+    def append(self, value):
+        """
+        Add the value of the next step.
+
+        Args:
+            value (object): value of the step
+        """
+        if self._count % self._write_frequency == 0:
+            self._store(value=value)
+        self._last = value
+        self._count += 1
+
+    def _store(self, value):
+        if self._list is not None:
+            self._list.append(value)
+            return
+        array_value = np.asarray(value)
+        if array_value.dtype.kind not in "biufc" or (
+            self._array is not None and array_value.shape != self._array.shape[1:]
+        ):
+            self._list = (
+                [] if self._array is None else self._array[: self._length].tolist()
+            )
+            self._array = None
+            self._list.append(value)
+            return
+        if self._array is None:
+            self._array = np.empty((16,) + array_value.shape, dtype=array_value.dtype)
+        elif not np.can_cast(array_value.dtype, self._array.dtype, "same_kind"):
+            self._array = self._array.astype(
+                np.result_type(self._array.dtype, array_value.dtype)
+            )
+        if self._length == len(self._array):
+            array = np.empty(
+                (2 * len(self._array),) + self._array.shape[1:], dtype=self._array.dtype
+            )
+            array[: self._length] = self._array
+            self._array = array
+        self._array[self._length] = array_value
+        self._length += 1
+
+    def _stored(self):
+        if self._list is not None:
+            return self._list
+        if self._array is None:
+            return []
+        return self._array[: self._length]
+
+    def get_data(self, include_last=False):
+        """
+        Get the stored steps, this matches the selection of InteractiveBase._include_last_step().
+
+        Args:
+            include_last (bool): include the last step even if it is not a multiple of the write frequency
+
+        Returns:
+            numpy.ndarray/list: stored steps, a list if the values do not fit into a numerical array
+        """
+        data = self._stored()
+        if self._write_frequency == 1 or self._count == 0:
+            return data
+        if self._count <= self._write_frequency:
+            if include_last:
+                return [self._last]
+            return []
+        if include_last and (self._count - 1) % self._write_frequency != 0:
+            if isinstance(data, list):
+                return data + [self._last]
+            return np.concatenate([data, np.asarray(self._last)[np.newaxis]])
+        return data
+
+    def tolist(self):
+        stored = self._stored()
+        return stored if isinstance(stored, list) else stored.tolist()
+
+    def __array__(self, dtype=None):
+        return np.asarray(self._stored(), dtype=dtype)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return iter(self._stored())
+
+    def __getitem__(self, item):
+        if isinstance(item, int) and item == -1:
+            return self._last
+        return self._stored()[item]
+
+    def __repr__(self):
+        return "InteractiveCacheBuffer(" + repr(self._stored()) + ")"
+
+
+class InteractiveCache(dict):
+    """
+    Dictionary of the interactive cache, lists assigned to a key are converted to an InteractiveCacheBuffer.
+
+    Args:
+        cache_dict (dict): initial content of the cache
+        write_frequency (int): store only every write_frequency-th step
+    """
+
+    def __init__(self, cache_dict=None, write_frequency=1):
+        super().__init__()
+        self.write_frequency = write_frequency
+        if cache_dict is not None:
+            for key, value in cache_dict.items():
+                self[key] = value
+
+    def __setitem__(self, key, value):
+        if isinstance(value, list):
+            buffer = InteractiveCacheBuffer(write_frequency=self.write_frequency)
+            for step in value:
+                buffer.append(step)
+            value = buffer
+        super().__setitem__(key, value)
+
+
+class InteractiveFlushThread(Thread):
+    """
+    Background thread which writes the interactive cache to the HDF5 file while the simulation continues. The filled
+    caches are passed to the thread with put(), which blocks while max_queue_size caches are waiting to be written, so
+    the memory used by the caches stays bounded. An error raised while writing is raised again by the next call of
+    put(), wait() or stop().
+
+    Args:
+        write_function (callable): function which writes a cache, called with the keyword arguments given to put()
+        max_queue_size (int): maximum number of caches waiting to be written
+    """
+
+    def __init__(self, write_function, max_queue_size=2):
+        super().__init__(daemon=True)
+        self._write_function = write_function
+        self._queue = Queue(maxsize=max_queue_size)
+        self._error = None
+
+    def run(self):
+        while True:
+            kwargs = self._queue.get()
+            try:
+                if kwargs is None:
+                    return
+                if self._error is None:
+                    self._write_function(**kwargs)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def put(self, **kwargs):
+        """
+        Pass a cache to be written, blocks while the queue is full.
+        """
+        self._raise_error()
+        self._queue.put(kwargs)
+
+    def wait(self):
+        """
+        Block until all caches passed to the thread are written.
+        """
+        self._queue.join()
+        self._raise_error()
+
+    def stop(self):
+        """
+        Write the remaining caches and stop the thread.
+        """
+        self._queue.put(None)
+        self.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+
 class InteractiveBase(GenericJob):
     """
     InteractiveBase class extends the Generic Job class with all the functionality to run the job object interactively.
@@ -131,8 +337,85 @@ class InteractiveBase(GenericJob):
         self._interactive_write_input_files = False
         self._interactive_flush_frequency = 10000
         self._interactive_write_frequency = 1
+        self._interactive_chunk_size = None
+        self._interactive_compression = None
+        self._interactive_hdf_rewritten = False
+        self._interactive_async_flush = False
+        self._interactive_flush_thread = None
         self.interactive_cache = {}
 
+    @property
+    def interactive_cache(self):
+        """
+        Cache of the interactive output until it is written to the HDF5 file. Each quantity is stored in an
+        InteractiveCacheBuffer, lists assigned to the cache are converted.
+        """
+        return self._interactive_cache
+
+    @interactive_cache.setter
+    def interactive_cache(self, cache):
+        if cache is None:
+            self._interactive_cache = None
+        else:
+            self._interactive_cache = InteractiveCache(
+                cache_dict=cache,
+                write_frequency=getattr(self, "_interactive_write_frequency", 1),
+            )
+
+    @property
+    def interactive_chunk_size(self):
+        """
+        Number of steps stored in one chunk of the HDF5 datasets of the interactive output, None selects chunks of
+        about one megabyte.
+        """
+        return self._interactive_chunk_size
+
+    @interactive_chunk_size.setter
+    def interactive_chunk_size(self, chunk_size):
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int) or chunk_size < 1
+        ):
+            raise AssertionError("interactive_chunk_size must be an integer>0 or None")
+        self._interactive_chunk_size = chunk_size
+
+    @property
+    def interactive_async_flush(self):
+        """
+        Write the interactive cache to the HDF5 file in a background thread, so the simulation continues while the
+        output is written. interactive_close() waits until all output is written.
+        """
+        return self._interactive_async_flush
+
+    @interactive_async_flush.setter
+    def interactive_async_flush(self, async_flush):
+        if not async_flush:
+            self._interactive_flush_thread_stop()
+        self._interactive_async_flush = bool(async_flush)
+
+    def _interactive_flush_thread_wait(self):
+        if self._interactive_flush_thread is not None:
+            self._interactive_flush_thread.wait()
+
+    def _interactive_flush_thread_stop(self):
+        if self._interactive_flush_thread is not None:
+            flush_thread, self._interactive_flush_thread = (
+                self._interactive_flush_thread,
+                None,
+            )
+            flush_thread.stop()
+
+    @property
+    def interactive_compression(self):
+        """
+        Compression filter of the HDF5 datasets of the interactive output, like "gzip" or "lzf", None disables the
+        compression.
+        """
+        return self._interactive_compression
+
+    @interactive_compression.setter
+    def interactive_compression(self, compression):
+        self._interactive_compression = compression
+
     @property
     def interactive_flush_frequency(self):
         return self._interactive_flush_frequency
@@ -158,6 +441,7 @@ class InteractiveBase(GenericJob):
         if self._interactive_flush_frequency < frequency:
             self.interactive_flush_frequency = frequency
         self._interactive_write_frequency = frequency
+        self.interactive_cache.write_frequency = frequency
 
     def validate_ready_to_run(self):
         """
@@ -199,18 +483,71 @@ class InteractiveBase(GenericJob):
             return True
 
     @staticmethod
-    def _extend_hdf(h5, path, key, data):
+    def _extend_hdf(h5, path, key, data, chunk_size=None, compression=None):
         """
+        Append data to a dataset of the interactive output. Numerical arrays are stored in chunked datasets which are
+        resizable along the first axis, so new steps are appended in place instead of rewriting the whole dataset.
+        Data which does not fit into such a dataset, like lists of arrays with changing shapes, is read back,
+        extended and written again.
 
         Args:
-            h5:
-            path:
-            key:
-            data:
+            h5 (FileHDFio): HDF5 group the output is stored in
+            path (str): path of the output group relative to h5
+            key (str): name of the dataset
+            data (list/numpy.ndarray): steps to append
+            chunk_size (int/None): number of steps per chunk, by default chunks of about one megabyte are used
+            compression (str/None): compression filter of new datasets, like "gzip" or "lzf"
 
         Returns:
-
+            bool: False if an existing dataset had to be written again, which leaves unused space in the HDF5 file
         """
+        if (
+            isinstance(data, np.ndarray)
+            and data.ndim > 0
+            and data.dtype.kind in "biufc"
+        ):
+            dataset_path = posixpath.join(h5.h5_path, path, key)
+            hdf_file_pool.release(h5.file_name)
+            with _open_hdf(h5.file_name, mode="a") as hdf:
+                rewritten = False
+                if dataset_path in hdf:
+                    dataset = hdf[dataset_path]
+                    if (
+                        not isinstance(dataset, h5py.Dataset)
+                        or dataset.shape[1:] != data.shape[1:]
+                        or dataset.dtype.kind not in "biufc"
+                    ):
+                        rewritten = None
+                    elif dataset.maxshape[0] is None and np.can_cast(
+                        data.dtype, dataset.dtype, "same_kind"
+                    ):
+                        length = dataset.shape[0]
+                        dataset.resize(length + len(data), axis=0)
+                        dataset[length:] = data
+                        return True
+                    else:
+                        # datasets written by previous versions or with a different dtype are converted once
+                        data = np.concatenate([dataset[()], data])
+                        del hdf[dataset_path]
+                        rewritten = True
+                if rewritten is not None:
+                    if chunk_size is None:
+                        chunk_size = max(
+                            1,
+                            min(
+                                10000,
+                                2**20 // max(1, data[:1].nbytes),
+                            ),
+                        )
+                    dataset = hdf.create_dataset(
+                        dataset_path,
+                        data=data,
+                        maxshape=(None,) + data.shape[1:],
+                        chunks=(chunk_size,) + data.shape[1:],
+                        compression=compression,
+                    )
+                    dataset.attrs["TITLE"] = "ndarray"
+                    return not rewritten
         if path in h5.list_groups() and key in h5[path].list_nodes():
             current_hdf = h5[path + "/" + key]
             if isinstance(data, list):
@@ -218,7 +555,10 @@ class InteractiveBase(GenericJob):
             else:
                 entry = current_hdf.tolist() + data.tolist()
             data = np.array(entry)
+            h5[path + "/" + key] = data
+            return False
         h5[path + "/" + key] = data
+        return True
 
     @staticmethod
     def _include_last_step(array, step=1, include_last=False):
@@ -250,34 +590,83 @@ class InteractiveBase(GenericJob):
 
     def interactive_flush(self, path="interactive", include_last_step=False):
         """
+        Write the interactive cache to the HDF5 file and empty the cache. With interactive_async_flush enabled the
+        filled cache is handed over to a background thread which writes it, while the job continues with an empty
+        cache.
 
         Args:
-            path:
-            include_last_step:
+            path (str): HDF5 group in the output the cache is written to
+            include_last_step (bool): write the last step even if it is not a multiple of the write frequency
+        """
+        if self._interactive_async_flush:
+            cache = self.interactive_cache
+            self.interactive_cache = {key: [] for key in cache.keys()}
+            if self._interactive_flush_thread is None:
+                self._interactive_flush_thread = InteractiveFlushThread(
+                    write_function=self._interactive_write_cache
+                )
+                self._interactive_flush_thread.start()
+            self._interactive_flush_thread.put(
+                cache=cache, path=path, include_last_step=include_last_step
+            )
+        else:
+            self._interactive_write_cache(
+                cache=self.interactive_cache,
+                path=path,
+                include_last_step=include_last_step,
+            )
+            for key in self.interactive_cache.keys():
+                self.interactive_cache[key] = []
 
-        Returns:
+    def _interactive_write_cache(self, cache, path, include_last_step=False):
+        """
+        Write an interactive cache to the HDF5 file.
 
+        Args:
+            cache (dict): interactive cache
+            path (str): HDF5 group in the output the cache is written to
+            include_last_step (bool): write the last step even if it is not a multiple of the write frequency
         """
         with self.project_hdf5.open("output") as h5:
-            for key in self.interactive_cache.keys():
-                if len(self.interactive_cache[key]) == 0:
+            for key in cache.keys():
+                if len(cache[key]) == 0:
                     continue
-                data = self._include_last_step(
-                    array=self.interactive_cache[key],
-                    step=self.interactive_write_frequency,
-                    include_last=include_last_step,
-                )
-                if (
+                if isinstance(cache[key], InteractiveCacheBuffer):
+                    data = cache[key].get_data(include_last=include_last_step)
+                else:
+                    data = self._include_last_step(
+                        array=cache[key],
+                        step=self.interactive_write_frequency,
+                        include_last=include_last_step,
+                    )
+                if isinstance(data, np.ndarray):
+                    in_place = self._extend_hdf(
+                        h5=h5,
+                        path=path,
+                        key=key,
+                        data=data,
+                        chunk_size=self._interactive_chunk_size,
+                        compression=self._interactive_compression,
+                    )
+                elif (
                     len(data) > 0
                     and isinstance(data[0], list)
                     and len(np.shape(data)) == 1
                 ):
-                    self._extend_hdf(h5=h5, path=path, key=key, data=data)
+                    in_place = self._extend_hdf(h5=h5, path=path, key=key, data=data)
                 elif np.array(data).dtype == np.dtype("O"):
-                    self._extend_hdf(h5=h5, path=path, key=key, data=data)
+                    in_place = self._extend_hdf(h5=h5, path=path, key=key, data=data)
                 else:
-                    self._extend_hdf(h5=h5, path=path, key=key, data=np.array(data))
-                self.interactive_cache[key] = []
+                    in_place = self._extend_hdf(
+                        h5=h5,
+                        path=path,
+                        key=key,
+                        data=np.array(data),
+                        chunk_size=self._interactive_chunk_size,
+                        compression=self._interactive_compression,
+                    )
+                if not in_place:
+                    self._interactive_hdf_rewritten = True
 
     def interactive_open(self):
         """
@@ -301,7 +690,12 @@ class InteractiveBase(GenericJob):
             and len(self.interactive_cache[list(self.interactive_cache.keys())[0]]) != 0
         ):
             self.interactive_flush(path="interactive", include_last_step=True)
-        self.project_hdf5.rewrite_hdf5()
+        # the output written in the background has to be complete before the job is finished
+        self._interactive_flush_thread_stop()
+        if self._interactive_hdf_rewritten:
+            # only datasets which were written again leave unused space in the HDF5 file
+            self.project_hdf5.rewrite_hdf5()
+            self._interactive_hdf_rewritten = False
         self.status.finished = True
         if not isinstance(self.project.db, FileTable):
             self.run_time_to_db()
@@ -332,6 +726,19 @@ class InteractiveBase(GenericJob):
     def run_if_interactive_non_modal(self):
         raise NotImplementedError("run_if_interactive_non_modal() is not implemented!")
 
+    def signal_intercept(self, sig):
+        """
+        Write the output cached for the background thread before the job is aborted.
+
+        Args:
+            sig (int): the signal that triggered the abort
+        """
+        try:
+            self._interactive_flush_thread_stop()
+        except Exception:
+            self._logger.exception("Writing the interactive output failed.")
+        super(InteractiveBase, self).signal_intercept(sig)
+
     def to_hdf(self, hdf=None, group_name=None):
         """
         Store the InteractiveBase object in the HDF5 File
@@ -340,11 +747,16 @@ class InteractiveBase(GenericJob):
             hdf (ProjectHDFio): HDF5 group object - optional
             group_name (str): HDF5 subgroup name - optional
         """
+        # the background thread must not write to the HDF5 file at the same time
+        self._interactive_flush_thread_wait()
         super(InteractiveBase, self).to_hdf(hdf=hdf, group_name=group_name)
         with self.project_hdf5.open("input") as hdf5_input:
             hdf5_input["interactive"] = {
                 "interactive_flush_frequency": self._interactive_flush_frequency,
                 "interactive_write_frequency": self._interactive_write_frequency,
+                "interactive_chunk_size": self._interactive_chunk_size,
+                "interactive_compression": self._interactive_compression,
+                "interactive_async_flush": self._interactive_async_flush,
             }
 
     def from_hdf(self, hdf=None, group_name=None):
@@ -368,6 +780,18 @@ class InteractiveBase(GenericJob):
                     ]
                 else:
                     self._interactive_write_frequency = 1
+                self.interactive_cache.write_frequency = (
+                    self._interactive_write_frequency
+                )
+                self._interactive_chunk_size = interactive_dict.get(
+                    "interactive_chunk_size", None
+                )
+                self._interactive_compression = interactive_dict.get(
+                    "interactive_compression", None
+                )
+                self._interactive_async_flush = interactive_dict.get(
+                    "interactive_async_flush", False
+                )
 
 
 class _WithInteractiveOpen:
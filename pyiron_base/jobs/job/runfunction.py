@@ -546,6 +546,8 @@ def run_job_with_runmode_executor_futures(job, executor):
         debug=False,
         connection_string=connection_string,
     )
+    # the job status is changed by the executor process, so it is read from the database once the job is done
+    job.status.expire_when_done(future=job.server.future)
 
 
 def run_job_with_runmode_executor_flux(job, executor, gpus_per_slot=None):
@@ -601,6 +603,7 @@ def run_job_with_runmode_executor_flux(job, executor, gpus_per_slot=None):
     jobspec.cwd = job.project_hdf5.working_directory
     jobspec.environment = dict(os.environ)
     job.server.future = executor.submit(jobspec)
+    job.status.expire_when_done(future=job.server.future)
 
 
 def run_time_decorator(func):
@@ -74,6 +74,8 @@ class TemplateJob(GenericJob, HasStorage):
 
     def from_hdf(self, hdf=None, group_name=None):
         GenericJob.from_hdf(self, hdf=hdf, group_name=group_name)
+        # for lazily loaded jobs the input and output are only read when they are accessed
+        self.storage._lazy = self._lazy_load
         HasStorage.from_hdf(self, hdf=self.project_hdf5)
 
 
@@ -6,6 +6,7 @@ Helper functions for the JobCore and GenericJob objects
 """
 
 from itertools import islice
+import io
 import os
 import posixpath
 import psutil
@@ -15,8 +16,16 @@ import shutil
 import monty.io
 from typing import Optional, Union
 from pyiron_base.utils.instance import static_isinstance
+from pyiron_base.utils.compression import (
+    COMPRESSION_SUFFIX_DICT,
+    list_archive_files,
+    read_archive_file,
+    write_archive,
+)
 from pyiron_base.utils.safetar import safe_extract
+from pyiron_base.project.size import invalidate_job_size
 from pyiron_base.database.sqlcolumnlength import JOB_STR_LENGTH
+from pyiron_base.state.settings import settings
 
 __author__ = "Jan Janssen"
 __copyright__ = (
@@ -192,11 +201,12 @@ def _rename_job(job, new_job_name):
     if os.path.exists(old_working_directory):
         shutil.move(old_working_directory, job.working_directory)
         os.rmdir("/".join(old_working_directory.split("/")[:-1]))
-    if os.path.exists(os.path.join(job.working_directory, old_job_name + ".tar.bz2")):
-        os.rename(
-            os.path.join(job.working_directory, old_job_name + ".tar.bz2"),
-            os.path.join(job.working_directory, job.job_name + ".tar.bz2"),
-        )
+    for suffix in COMPRESSION_SUFFIX_DICT.values():
+        if os.path.exists(os.path.join(job.working_directory, old_job_name + suffix)):
+            os.rename(
+                os.path.join(job.working_directory, old_job_name + suffix),
+                os.path.join(job.working_directory, job.job_name + suffix),
+            )
 
 
 def _is_valid_job_name(job_name):
@@ -271,19 +281,54 @@ def _job_compressed_name(job):
 
 def _get_compressed_job_name(working_directory):
     """Return the canonical file name of a compressed job from the working directory."""
-    return os.path.join(
-        working_directory, os.path.basename(working_directory) + ".tar.bz2"
+    return _get_archive_name(
+        file_name_base=os.path.join(
+            working_directory, os.path.basename(working_directory)
+        )
     )
 
 
-def _job_compress(job, files_to_compress=[], files_to_remove=[]):
+def _get_archive_name(file_name_base):
+    """
+    Return the file name of an existing archive compressed with any of the supported codecs, or the file name of a new
+    archive compressed with the codec defined by the job_compression setting.
+
+    Args:
+        file_name_base (str): file name of the archive without the suffix
+
+    Returns:
+        str: file name of the archive
+    """
+    for suffix in COMPRESSION_SUFFIX_DICT.values():
+        if os.path.exists(file_name_base + suffix):
+            return file_name_base + suffix
+    return file_name_base + COMPRESSION_SUFFIX_DICT[_get_compression_codec()]
+
+
+def _get_compression_codec():
+    """Return the compression codec defined by the job_compression setting."""
+    codec = settings.configuration["job_compression"]
+    if codec not in COMPRESSION_SUFFIX_DICT.keys():
+        raise ValueError(
+            "The job_compression "
+            + str(codec)
+            + " is not supported, choose from "
+            + str(list(COMPRESSION_SUFFIX_DICT.keys()))
+        )
+    return codec
+
+
+def _job_compress(job, files_to_compress=[], files_to_remove=[], max_workers=None):
     """
-    Compress the output files of a job object.
+    Compress the output files of a job object with the codec and level defined by the job_compression and
+    job_compression_level settings. Large files are compressed in parallel blocks and an index of the archive is
+    written, so single files can be read from the archive without decompressing it.
 
     Args:
         job (JobCore): job object to compress
         files_to_compress (list): list of files to compress
         files_to_remove (list): list of files to remove
+        max_workers (int): number of compression threads, defaults to the number of CPU cores
     """
 
     def delete_file_or_folder(fullname):
@@ -295,20 +340,29 @@ def _job_compress(job, files_to_compress=[], files_to_remove=[]):
     if not _job_is_compressed(job):
         for name in files_to_remove:
             delete_file_or_folder(fullname=os.path.join(job.working_directory, name))
-        cwd = os.getcwd()
-        try:
-            os.chdir(job.working_directory)
-            with tarfile.open(_job_compressed_name(job), "w:bz2") as tar:
-                for name in files_to_compress:
-                    if "tar" not in name and not stat.S_ISFIFO(os.stat(name).st_mode):
-                        tar.add(name)
-            for name in files_to_compress:
-                if name != _job_compressed_name(job):
-                    delete_file_or_folder(
-                        fullname=os.path.join(job.working_directory, name)
-                    )
-        finally:
-            os.chdir(cwd)
+        compressed_name = _job_compressed_name(job)
+        name_lst = [
+            name
+            for name in files_to_compress
+            if "tar" not in name
+            and not stat.S_ISFIFO(
+                os.stat(os.path.join(job.working_directory, name)).st_mode
+            )
+        ]
+        write_archive(
+            file_name=compressed_name,
+            path_lst=[os.path.join(job.working_directory, name) for name in name_lst],
+            arcname_lst=name_lst,
+            codec=_get_compression_codec(),
+            compresslevel=settings.configuration["job_compression_level"],
+            max_workers=max_workers,
+        )
+        for name in files_to_compress:
+            if name != os.path.basename(compressed_name):
+                delete_file_or_folder(
+                    fullname=os.path.join(job.working_directory, name)
+                )
+        invalidate_job_size(job=job)
     else:
         job.logger.info("The files are already compressed!")
 
@@ -322,9 +376,10 @@ def _job_decompress(job):
     """
     tar_file_name = _job_compressed_name(job)
     try:
-        with tarfile.open(tar_file_name, "r:bz2") as tar:
+        with tarfile.open(tar_file_name, "r") as tar:
             safe_extract(tar, job.working_directory)
         os.remove(tar_file_name)
+        invalidate_job_size(job=job)
     except IOError:
         pass
 
@@ -339,10 +394,12 @@ def _working_directory_is_compressed(working_directory):
     Returns:
         bool: [True/False]
     """
-    compressed_name = os.path.basename(
-        _get_compressed_job_name(working_directory=working_directory)
+    compressed_name = os.path.basename(working_directory)
+    file_lst = os.listdir(working_directory)
+    return any(
+        compressed_name + suffix in file_lst
+        for suffix in COMPRESSION_SUFFIX_DICT.values()
     )
-    return compressed_name in os.listdir(working_directory)
 
 
 def _job_is_compressed(job):
@@ -379,12 +436,9 @@ def _working_directory_list_files(working_directory, include_archive=True):
             compressed_job_name = _get_compressed_job_name(
                 working_directory=working_directory
             )
-            with tarfile.open(compressed_job_name, "r") as tar:
-                compressed_files_lst = [
-                    member.name for member in tar.getmembers() if member.isfile()
-                ]
-                uncompressed_files_lst.remove(os.path.basename(compressed_job_name))
-                return uncompressed_files_lst + compressed_files_lst
+            compressed_files_lst = list_archive_files(file_name=compressed_job_name)
+            uncompressed_files_lst.remove(os.path.basename(compressed_job_name))
+            return uncompressed_files_lst + compressed_files_lst
         else:
             return uncompressed_files_lst
     return []
@@ -430,17 +484,15 @@ def _working_directory_read_file(working_directory, file_name, tail=None):
     if _working_directory_is_compressed(
         working_directory=working_directory
     ) and file_name not in os.listdir(working_directory):
-        with tarfile.open(
-            _get_compressed_job_name(working_directory=working_directory),
-            encoding="utf8",
-        ) as f:
-            lines = [
-                line.decode("utf8") for line in f.extractfile(file_name).readlines()
-            ]
-            if tail is None:
-                return lines
-            else:
-                return lines[-tail:]
+        content = read_archive_file(
+            file_name=_get_compressed_job_name(working_directory=working_directory),
+            member_name=file_name,
+        )
+        lines = [line.decode("utf8") for line in io.BytesIO(content).readlines()]
+        if tail is None:
+            return lines
+        else:
+            return lines[-tail:]
     else:
         file_name = posixpath.join(working_directory, file_name)
         if tail is None:
@@ -484,33 +536,34 @@ def _job_read_file(job, file_name, tail=None):
     )
 
 
-def _job_archive(job):
+def _job_archive(job, max_workers=None):
     """
-    Compress HDF5 file of the job object to tar-archive
+    Compress HDF5 file of the job object to tar-archive, using the codec defined by the job_compression setting.
 
     Args:
         job (JobCore): job object to archive
+        max_workers (int): number of compression threads, defaults to the number of CPU cores
     """
     fpath = job.project_hdf5.file_path
     jname = job.job_name
     h5_dir_name = jname + "_hdf5"
     h5_file_name = jname + ".h5"
-    cwd = os.getcwd()
-    try:
-        os.chdir(fpath)
-        with tarfile.open(
-            os.path.join(fpath, job.job_name + ".tar.bz2"), "w:bz2"
-        ) as tar:
-            for name in [h5_dir_name, h5_file_name]:
-                tar.add(name)
-        for name in [h5_dir_name, h5_file_name]:
-            fullname = os.path.join(fpath, name)
-            if os.path.isfile(fullname):
-                os.remove(fullname)
-            elif os.path.isdir(fullname):
-                shutil.rmtree(fullname)
-    finally:
-        os.chdir(cwd)
+    codec = _get_compression_codec()
+    write_archive(
+        file_name=os.path.join(fpath, jname + COMPRESSION_SUFFIX_DICT[codec]),
+        path_lst=[os.path.join(fpath, name) for name in [h5_dir_name, h5_file_name]],
+        arcname_lst=[h5_dir_name, h5_file_name],
+        codec=codec,
+        compresslevel=settings.configuration["job_compression_level"],
+        max_workers=max_workers,
+        write_index=False,
+    )
+    for name in [h5_dir_name, h5_file_name]:
+        fullname = os.path.join(fpath, name)
+        if os.path.isfile(fullname):
+            os.remove(fullname)
+        elif os.path.isdir(fullname):
+            shutil.rmtree(fullname)
 
 
 def _job_unarchive(job):
@@ -522,8 +575,8 @@ def _job_unarchive(job):
     """
     fpath = job.project_hdf5.file_path
     try:
-        tar_name = os.path.join(fpath, job.job_name + ".tar.bz2")
-        with tarfile.open(tar_name, "r:bz2") as tar:
+        tar_name = _get_archive_name(file_name_base=os.path.join(fpath, job.job_name))
+        with tarfile.open(tar_name, "r") as tar:
             safe_extract(tar, fpath)
         os.remove(tar_name)
     finally:
@@ -540,8 +593,9 @@ def _job_is_archived(job):
     Returns:
         bool: [True/False]
     """
-    return os.path.isfile(
-        os.path.join(job.project_hdf5.file_path, job.job_name + ".tar.bz2")
+    return any(
+        os.path.isfile(os.path.join(job.project_hdf5.file_path, job.job_name + suffix))
+        for suffix in COMPRESSION_SUFFIX_DICT.values()
     )
 
 
@@ -10,11 +10,7 @@ import logging
 from pyiron_base.project.generic import Project
 from pyiron_base.state import state
 from pyiron_base.state.signal import catch_signals
-from pyiron_base.database.filetable import (
-    get_hamilton_from_file,
-    get_hamilton_version_from_file,
-    get_job_status_from_file,
-)
+from pyiron_base.database.filetable import get_job_metadata_from_file
 
 __author__ = "Joerg Neugebauer"
 __copyright__ = (
@@ -76,13 +72,7 @@ class JobWrapper(object):
                     "subjob": h5_path,
                     "projectpath": projectpath,
                     "project": project + "/",
-                    "status": get_job_status_from_file(
-                        hdf5_file=hdf5_file, job_name=job_name
-                    ),
-                    "hamilton": get_hamilton_from_file(
-                        hdf5_file=hdf5_file, job_name=job_name
-                    ),
-                    "hamversion": get_hamilton_version_from_file(
+                    **get_job_metadata_from_file(
                         hdf5_file=hdf5_file, job_name=job_name
                     ),
                 },
@@ -107,7 +97,11 @@ class JobWrapper(object):
         logger.setLevel(logging.INFO)
         if debug:
             logger.setLevel(logging.DEBUG)
+        if any(getattr(h, "_pyiron_job_wrapper", False) for h in logger.handlers):
+            # persistent worker processes execute multiple jobs, the handler is only added once
+            return logger
         ch = logging.StreamHandler()
+        ch._pyiron_job_wrapper = True
         ch.setLevel(logging.INFO)
         formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
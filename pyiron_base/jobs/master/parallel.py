@@ -6,9 +6,12 @@ The parallel master class is a metajob consisting of a list of jobs which are ex
 """
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import posixpath
 from typing import Union
 
+from h5io_browser.base import _read_hdf
 import numpy as np
 import pandas
 import multiprocessing
@@ -21,6 +24,9 @@ from pyiron_base.jobs.job.extension.jobstatus import JobStatus
 from pyiron_base.state import state
 from pyiron_base.jobs.job.wrapper import job_wrapper_function
 from pyiron_base.jobs.job.util import _get_safe_job_name
+from pyiron_base.jobs.datamining import _get_job_file_name
+from pyiron_base.storage.flattenedstorage import FlattenedStorage
+from pyiron_base.storage.hdfpool import hdf_file_pool
 from pyiron_base.utils.deprecate import deprecate
 
 __author__ = "Joerg Neugebauer, Jan Janssen"
@@ -59,6 +65,9 @@ class ParallelMaster(GenericMaster):
 
     Subclasses *must* implement :meth:`.collect_output()`.  Additionally :attr:`._job_generator` must be
     initialized with an instance of :class:`.JobGenerator` in the subclasses' `__init__`.
+
+    Alternatively subclasses can declare the output of the child jobs they collect in :attr:`._child_output_paths`,
+    then the default :meth:`.collect_output()` gathers it with :meth:`.aggregate_child_output()`.
 """
         + "\n"
         + _doc_str_job_core_args
@@ -66,6 +75,10 @@ class ParallelMaster(GenericMaster):
         + _doc_str_parallel_master_attr
     )
 
+    # HDF5 paths of the child job output collected by the default collect_output(), either a list of paths relative to
+    # the child job or a dictionary mapping the name in the master output to the path
+    _child_output_paths = None
+
     def __init__(self, project, job_name):
         super(ParallelMaster, self).__init__(project, job_name=job_name)
         self.__version__ = "0.3"
@@ -142,9 +155,111 @@ class ParallelMaster(GenericMaster):
     def collect_output(self):
         """
         Collect the output files of the external executable and store the information in the HDF5 file. This method has
-        to be implemented in the individual meta jobs derived from the ParallelMaster.
+        to be implemented in the individual meta jobs derived from the ParallelMaster, unless they declare the child
+        output to collect in :attr:`._child_output_paths`.
         """
-        raise NotImplementedError("Implement in derived class")
+        if self._child_output_paths is None:
+            raise NotImplementedError("Implement in derived class")
+        self.aggregate_child_output(output_paths=self._child_output_paths)
+
+    def aggregate_child_output(
+        self,
+        output_paths,
+        h5_path="output",
+        storage="array",
+        only_finished=True,
+        max_workers=None,
+    ):
+        """
+        Gather the output of all child jobs and store it in the HDF5 file of the master in a single write.
+
+        The child jobs are not loaded as job objects, instead the requested nodes are read directly from the HDF5 files
+        of the child jobs using a pool of threads. The values are ordered like the parameters of the job generator.
+
+        Args:
+            output_paths (list/dict): HDF5 paths relative to the child job, like ["output/energy"], or a dictionary
+                                      mapping the name in the master output to the path in the child job. For a list
+                                      the last part of the path is used as name.
+            h5_path (str): group in the HDF5 file of the master the output is stored in - default='output'
+            storage (str): "array" stacks the values of all child jobs to numpy arrays with the child jobs along the
+                           first axis, "flattened" stores them in a :class:`.FlattenedStorage` with one chunk per child
+                           job, so the values of the child jobs can differ in length - default='array'
+            only_finished (bool): only include child jobs with the status finished - default=True
+            max_workers (int): number of threads reading HDF5 files, defaults to the ThreadPoolExecutor default
+
+        Returns:
+            dict/FlattenedStorage: dictionary of numpy arrays or flattened storage, depending on the storage parameter
+        """
+        if storage not in ["array", "flattened"]:
+            raise ValueError(
+                "The storage has to be either 'array' or 'flattened', not " + storage
+            )
+        if not isinstance(output_paths, dict):
+            output_paths = {posixpath.basename(path): path for path in output_paths}
+        db_entry_lst = self._get_child_db_entries(only_finished=only_finished)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            output_lst = list(
+                executor.map(
+                    lambda db_entry: _read_child_output(
+                        file_name=_get_job_file_name(db_entry=db_entry),
+                        h5_path=db_entry["subjob"],
+                        output_paths=output_paths,
+                    ),
+                    db_entry_lst,
+                )
+            )
+        if storage == "array":
+            output = {
+                key: _stack_child_output([values[key] for values in output_lst])
+                for key in output_paths.keys()
+            }
+            self.project_hdf5.write_dict(
+                data_dict={
+                    posixpath.join(h5_path, key): value for key, value in output.items()
+                }
+            )
+        else:
+            output = FlattenedStorage(
+                num_chunks=max(len(output_lst), 1),
+                num_elements=max(
+                    sum(_get_chunk_length(values) for values in output_lst), 1
+                ),
+            )
+            for db_entry, values in zip(db_entry_lst, output_lst):
+                output.add_chunk(
+                    _get_chunk_length(values), identifier=db_entry["job"], **values
+                )
+            output.to_hdf(self.project_hdf5, group_name=h5_path)
+        return output
+
+    def _get_child_db_entries(self, only_finished=True):
+        """
+        Get the database entries of the child jobs in the order of the parameters of the job generator.
+
+        Args:
+            only_finished (bool): only include child jobs with the status finished
+
+        Returns:
+            list: list of database entries
+        """
+        db_entry_dict = {
+            db_entry["job"]: db_entry
+            for db_entry in sorted(
+                self.project.db.get_items_dict({"masterid": self.job_id}),
+                key=lambda db_entry: db_entry["id"],
+            )
+            if not only_finished or db_entry["status"] == "finished"
+        }
+        if self._job_generator is None:
+            return list(db_entry_dict.values())
+        return [
+            db_entry_dict[job_name]
+            for job_name in [
+                self._job_generator.job_name(p)
+                for p in self._job_generator.parameter_list
+            ]
+            if job_name in db_entry_dict.keys()
+        ]
 
     def collect_logfiles(self):
         """
@@ -166,8 +281,7 @@ class ParallelMaster(GenericMaster):
         """
         # TODO: The output to pandas function should no longer be required
         with self.project_hdf5.open(h5_path) as hdf:
-            for key in hdf.list_nodes():
-                self._output[key] = hdf[key]
+            self._output.update(hdf.read_dict_from_hdf())
         df = pandas.DataFrame(self._output)
         if sort_by is not None:
             df = df.sort_values(by=sort_by)
@@ -260,9 +374,13 @@ class ParallelMaster(GenericMaster):
             return True
         if len(self.child_ids) < len(self._job_generator):
             return False
-        return set(
-            [self.project.db.get_job_status(child_id) for child_id in self.child_ids]
-        ) < {"finished", "busy", "refresh", "aborted", "not_converged"}
+        return set(self.project.db.get_child_status_lst(master_id=self.job_id)) < {
+            "finished",
+            "busy",
+            "refresh",
+            "aborted",
+            "not_converged",
+        }
 
     def iter_jobs(self, convert_to_object=True):
         """
@@ -492,7 +610,7 @@ class ParallelMaster(GenericMaster):
             job (GenericJob): child job to be started
         """
         pool = multiprocessing.Pool(self.server.cores)
-        job_lst = []
+        job_lst, child_lst = [], []
         for i, p in enumerate(self._job_generator.parameter_list):
             if hasattr(self._job_generator, "job_name"):
                 job = self.create_child_job(self._job_generator.job_name(parameter=p))
@@ -500,7 +618,9 @@ class ParallelMaster(GenericMaster):
                 job = self.create_child_job(self.ref_job.job_name + "_" + str(i))
             job = self._job_generator.modify_job(job=job, parameter=p)
             job.server.run_mode.modal = True
-            job.save()
+            child_lst.append(job)
+        self._save_child_jobs(job_lst=child_lst)
+        for job in child_lst:
             job.project_hdf5.create_working_directory()
             job.write_input()
             if state.database.database_is_disabled or (
@@ -523,6 +643,31 @@ class ParallelMaster(GenericMaster):
         self.status.collect = True
         self.run()  # self.run_if_collect()
 
+    def _save_child_jobs(self, job_lst):
+        """
+        Save multiple child jobs with a single bulk insert in the database rather than one insert per child. Jobs which
+        overwrite save() are saved one by one, so their additional logic is still executed.
+
+        Args:
+            job_lst (list): list of child jobs to save
+        """
+        bulk_lst = [job for job in job_lst if type(job).save is GenericJob.save]
+        for job in job_lst:
+            if type(job).save is not GenericJob.save:
+                job.save()
+        for job in bulk_lst:
+            job.to_hdf()
+        if not state.database.database_is_disabled:
+            job_id_lst = self.project.db.add_items_dicts(
+                [job.db_entry() for job in bulk_lst]
+            )
+            for job, job_id in zip(bulk_lst, job_id_lst):
+                job._store_job_id(job_id=job_id)
+        else:
+            job_id_lst = [job.job_name for job in bulk_lst]
+        for job, job_id in zip(bulk_lst, job_id_lst):
+            job._finish_save(job_id=job_id)
+
     def run_static(self):
         """
         The run_static function is executed within the GenericJob class and depending on the run_mode of the
@@ -752,6 +897,61 @@ class ParallelMaster(GenericMaster):
             self.server.run_mode.interactive = True
 
 
+def _read_child_output(file_name, h5_path, output_paths):
+    """
+    Read the output of a single child job from its HDF5 file, opening the file only once.
+
+    Args:
+        file_name (str): HDF5 file of the child job
+        h5_path (str): group of the child job in the HDF5 file
+        output_paths (dict): dictionary mapping the names of the output to the paths relative to the child job
+
+    Returns:
+        dict: dictionary mapping the names of the output to the values
+    """
+    with hdf_file_pool.open(file_name, mode="r") as hdf:
+        return {
+            key: _read_hdf(hdf_filehandle=hdf, h5_path=posixpath.join(h5_path, path))
+            for key, path in output_paths.items()
+        }
+
+
+def _stack_child_output(value_lst):
+    """
+    Stack the values of the child jobs along a new first axis, values of different shape are stored in an object array.
+
+    Args:
+        value_lst (list): list of values, one per child job
+
+    Returns:
+        numpy.ndarray: stacked values
+    """
+    try:
+        return np.stack([np.asarray(value) for value in value_lst])
+    except ValueError:
+        output = np.empty(len(value_lst), dtype=object)
+        output[:] = [np.asarray(value) for value in value_lst]
+        return output
+
+
+def _get_chunk_length(values):
+    """
+    Get the number of elements of a child job in a :class:`.FlattenedStorage`, which is the length of the first array
+    valued output, scalars are stored per chunk.
+
+    Args:
+        values (dict): dictionary mapping the names of the output to the values of a single child job
+
+    Returns:
+        int: chunk length
+    """
+    for value in values.values():
+        shape = np.shape(value)
+        if len(shape) > 0:
+            return shape[0]
+    return 1
+
+
 class GenericOutput(OrderedDict):
     """
     Generic Output just a place holder to store the output of the last child directly in the ParallelMaster.
@@ -13,7 +13,8 @@ from multiprocessing import Pool
 import numpy as np
 from pyiron_base.state import state
 from pyiron_base.jobs.job.template import PythonTemplateJob
-
+from pyiron_base.jobs.job.wrapper import job_wrapper_function
+from pyiron_base.storage.hdfpool import hdf_file_pool
 
 __author__ = "Jan Janssen"
 __copyright__ = (
@@ -81,6 +82,124 @@ def worker_function(args):
         pass
 
 
+# database connections inherited from the worker job process, they are kept referenced in the pool processes, so they
+# are never closed there, as closing them would also terminate the connection of the worker job
+_inherited_database_lst = []
+
+
+def _initialize_in_process_worker():
+    """
+    Initialize a process of the pool which executes the jobs in-process, the pool process opens its own database
+    connection rather than using the one inherited from the worker job.
+    """
+    if state.database._database is not None:
+        _inherited_database_lst.append(state.database._database)
+        state.database._database = None
+
+
+def in_process_worker_function(args):
+    """
+    The in-process worker function is executed inside a persistent process of the processing pool. In contrast to the
+    worker_function() the job is executed in the pool process itself, so pyiron is imported only once per pool process
+    rather than once per job. Exceptions raised by the job are logged and do not affect the following jobs executed by
+    the same pool process. The HDF5 files pooled during the job are closed after the job.
+
+    Args:
+        args (list): A list of arguments
+
+    Arguments inside the argument list:
+        working_directory (str): working directory of the job
+        job_link (int/str): job ID or path to the HDF5 file of the job including the path inside the HDF5 file
+    """
+    working_directory, job_link = args
+    cwd = os.getcwd()
+    try:
+        os.chdir(working_directory)
+        if isinstance(job_link, int) or str(job_link).isdigit():
+            job_wrapper_function(
+                working_directory=working_directory, job_id=str(job_link)
+            )
+        else:
+            job_wrapper_function(
+                working_directory=working_directory, file_path=job_link
+            )
+    except Exception:
+        state.logger.exception(
+            "The job " + str(job_link) + " failed in the worker process."
+        )
+    finally:
+        # the pool process lives longer than the job, so it must not keep the HDF5 files of the job open and locked
+        hdf_file_pool.clear()
+        os.chdir(cwd)
+
+
+class AdaptiveSleep:
+    """
+    Wait between two iterations of a polling loop with an exponential backoff. After some activity the loop polls
+    again after min_interval seconds, every idle iteration doubles the waiting time up to max_interval seconds. A
+    wait function which returns True when it was notified about a change, like the wait_for_job_status_change()
+    function of the database, ends the waiting early and resets the backoff.
+
+    Args:
+        max_interval (float): maximum time to wait in seconds
+        min_interval (float): time to wait in seconds after some activity
+        factor (float): factor the waiting time is increased by after each idle iteration
+        wait_function (callable): function which waits for a given timeout, returns True when it was notified
+    """
+
+    def __init__(self, max_interval, min_interval=0.1, factor=2.0, wait_function=None):
+        self._max_interval = max_interval
+        self._min_interval = min(min_interval, max_interval)
+        self._factor = factor
+        self._wait_function = wait_function
+        self._interval = self._min_interval
+
+    @property
+    def interval(self):
+        return self._interval
+
+    def reset(self):
+        """
+        Poll again after the minimum interval, called after some activity.
+        """
+        self._interval = self._min_interval
+
+    def sleep(self):
+        """
+        Wait for the current interval or until the wait function is notified.
+
+        Returns:
+            bool: True if the waiting was ended by a notification
+        """
+        if self._wait_function is not None:
+            notified = self._wait_function(self._interval)
+        else:
+            time.sleep(self._interval)
+            notified = False
+        if notified:
+            self.reset()
+        else:
+            self._interval = min(self._interval * self._factor, self._max_interval)
+        return notified
+
+
+def _wait_for_results(res_lst, timeout):
+    """
+    Wait until the next pending result of the pool is ready or the timeout is reached.
+
+    Args:
+        res_lst (list): list of pairs of multiprocessing.pool.AsyncResult and the number of tasks
+        timeout (float): maximum time to wait in seconds
+
+    Returns:
+        bool: True if there are still pending results
+    """
+    pending_lst = [r for r, _ in res_lst if not r.ready()]
+    if len(pending_lst) > 0:
+        pending_lst[0].wait(timeout)
+    return len(pending_lst) > 0
+
+
 class WorkerJob(PythonTemplateJob):
     """
     The WorkerJob executes jobs linked to its master id.
@@ -125,6 +244,13 @@ class WorkerJob(PythonTemplateJob):
     >>> pr_calc.wait_for_jobs()
     >>> job_worker.status.collect = True
 
+    By default every job is executed in a new python process. For many short python jobs the startup of the python
+    interpreter can take longer than the job itself, in this case the jobs can be executed in-process by the persistent
+    processes of the worker. The pool processes are replaced after maxtasksperchild jobs to release their memory:
+
+    >>> job_worker.input.run_in_process = True
+    >>> job_worker.input.maxtasksperchild = 100
+
     """
 
     def __init__(self, project, job_name):
@@ -138,6 +264,7 @@ class WorkerJob(PythonTemplateJob):
         self.input.child_runtime = 0
         self.input.queue_limit_factor = 2
         self.input.maxtasksperchild = 1
+        self.input.run_in_process = False
         self._python_only_job = True
 
     @property
@@ -173,6 +300,38 @@ class WorkerJob(PythonTemplateJob):
     def child_runtime(self, time_in_sec):
         self.input.child_runtime = time_in_sec
 
+    @property
+    def run_in_process(self):
+        return self.input.run_in_process
+
+    @run_in_process.setter
+    def run_in_process(self, in_process):
+        self.input.run_in_process = bool(in_process)
+
+    def _get_pool(self, processes):
+        """
+        Create the processing pool which executes the jobs.
+
+        Args:
+            processes (int): number of processes
+
+        Returns:
+            multiprocessing.Pool, function: processing pool and the function to execute a job in the pool
+        """
+        # worker jobs stored before the in-process mode was introduced do not define run_in_process
+        if self.input.get("run_in_process", False):
+            pool = Pool(
+                processes=processes,
+                initializer=_initialize_in_process_worker,
+                maxtasksperchild=self.input.maxtasksperchild,
+            )
+            return pool, in_process_worker_function
+        else:
+            pool = Pool(
+                processes=processes, maxtasksperchild=self.input.maxtasksperchild
+            )
+            return pool, worker_function
+
     @property
     def sleep_interval(self):
         return self.input.sleep_interval
@@ -197,12 +356,18 @@ class WorkerJob(PythonTemplateJob):
         active_job_ids, res_lst = [], []
         process = psutil.Process(os.getpid())
         number_tasks = int(self.server.cores / self.cores_per_job)
-        with Pool(
-            processes=number_tasks, maxtasksperchild=self.input.maxtasksperchild
-        ) as pool:
+        job_table_cache = pr.get_job_table_cache(
+            max_age=max(60, 10 * self.input.sleep_interval)
+        )
+        backoff = AdaptiveSleep(
+            max_interval=self.input.sleep_interval,
+            wait_function=self.project.db.wait_for_job_status_change,
+        )
+        pool, function = self._get_pool(processes=number_tasks)
+        with pool:
             while True:
                 # Check the database if there are more calculation to execute
-                df = pr.job_table()
+                df = job_table_cache.job_table()
                 df_sub = df[
                     (df["status"] == "submitted")
                     & (df["masterid"] == master_id)
@@ -227,12 +392,14 @@ class WorkerJob(PythonTemplateJob):
                         for pp, p, job_id in path_lst
                     ]
                     active_job_ids += [j[1] for j in job_lst]
-                    result = pool.map_async(worker_function, job_lst)
+                    result = pool.map_async(function, job_lst)
                     res_lst.append([result, len(job_lst)])
+                    backoff.reset()
                 elif self.status.collect or self.status.aborted or self.status.finished:
                     if self.status.collect:
-                        while sum([i for r, i in res_lst if not r.ready()]) > 0:
-                            time.sleep(self.input.sleep_interval)
+                        while _wait_for_results(
+                            res_lst=res_lst, timeout=self.input.sleep_interval
+                        ):
                             if self.status.aborted or self.status.finished:
                                 break
                     break  # The infinite loop can be stopped by setting the job status to collect.
@@ -242,7 +409,7 @@ class WorkerJob(PythonTemplateJob):
                             (df["status"] == "running") & (df["masterid"] == master_id)
                         ]
                         if len(df_run) > 0:
-                            for job_id in df_run[
+                            job_id_lst = df_run[
                                 (
                                     np.array(datetime.now(), dtype="datetime64[ns]")
                                     - df_run.timestart.values
@@ -250,11 +417,13 @@ class WorkerJob(PythonTemplateJob):
                                 > np.array(self.input.child_runtime).astype(
                                     "timedelta64[s]"
                                 )
-                            ].id.values:
+                            ].id.values.tolist()
+                            if len(job_id_lst) > 0:
                                 self.project.db.set_job_status(
-                                    job_id=job_id, status="aborted"
+                                    job_id=job_id_lst, status="aborted"
                                 )
-                    time.sleep(self.input.sleep_interval)
+                    # wake up as soon as the status of a job changed, otherwise poll less frequently while idle
+                    backoff.sleep()
 
                 # job submission
                 with open(log_file, "a") as f:
@@ -289,15 +458,23 @@ class WorkerJob(PythonTemplateJob):
         file_memory_lst, res_lst = [], []
         process = psutil.Process(os.getpid())
         number_tasks = int(self.server.cores / self.cores_per_job)
-        with Pool(number_tasks) as pool:
+        backoff = AdaptiveSleep(max_interval=self.input.sleep_interval)
+        directory_mtime, h5_file_lst = None, []
+        pool, function = self._get_pool(processes=number_tasks)
+        with pool:
             while True:
-                file_lst = [
-                    os.path.join(working_directory, f)
-                    for f in os.listdir(working_directory)
-                    if f.endswith(".h5")
-                ]
-                file_vec = ~np.isin(file_lst, file_memory_lst)
-                file_lst = np.array(file_lst)[file_vec].tolist()
+                # the directory is only listed again when its modification time changed or is too recent to rule out
+                # files being added within the resolution of the file system timestamps
+                mtime = os.stat(working_directory).st_mtime
+                if mtime != directory_mtime or time.time() - mtime < 2:
+                    directory_mtime = mtime
+                    h5_file_lst = [
+                        os.path.join(working_directory, f)
+                        for f in os.listdir(working_directory)
+                        if f.endswith(".h5")
+                    ]
+                file_vec = ~np.isin(h5_file_lst, file_memory_lst)
+                file_lst = np.array(h5_file_lst)[file_vec].tolist()
                 if (
                     len(file_lst) > 0
                     and sum([i for r, i in res_lst if not r.ready()])
@@ -307,16 +484,18 @@ class WorkerJob(PythonTemplateJob):
                         self._get_working_directory_and_h5path(path=f) for f in file_lst
                     ]
                     file_memory_lst += file_lst
-                    result = pool.map_async(worker_function, job_submit_lst)
+                    result = pool.map_async(function, job_submit_lst)
                     res_lst.append([result, len(job_submit_lst)])
+                    backoff.reset()
                 elif self.project_hdf5["status"] in ["collect", "aborted", "finished"]:
                     if self.project_hdf5["status"] == "collect":
-                        while sum([i for r, i in res_lst if not r.ready()]) > 0:
-                            time.sleep(self.input.sleep_interval)
+                        while _wait_for_results(
+                            res_lst=res_lst, timeout=self.input.sleep_interval
+                        ):
                             if self.project_hdf5["status"] in ["aborted", "finished"]:
                                 break
                     break
-                time.sleep(self.input.sleep_interval)
+                backoff.sleep()
 
                 with open(log_file, "a") as f:
                     f.write(
@@ -352,8 +531,9 @@ class WorkerJob(PythonTemplateJob):
         else:
             pr = self.project.open(self.working_directory)
             master_id = None
+        job_table_cache = pr.get_job_table_cache(max_age=max(60, 10 * interval_in_s))
         while not finished:
-            df = pr.job_table()
+            df = job_table_cache.job_table()
             if master_id is not None:
                 df_sub = df[
                     ((df["status"] == "submitted") | (df.status == "running"))
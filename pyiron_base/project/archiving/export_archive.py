@@ -1,10 +1,15 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import io
 import os
 import numpy as np
-from shutil import copyfile, rmtree, copytree
+from shutil import copyfile
 from pyfileindex import PyFileIndex
 import tarfile
-import tempfile
+import time
 from pyiron_base.project.archiving.shared import getdir
+from pyiron_base.utils.compression import ParallelCompressionWriter
 
 
 def new_job_id(job_id, job_translate_dict):
@@ -38,27 +43,139 @@ def filter_function(file_name):
     return ".h5" in file_name
 
 
-def generate_list_of_directories(df_files, directory_to_transfer):
-    path_rel_lst = [
-        os.path.relpath(d, directory_to_transfer) for d in df_files.dirname.unique()
-    ]
-    dir_name_transfer = getdir(path=directory_to_transfer)
-    return [
-        (
-            os.path.join(archive_directory, dir_name_transfer, p)
-            if p != "."
-            else os.path.join(archive_directory, dir_name_transfer)
-        )
-        for p in path_rel_lst
-    ]
+def _get_file_hash(file_name, block_size=2**20):
+    file_hash = hashlib.sha256()
+    with open(file_name, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def _get_duplicate_dict(file_lst):
+    """
+    Find files with identical content.
+
+    Only files which share their size with another file are hashed.
+
+    Args:
+        file_lst (list): list of file paths
+
+    Returns:
+        dict: maps the path of each duplicated file to the path of the first file with the same content
+    """
+    size_dict = defaultdict(list)
+    for f in file_lst:
+        size_dict[os.path.getsize(f)].append(f)
+    duplicate_dict, hash_dict = {}, {}
+    for size, same_size_lst in size_dict.items():
+        if len(same_size_lst) < 2:
+            continue
+        for f in same_size_lst:
+            key = (size, _get_file_hash(f))
+            if key in hash_dict:
+                duplicate_dict[f] = hash_dict[key]
+            else:
+                hash_dict[key] = f
+    return duplicate_dict
+
+
+def get_file_lst(directory_to_transfer, copy_all_files=False):
+    if not copy_all_files:
+        pfi = PyFileIndex(path=directory_to_transfer, filter_function=filter_function)
+    else:
+        pfi = PyFileIndex(path=directory_to_transfer)
+    return sorted(pfi.dataframe[~pfi.dataframe.is_directory].path.values)
+
+
+def export_files_to_tar(
+    file_lst,
+    directory_to_transfer,
+    archive_file,
+    csv_content,
+    max_workers=None,
+    deduplicate=False,
+    compresslevel=6,
+):
+    """
+    Write the files directly into a gzip compressed tar archive, without copying them to a temporary directory first.
 
+    Args:
+        file_lst (list): files to archive
+        directory_to_transfer (str): project directory, the archive members are stored relative to it
+        archive_file (str): path of the archive file
+        csv_content (str): content of the export.csv file with the exported job table
+        max_workers (int): number of compression threads
+        deduplicate (bool): store files with identical content only once, the copies are stored as hard links
+        compresslevel (int): gzip compression level between 1 and 9
+    """
+    arcname_base = os.path.basename(directory_to_transfer)
+    duplicate_dict = _get_duplicate_dict(file_lst) if deduplicate else {}
+    arcname_dict = {}
+    with open(archive_file, "wb") as f:
+        with ParallelCompressionWriter(
+            f, codec="gz", compresslevel=compresslevel, max_workers=max_workers
+        ) as gz:
+            with tarfile.open(fileobj=gz, mode="w|") as tar:
+                # the project directory has to be the first member, see import_archive.prepare_path()
+                tar.add(directory_to_transfer, arcname=arcname_base, recursive=False)
+                directory_set = {"."}
+                for file_name in file_lst:
+                    rel_path = os.path.relpath(file_name, directory_to_transfer)
+                    rel_dir = os.path.dirname(rel_path)
+                    parent_lst = []
+                    while rel_dir not in directory_set and rel_dir != "":
+                        parent_lst.append(rel_dir)
+                        rel_dir = os.path.dirname(rel_dir)
+                    for rel_dir in reversed(parent_lst):
+                        tar.add(
+                            os.path.join(directory_to_transfer, rel_dir),
+                            arcname=os.path.join(arcname_base, rel_dir),
+                            recursive=False,
+                        )
+                        directory_set.add(rel_dir)
+                    arcname = os.path.join(arcname_base, rel_path)
+                    arcname_dict[file_name] = arcname
+                    if file_name in duplicate_dict:
+                        tarinfo = tar.gettarinfo(file_name, arcname=arcname)
+                        tarinfo.type = tarfile.LNKTYPE
+                        tarinfo.linkname = arcname_dict[duplicate_dict[file_name]]
+                        tarinfo.size = 0
+                        tar.addfile(tarinfo)
+                    else:
+                        tar.add(file_name, arcname=arcname, recursive=False)
+                csv_bytes = csv_content.encode()
+                tarinfo = tarfile.TarInfo(os.path.join(arcname_base, "export.csv"))
+                tarinfo.size = len(csv_bytes)
+                tarinfo.mtime = int(time.time())
+                tar.addfile(tarinfo, io.BytesIO(csv_bytes))
 
-def compress_dir(directory_to_transfer, archive_directory):
-    arch_comp_name = archive_directory + ".tar.gz"
-    with tarfile.open(arch_comp_name, "w:gz") as tar:
-        tar.add(archive_directory, arcname=os.path.basename(directory_to_transfer))
-    rmtree(archive_directory)
-    return arch_comp_name
+
+def export_files_to_directory(
+    file_lst, directory_to_transfer, archive_directory, max_workers=None
+):
+    """
+    Copy the files to the archive directory using multiple threads. The directory has the same layout as the
+    compressed archive, the files are stored in a sub directory named like the project directory.
+
+    Args:
+        file_lst (list): files to copy
+        directory_to_transfer (str): project directory, the files are copied relative to it
+        archive_directory (str): destination directory
+        max_workers (int): number of copy threads
+    """
+    target_directory = os.path.join(
+        archive_directory, os.path.basename(directory_to_transfer)
+    )
+    destination_lst = [
+        os.path.join(target_directory, os.path.relpath(f, directory_to_transfer))
+        for f in file_lst
+    ]
+    os.makedirs(target_directory)
+    for d in set(os.path.dirname(f) for f in destination_lst):
+        os.makedirs(d, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(copyfile, file_lst, destination_lst):
+            pass
 
 
 def copy_files_to_archive(
@@ -67,15 +184,26 @@ def copy_files_to_archive(
     archive_directory,
     compressed=True,
     copy_all_files=False,
+    max_workers=None,
+    deduplicate=False,
+    compresslevel=6,
+    csv_file_name=None,
 ):
     """
     Create an archive of jobs in directory_to_transfer.
 
+    The files are streamed directly into the archive and compressed in parallel, so no temporary copy of the project is
+    created.
+
     Args:
         directory_to_transfer (str): project directory with jobs to export
         archive_directory (str): name of the final archive; if no file ending is given .tar.gz is added automatically when needed
         compressed (bool): if True compress archive_directory as a tarball; default True
         copy_all_files (bool): if True include job output files in archive, otherwise just include .h5 files; default False
+        max_workers (int): number of threads used to compress or copy the files; defaults to the number of CPU cores
+        deduplicate (bool): store files with identical content only once in a compressed archive; default False
+        compresslevel (int): gzip compression level between 1 and 9; default 6
+        csv_file_name (str): if given, the exported job table is additionally written to this csv file
     """
     if archive_directory[-7:] == ".tar.gz":
         archive_directory = archive_directory[:-7]
@@ -85,60 +213,39 @@ def copy_files_to_archive(
     directory_to_transfer = os.path.normpath(directory_to_transfer)
     archive_directory = os.path.normpath(archive_directory)
 
-    tempdir = export_files(
-        directory_to_transfer, compressed, copy_all_files=copy_all_files
-    )
-    df = export_database(project, directory_to_transfer, archive_directory)
-    csv_file_name = os.path.join(tempdir.name, "export.csv")
-    df.to_csv(csv_file_name)
+    file_lst = get_file_lst(directory_to_transfer, copy_all_files=copy_all_files)
+    # the files are archived below the name of the project directory, so the project names in the job table are kept
+    df = export_database(project, directory_to_transfer, directory_to_transfer)
+    if csv_file_name is not None:
+        df.to_csv(csv_file_name)
 
     if compressed:
-        archived_file = compress_dir(directory_to_transfer, tempdir.name)
-        copyfile(
-            archived_file,
-            os.path.join(
-                os.path.dirname(os.path.abspath(archive_directory)),
-                f"{os.path.basename(directory_to_transfer)}.tar.gz",
-            ),
+        export_files_to_tar(
+            file_lst=file_lst,
+            directory_to_transfer=directory_to_transfer,
+            archive_file=archive_directory + ".tar.gz",
+            csv_content=df.to_csv(),
+            max_workers=max_workers,
+            deduplicate=deduplicate,
+            compresslevel=compresslevel,
         )
     else:
         if os.path.exists(archive_directory):
             raise ValueError("Folder exists, give different name or allow compression")
-        # now copy the whole set of folders
-        copytree(tempdir.name, archive_directory)
-
-
-def export_files(directory_to_transfer, compressed, copy_all_files=False):
-    if not copy_all_files:
-        pfi = PyFileIndex(path=directory_to_transfer, filter_function=filter_function)
-    else:
-        pfi = PyFileIndex(path=directory_to_transfer)
-    df_files = pfi.dataframe[~pfi.dataframe.is_directory]
-
-    # create a temporary folder for archiving
-    tempdir = tempfile.TemporaryDirectory()
-
-    # Create directories
-    dir_lst = generate_list_of_directories(
-        df_files=df_files, directory_to_transfer=directory_to_transfer
-    )
-
-    # now make these directories
-    for d in dir_lst:
-        os.makedirs(d.replace(directory_to_transfer, tempdir.name), exist_ok=True)
-
-    # copy files
-    for f in df_files.path.values:
-        copyfile(
-            f,
+        export_files_to_directory(
+            file_lst=file_lst,
+            directory_to_transfer=directory_to_transfer,
+            archive_directory=archive_directory,
+            max_workers=max_workers,
+        )
+        df.to_csv(
             os.path.join(
-                tempdir.name,
-                os.path.relpath(f, directory_to_transfer),
-            ),
+                archive_directory,
+                os.path.basename(directory_to_transfer),
+                "export.csv",
+            )
         )
 
-    return tempdir
-
 
 def export_database(pr, directory_to_transfer, archive_directory):
     # here we first check wether the archive directory is a path
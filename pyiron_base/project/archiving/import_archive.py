@@ -1,4 +1,6 @@
+from collections import defaultdict
 import os
+from shutil import copyfile
 import pandas
 import numpy as np
 import tarfile
@@ -17,9 +19,22 @@ def update_id_lst(record_lst, job_id_lst):
 
 
 def extract_archive(archive_directory):
+    """
+    Extract the archive in a single pass over the members. Members stored as hard links by a deduplicated export are
+    extracted as independent copies, so modifying one imported file does not change the others. The archive is not
+    opened in stream mode, as the streaming gzip reader of tarfile stops after the first of the independently
+    compressed blocks written by the export.
+
+    Args:
+        archive_directory (str): path of the archive without the .tar.gz extension
+    """
     arch_comp_name = archive_directory + ".tar.gz"
     with tarfile.open(arch_comp_name, "r:gz") as tar:
-        tar.extractall()
+        for member in tar:
+            if member.islnk():
+                copyfile(member.linkname, member.name)
+            else:
+                tar.extract(member)
 
 
 def import_jobs_to_new_project(cls, archive_directory, compressed=True):
@@ -56,13 +71,15 @@ def import_jobs(pr, archive_directory):
     csv_file_name = os.path.join(pr.path, "export.csv")
     df = pandas.read_csv(csv_file_name, index_col=0)
     df["project"] = [
-        os.path.join(pr.project_path, os.path.relpath(p, pr.project_path)) + "/"
+        os.path.normpath(
+            os.path.join(pr.project_path, os.path.relpath(p, pr.project_path))
+        )
+        + "/"
         for p in df["project"].values
     ]
     df["projectpath"] = len(df) * [pr.root_path]
     # Add jobs to database
-    job_id_lst = []
-
+    par_dict_lst = []
     for entry in df.dropna(axis=1).to_dict(orient="records"):
         if "id" in entry:
             del entry["id"]
@@ -76,17 +93,19 @@ def import_jobs(pr, archive_directory):
             entry["timestop"] = pandas.to_datetime(entry["timestop"])
         if "username" not in entry:
             entry["username"] = state.settings.login_user
-        job_id = pr.db.add_item_dict(par_dict=entry)
-        job_id_lst.append(job_id)
+        par_dict_lst.append(entry)
+    job_id_lst = pr.db.add_items_dicts(par_dict_lst=par_dict_lst)
 
-    # print(job_id_lst)
-    # Update parent and master ids
+    # Update parent and master ids, jobs sharing the same master and parent are updated together
+    update_dict = defaultdict(list)
     for job_id, masterid, parentid in zip(
         job_id_lst,
         update_id_lst(record_lst=df["masterid"].values, job_id_lst=job_id_lst),
         update_id_lst(record_lst=df["parentid"].values, job_id_lst=job_id_lst),
     ):
         if masterid is not None or parentid is not None:
-            pr.db.item_update(
-                item_id=job_id, par_dict={"parentid": parentid, "masterid": masterid}
-            )
+            update_dict[(masterid, parentid)].append(job_id)
+    for (masterid, parentid), item_id_lst in update_dict.items():
+        pr.db.item_update(
+            item_id=item_id_lst, par_dict={"parentid": parentid, "masterid": masterid}
+        )
@@ -7,6 +7,7 @@ The project object is the central import point of pyiron - all other objects can
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 import posixpath
 import shutil
@@ -25,6 +26,7 @@ from pyiron_base.database.jobtable import (
     get_child_ids,
     get_job_working_directory,
     get_job_status,
+    get_job_table_cache,
 )
 from pyiron_base.storage.hdfio import ProjectHDFio
 from pyiron_base.utils.deprecate import deprecate
@@ -218,7 +220,8 @@ class Project(ProjectPath, HasGroups):
     @property
     def size(self):
         """
-        Get the size of the project
+        Get the size of the project, the size of each directory is cached and only directories which changed since
+        the last call are scanned again.
         """
         from pyiron_base.project.size import get_folder_size
 
@@ -714,18 +717,21 @@ class Project(ProjectPath, HasGroups):
         recursive: bool = True,
         convert_to_object: bool = True,
         progress: bool = True,
+        lazy: bool = False,
         **kwargs: dict,
     ) -> Generator:
         """
         Iterate over the jobs within the current project and it is sub projects
 
         Args:
-            path (str): HDF5 path inside each job object. (Default is None, which just uses the top level of the job's
-                HDF5 path.)
+            path (str/list): HDF5 path inside each job object, or a list of HDF5 paths which are read at once and
+                returned as dictionary. (Default is None, which just uses the top level of the job's HDF5 path.)
             recursive (bool): search subprojects. (Default is True.)
             convert_to_object (bool): load the full GenericJob object, else just return the HDF5 / JobCore object.
                                      (Default is True, convert everything to the full python object.)
             progress (bool): add an interactive progress bar to the iteration. (Default is True, show the bar.)
+            lazy (bool): when converting to objects only read the input, output, server and executable of the jobs
+                         when they are accessed. (Default is False, read the complete jobs.)
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
                             instances of any character
@@ -736,7 +742,7 @@ class Project(ProjectPath, HasGroups):
         Note:
             The default behavior of converting to object can cause **significant** slowdown in larger projects. In this
             case, you may seriously wish to consider setting `convert_to_object=False` and access only the HDF5/JobCore
-            representation of the jobs instead.
+            representation of the jobs instead, or `lazy=True` to only read the parts of the jobs which are accessed.
         """
         job_table = self.job_table(recursive=recursive, **kwargs)
         if not isinstance(self.db, FileTable):
@@ -763,7 +769,13 @@ class Project(ProjectPath, HasGroups):
         if progress:
             job_lst = tqdm(job_lst)
         for job_id, db_entry in job_lst:
-            if path is not None:
+            if isinstance(path, (list, tuple)):
+                yield self.load_from_jobpath(
+                    job_id=job_id,
+                    db_entry=db_entry,
+                    convert_to_object=False,
+                ).get_many(path)
+            elif path is not None:
                 yield self.load_from_jobpath(
                     job_id=job_id,
                     db_entry=db_entry,
@@ -774,6 +786,7 @@ class Project(ProjectPath, HasGroups):
                     job_id=job_id,
                     db_entry=db_entry,
                     convert_to_object=convert_to_object,
+                    lazy=lazy,
                 )
 
     def iter_output(self, recursive=True):
@@ -886,6 +899,32 @@ class Project(ProjectPath, HasGroups):
         ]
     )
 
+    def get_job_table_cache(self, recursive=True, max_age=60):
+        """
+        Get the in-process cache of the job table of the project, which only queries the new jobs and the jobs which
+        are not yet in a final status from the database. This is intended for frequent polling of the job table, for
+        example by a worker job.
+
+        >>> cache = pr.get_job_table_cache(max_age=600)
+        >>> df = cache.job_table()
+        >>> cache.invalidate()  # query the complete job table on the next call
+
+        Args:
+            recursive (bool): search subprojects [True/False] - default=True
+            max_age (float): time in seconds after which the complete job table is queried again - default=60
+
+        Returns:
+            pyiron_base.database.jobtable.JobTableCache: job table cache shared by all projects with the same path
+        """
+        return get_job_table_cache(
+            database=self.db,
+            sql_query=self.sql_query,
+            user=self.user,
+            project_path=self.project_path,
+            recursive=recursive,
+            max_age=max_age,
+        )
+
     def get_jobs_status(self, recursive=True, **kwargs):
         """
         Gives a overview of all jobs status.
@@ -989,7 +1028,9 @@ class Project(ProjectPath, HasGroups):
     def load(self):
         return self._loader
 
-    def load_from_jobpath(self, job_id=None, db_entry=None, convert_to_object=True):
+    def load_from_jobpath(
+        self, job_id=None, db_entry=None, convert_to_object=True, lazy=False
+    ):
         """
         Internal function to load an existing job either based on the job ID or based on the database entry dictionary.
 
@@ -999,6 +1040,8 @@ class Project(ProjectPath, HasGroups):
             convert_to_object (bool): convert the object to an pyiron object or only access the HDF5 file - default=True
                                       accessing only the HDF5 file is about an order of magnitude faster, but only
                                       provides limited functionality. Compare the GenericJob object to JobCore object.
+            lazy (bool): only read the input, output, server and executable of the pyiron object when they are
+                         accessed - default=False
 
         Returns:
             GenericJob, JobCore: Either the full GenericJob object or just a reduced JobCore object
@@ -1008,14 +1051,14 @@ class Project(ProjectPath, HasGroups):
         if job_id is not None:
             job = JobPath.from_job_id(db=self.db, job_id=job_id)
             if convert_to_object:
-                job = job.to_object()
+                job = job.to_object(lazy=lazy)
                 job.reset_job_id(job_id=job_id)
                 job.set_input_to_read_only()
             return job
         elif db_entry is not None:
             job = JobPath.from_db_entry(db_entry)
             if convert_to_object:
-                job = job.to_object()
+                job = job.to_object(lazy=lazy)
                 job.set_input_to_read_only()
             return job
         else:
@@ -1153,6 +1196,7 @@ class Project(ProjectPath, HasGroups):
             df = self.job_table()
             jobs = df[df.status.isin(by_status)].id
         if self.db is not None:
+            aborted_job_id_lst = []
             for job_specifier in jobs:
                 if isinstance(job_specifier, str):
                     job_id = get_job_id(
@@ -1164,7 +1208,10 @@ class Project(ProjectPath, HasGroups):
                     )
                 else:
                     job_id = job_specifier
-                self.refresh_job_status_based_on_job_id(job_id)
+                if self._job_is_lost(job_id=job_id):
+                    aborted_job_id_lst.append(int(job_id))
+            if len(aborted_job_id_lst) > 0:
+                self.db.set_job_status(job_id=aborted_job_id_lst, status="aborted")
         else:
             raise ValueError("Must have established database connection!")
 
@@ -1191,22 +1238,42 @@ class Project(ProjectPath, HasGroups):
             que_mode (bool): [True/False] - default=True
         """
         if job_id and self.db is not None:
-            if (
-                not que_mode
-                and self.db.get_item_by_id(job_id)["status"] not in ["finished"]
-            ) or (
-                que_mode
-                and self.db.get_item_by_id(job_id)["status"] in ["running", "submitted"]
-            ):
-                job = self.inspect(job_id)
-                # a job can be in status running or submitted without being on
-                # the queue, if the run mode is worker or non_modal.  In this
-                # case we do not want to check the queue status, so we just
-                # short circuit here.
-                if job["server"]["run_mode"] in ["worker", "non_modal"]:
-                    return
-                if not self.queue_check_job_is_waiting_or_running(job):
-                    self.db.set_job_status(job_id=job_id, status="aborted")
+            if self._job_is_lost(job_id=job_id, que_mode=que_mode):
+                self.db.set_job_status(job_id=job_id, status="aborted")
+
+    def _job_is_lost(self, job_id, que_mode=True):
+        """
+        Internal function to check if a job is still listed 'running' in the job_table while it is no longer listed in
+        the queuing system.
+
+        Args:
+            job_id (int): job ID
+            que_mode (bool): [True/False] - default=True
+
+        Returns:
+            bool: True if the status of the job should be set to 'aborted'
+        """
+        if not job_id or self.db is None:
+            return False
+        status = self.db.get_item_by_id(job_id)["status"]
+        if (not que_mode and status not in ["finished"]) or (
+            que_mode and status in ["running", "submitted"]
+        ):
+            job = self.inspect(job_id)
+            # a job can be in status running or submitted without being on
+            # the queue, if the run mode is worker or non_modal.  In this
+            # case we do not want to check the queue status, so we just
+            # short circuit here.
+            try:
+                run_mode = job["server"]["run_mode"]
+            except BlockingIOError:
+                # the HDF5 file is locked by the process which is currently
+                # writing to it, so the job is not lost
+                return False
+            if run_mode in ["worker", "non_modal"]:
+                return False
+            return not self.queue_check_job_is_waiting_or_running(job)
+        return False
 
     def _refresh_job_status_file_table(self, df):
         """
@@ -1329,17 +1396,29 @@ class Project(ProjectPath, HasGroups):
     def remove_jobs_silently(self, recursive=False, progress=True):
         self.remove_jobs(recursive=recursive, progress=progress, silently=True)
 
-    def compress_jobs(self, recursive=False):
+    def compress_jobs(self, recursive=False, parallel=None):
         """
         Compress all finished jobs in the current project and in all subprojects if recursive=True is selected.
 
         Args:
             recursive (bool): [True/False] compress all jobs in all subprojects - default=False
+            parallel (int): number of jobs which are compressed at the same time, every job is then compressed with
+                            a single thread - default=None compresses one job after another using all cores
         """
-        for job_id in self.get_job_ids(recursive=recursive):
-            job = self.inspect(job_id)
-            if job.status == "finished":
+        job_lst = [
+            job
+            for job in [
+                self.inspect(job_id) for job_id in self.get_job_ids(recursive=recursive)
+            ]
+            if job.status == "finished" and not job.is_compressed()
+        ]
+        if parallel is None or parallel == 1:
+            for job in job_lst:
                 job.compress()
+        else:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for _ in executor.map(lambda job: job.compress(max_workers=1), job_lst):
+                    pass
 
     def delete_output_files_jobs(self, recursive=False):
         """
@@ -1834,6 +1913,8 @@ class Project(ProjectPath, HasGroups):
         csv_file_name="export.csv",
         compress=True,
         copy_all_files=False,
+        max_workers=None,
+        deduplicate=False,
     ):
         """
         Export job table to a csv file and copy (and optionally compress) the project directory.
@@ -1843,6 +1924,8 @@ class Project(ProjectPath, HasGroups):
             csv_file_name (str): is the name of the csv file used to store the project table.
             compress (bool): if true, the function will compress the destination_path to a tar.gz file.
             copy_all_files (bool):
+            max_workers (int): number of threads used to compress or copy the files, defaults to the number of cores
+            deduplicate (bool): store files with identical content only once in the compressed archive
         """
         directory_to_transfer = os.path.basename(self.path[:-1])
         if destination_path is None:
@@ -1853,6 +1936,9 @@ class Project(ProjectPath, HasGroups):
             destination_path,
             compressed=compress,
             copy_all_files=copy_all_files,
+            max_workers=max_workers,
+            deduplicate=deduplicate,
+            csv_file_name=csv_file_name,
         )
 
     def _unpack(self, origin_path):
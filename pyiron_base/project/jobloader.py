@@ -54,7 +54,7 @@ class _JobByAttribute(ABC):
     def __getitem__(self, item):
         return self.__getattr__(item)
 
-    def __call__(self, job_specifier, convert_to_object=None):
+    def __call__(self, job_specifier, convert_to_object=None, lazy=False):
         if self._project.sql_query is not None:
             state.logger.warning(
                 f"SQL filter '{self._project.sql_query}' is active (may exclude job)"
@@ -80,6 +80,7 @@ class _JobByAttribute(ABC):
                 if convert_to_object is not None
                 else self.convert_to_object
             ),
+            lazy=lazy,
         )
 
     @property
@@ -94,6 +95,8 @@ class JobLoader(_JobByAttribute):
 
     Args:
         job_specifier (str, int): name of the job or job ID
+        convert_to_object (bool): convert the object to an pyiron object or only access the HDF5 file
+        lazy (bool): only read the input, output, server and executable of the job when they are accessed
 
     Returns:
         GenericJob, JobCore: Either the full GenericJob object or just a reduced JobCore object
@@ -101,8 +104,10 @@ class JobLoader(_JobByAttribute):
 
     convert_to_object = True
 
-    def __call__(self, job_specifier, convert_to_object=None) -> GenericJob:
-        return super().__call__(job_specifier, convert_to_object=convert_to_object)
+    def __call__(self, job_specifier, convert_to_object=None, lazy=False) -> GenericJob:
+        return super().__call__(
+            job_specifier, convert_to_object=convert_to_object, lazy=lazy
+        )
 
 
 class JobInspector(_JobByAttribute):
@@ -1,17 +1,20 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import importlib
 import os
 import pkgutil
 import warnings
 import sys
 
+import h5py
 import pandas
+from tqdm.auto import tqdm
 
 from pyiron_base import state
 from pyiron_base.database.performance import get_database_statistics
 import pyiron_base.storage.hdfio
+from pyiron_base.storage.hdfpool import hdf_file_pool
 from pyiron_base.project.update.pyiron_base_03x_to_04x import pyiron_base_03x_to_04x
 
-
 # we sometimes move classes between modules; this would break HDF storage,
 # since objects save there the module path from which their classes can be
 # imported.  We can work around this by defining here an explicit map that
@@ -45,6 +48,162 @@ def add_module_conversion(old: str, new: str):
         )
 
 
+def _get_object_size(item):
+    """
+    Get the size of an HDF5 object in the file, including its header, attributes and the data of a dataset.
+
+    Args:
+        item (h5py.Group/h5py.Dataset): HDF5 object
+
+    Returns:
+        int: size in bytes
+    """
+    info = h5py.h5o.get_info(item.id)
+    size = (
+        info.hdr.space.total
+        + info.meta_size.obj.index_size
+        + info.meta_size.obj.heap_size
+        + info.meta_size.attr.index_size
+        + info.meta_size.attr.heap_size
+    )
+    if isinstance(item, h5py.Dataset):
+        size += item.id.get_storage_size()
+    return size
+
+
+def _get_free_space_ratio(hdf):
+    """
+    Estimate the fraction of an HDF5 file which is not used by any object, so it can be reclaimed by repacking.
+
+    Args:
+        hdf (h5py.File): open HDF5 file
+
+    Returns:
+        float: estimated free space ratio
+    """
+    size_lst = [_get_object_size(item=hdf)]
+    hdf.visititems(lambda name, item: size_lst.append(_get_object_size(item=item)))
+    file_size = os.path.getsize(hdf.filename)
+    if file_size == 0:
+        return 0.0
+    return max(file_size - sum(size_lst), 0) / file_size
+
+
+def _is_compressible(item, compression, compression_opts, compression_min_size):
+    return (
+        isinstance(item, h5py.Dataset)
+        and item.ndim > 0
+        and item.dtype.kind in "biufc"
+        and item.nbytes >= compression_min_size
+        and (
+            item.compression != compression
+            or (
+                compression_opts is not None
+                and item.compression_opts != compression_opts
+            )
+        )
+    )
+
+
+def _copy_attributes(source, destination):
+    for key in source.attrs.keys():
+        destination.attrs.create(
+            key, source.attrs[key], dtype=source.attrs.get_id(key).dtype
+        )
+
+
+def _copy_compressed_dataset(
+    source, destination, name, compression, compression_opts, slab_size=2**26
+):
+    dataset = destination.create_dataset(
+        name,
+        shape=source.shape,
+        dtype=source.dtype,
+        maxshape=source.maxshape,
+        chunks=source.chunks if source.chunks is not None else True,
+        compression=compression,
+        compression_opts=compression_opts,
+    )
+    # copy in slabs along the first axis to keep the memory footprint bounded for large datasets
+    row_size = max(source.nbytes // max(source.shape[0], 1), 1)
+    rows = max(slab_size // row_size, 1)
+    for start in range(0, source.shape[0], rows):
+        dataset[start : start + rows] = source[start : start + rows]
+    _copy_attributes(source=source, destination=dataset)
+
+
+def _copy_hdf5_group(
+    source, destination, compression, compression_opts, compression_min_size
+):
+    """
+    Copy the content of an HDF5 group with the object copy of h5py. Without compression every child is copied
+    including its whole sub tree, otherwise the groups are traversed to compress the large numerical datasets.
+    """
+    _copy_attributes(source=source, destination=destination)
+    for name, item in source.items():
+        if compression is not None and isinstance(item, h5py.Group):
+            _copy_hdf5_group(
+                source=item,
+                destination=destination.create_group(name),
+                compression=compression,
+                compression_opts=compression_opts,
+                compression_min_size=compression_min_size,
+            )
+        elif compression is not None and _is_compressible(
+            item=item,
+            compression=compression,
+            compression_opts=compression_opts,
+            compression_min_size=compression_min_size,
+        ):
+            _copy_compressed_dataset(
+                source=item,
+                destination=destination,
+                name=name,
+                compression=compression,
+                compression_opts=compression_opts,
+            )
+        else:
+            source.copy(item, destination, name=name)
+
+
+def _repack_hdf5_file(
+    file_name,
+    min_free_ratio=0.0,
+    compression=None,
+    compression_opts=None,
+    compression_min_size=2**20,
+):
+    """
+    Repack a single HDF5 file by copying all objects to a new file, which then replaces the original one.
+
+    Args:
+        file_name (str): path of the HDF5 file
+        min_free_ratio (float): skip the file if the estimated free space ratio is below this threshold
+        compression (str/None): compression filter for large numerical datasets, e.g. "gzip" or "lzf", datasets
+            written with a different filter are recompressed
+        compression_opts (int/None): options of the compression filter, e.g. the gzip level
+        compression_min_size (int): minimal size in bytes of the datasets to be compressed
+
+    Returns:
+        tuple: file size before and after repacking and whether the file was repacked
+    """
+    size_before = os.path.getsize(file_name)
+    new_file_name = file_name + "_repack"
+    with h5py.File(file_name, "r") as hdf_old:
+        if min_free_ratio > 0 and _get_free_space_ratio(hdf=hdf_old) < min_free_ratio:
+            return size_before, size_before, False
+        with h5py.File(new_file_name, "w", libver=hdf_old.libver) as hdf_new:
+            _copy_hdf5_group(
+                source=hdf_old,
+                destination=hdf_new,
+                compression=compression,
+                compression_opts=compression_opts,
+                compression_min_size=compression_min_size,
+            )
+    os.replace(new_file_name, file_name)
+    return size_before, os.path.getsize(file_name), True
+
+
 class Maintenance:
     """
     The purpose of maintenance class is to provide
@@ -119,6 +278,11 @@ class LocalMaintenance:
         self,
         recursive: bool = True,
         progress: bool = True,
+        max_workers: int = None,
+        min_free_ratio: float = 0.0,
+        compression: str = None,
+        compression_opts: int = None,
+        compression_min_size: int = 2**20,
         **kwargs: dict,
     ):
         """
@@ -127,18 +291,85 @@ class LocalMaintenance:
         By default iterate recursively over the jobs within the current
         project.  This can be controlled with `recursive` and `kwargs`.
 
+        The files are repacked in a process pool with the object copy of
+        h5py, so the data is copied inside the HDF5 library rather than read
+        into python node by node.  Files with an estimated free space ratio
+        below `min_free_ratio` are skipped.
+
         Args:
             recursive (bool): search subprojects [True/False] - True by default
             progress (bool): if True (default), add an interactive progress bar to the iteration
+            max_workers (int): number of processes repacking files in parallel, defaults to the number of CPU cores
+            min_free_ratio (float): skip files with an estimated free space ratio below this threshold - 0.0 by
+                                    default, which repacks all files
+            compression (str): compression filter applied to large numerical datasets, e.g. "gzip" or "lzf" - None
+                               by default, which keeps the filters of the datasets
+            compression_opts (int): options of the compression filter, e.g. the gzip level
+            compression_min_size (int): minimal size in bytes of the datasets to be compressed - 1 MiB by default
             **kwargs (dict): Optional arguments for filtering with keys matching the project database column name
                             (eg. status="finished"). Asterisk can be used to denote a wildcard, for zero or more
                             instances of any character
+
+        Returns:
+            pandas.DataFrame: file size before and after repacking and the bytes reclaimed for each job
         """
+        file_dict = {}
         for job in self._project.iter_jobs(
-            recursive=recursive, progress=progress, convert_to_object=False, **kwargs
+            recursive=recursive, progress=False, convert_to_object=False, **kwargs
         ):
-            hdf = job.project_hdf5
-            hdf.rewrite_hdf5(job.name)
+            file_name = job.project_hdf5.file_name
+            if file_name not in file_dict and os.path.exists(file_name):
+                file_dict[file_name] = (job.job_id, job.job_name)
+                hdf_file_pool.release(file_name)
+        repack_kwargs = {
+            "min_free_ratio": min_free_ratio,
+            "compression": compression,
+            "compression_opts": compression_opts,
+            "compression_min_size": compression_min_size,
+        }
+        result_dict = {}
+        if max_workers == 1 or len(file_dict) < 2:
+            file_lst = tqdm(file_dict.keys()) if progress else file_dict.keys()
+            for file_name in file_lst:
+                result_dict[file_name] = _repack_hdf5_file(
+                    file_name=file_name, **repack_kwargs
+                )
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                future_dict = {
+                    executor.submit(
+                        _repack_hdf5_file, file_name=file_name, **repack_kwargs
+                    ): file_name
+                    for file_name in file_dict.keys()
+                }
+                future_lst = as_completed(future_dict)
+                if progress:
+                    future_lst = tqdm(future_lst, total=len(future_dict))
+                for future in future_lst:
+                    result_dict[future_dict[future]] = future.result()
+        return pandas.DataFrame(
+            [
+                {
+                    "id": job_id,
+                    "job": job_name,
+                    "file": file_name,
+                    "size_before": result_dict[file_name][0],
+                    "size_after": result_dict[file_name][1],
+                    "reclaimed": result_dict[file_name][0] - result_dict[file_name][1],
+                    "repacked": result_dict[file_name][2],
+                }
+                for file_name, (job_id, job_name) in file_dict.items()
+            ],
+            columns=[
+                "id",
+                "job",
+                "file",
+                "size_before",
+                "size_after",
+                "reclaimed",
+                "repacked",
+            ],
+        )
 
     def update_hdf_types(
         self,
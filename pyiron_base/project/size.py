@@ -1,9 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import math
 import os
-import pint
+import time
 
 
-def _size_conversion(size: pint.Quantity):
+@lru_cache(maxsize=None)
+def _get_unit_registry():
+    # pint is only imported and the registry only constructed once, both take a noticeable fraction of a second
+    import pint
+
+    return pint.UnitRegistry()
+
+
+def _size_conversion(size: "pint.Quantity"):
     sign_prefactor = 1
     if size < 0:
         sign_prefactor = -1
@@ -23,14 +33,150 @@ def _size_conversion(size: pint.Quantity):
         return size.to(f"{prefix[-1]}byte")
 
 
-def get_folder_size(path):
-    size = (
-        sum(
-            [
-                sum([os.path.getsize(os.path.join(path, f)) for f in files])
-                for path, dirs, files in os.walk(path)
-            ]
+class _DirectoryEntry:
+    __slots__ = ("mtime_ns", "file_size", "subdirectory_lst", "racy")
+
+    def __init__(self, mtime_ns, file_size, subdirectory_lst, racy=False):
+        self.mtime_ns = mtime_ns
+        self.file_size = file_size
+        self.subdirectory_lst = subdirectory_lst
+        self.racy = racy
+
+
+class FolderSizeCache:
+    """
+    Cache of the total size of the files in each directory, which is refreshed based on the modification time of the
+    directories.
+
+    Creating, removing or renaming a file changes the modification time of its directory, so only the directories with
+    a new modification time are scanned again, for all other directories a single stat call is sufficient. Files which
+    grow in place do not change the modification time of their directory, so the directories of a job are invalidated
+    explicitly when the job is saved, finished, compressed or removed. Directories which were modified in the last
+    seconds are always scanned again, as a modification within the resolution of the file system time stamp would be
+    missed.
+    """
+
+    def __init__(self, racy_seconds=2.0):
+        self._directory_dict = {}
+        self._racy_ns = int(racy_seconds * 1e9)
+
+    def __len__(self):
+        return len(self._directory_dict)
+
+    def invalidate(self, path, recursive=False):
+        """
+        Remove a directory from the cache, so it is scanned again the next time.
+
+        Args:
+            path (str): directory to invalidate
+            recursive (bool): invalidate all cached sub directories as well
+        """
+        entry = self._directory_dict.pop(os.path.abspath(path), None)
+        if recursive and entry is not None:
+            for subdirectory in entry.subdirectory_lst:
+                self.invalidate(path=subdirectory, recursive=True)
+
+    def clear(self):
+        """
+        Remove all directories from the cache.
+        """
+        self._directory_dict.clear()
+
+    def get_size(self, path, max_workers=None):
+        """
+        Get the total size of all files in a directory and its sub directories.
+
+        The directory tree is traversed level by level and the directories of each level are scanned in parallel, as
+        os.scandir() and os.stat() release the GIL.
+
+        Args:
+            path (str): directory
+            max_workers (int): number of threads scanning directories, defaults to the ThreadPoolExecutor default
+
+        Returns:
+            int: size in bytes
+        """
+        size = 0
+        directory_lst = [os.path.abspath(path)]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(directory_lst) > 0:
+                next_directory_lst = []
+                for entry in executor.map(self._get_entry, directory_lst):
+                    if entry is not None:
+                        size += entry.file_size
+                        next_directory_lst += entry.subdirectory_lst
+                directory_lst = next_directory_lst
+        return size
+
+    def _get_entry(self, path):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._directory_dict.pop(path, None)
+            return None
+        entry = self._directory_dict.get(path)
+        if entry is not None and not entry.racy and entry.mtime_ns == mtime_ns:
+            return entry
+        entry = self._scan_directory(path=path, mtime_ns=mtime_ns)
+        if entry is not None:
+            entry.racy = time.time_ns() - mtime_ns <= self._racy_ns
+            self._directory_dict[path] = entry
+        else:
+            self._directory_dict.pop(path, None)
+        return entry
+
+    @staticmethod
+    def _scan_directory(path, mtime_ns):
+        file_size, subdirectory_lst = 0, []
+        try:
+            with os.scandir(path) as it:
+                for dir_entry in it:
+                    try:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            subdirectory_lst.append(dir_entry.path)
+                        elif not dir_entry.is_dir():
+                            # symbolic links to directories are not followed, like in os.walk()
+                            file_size += dir_entry.stat().st_size
+                    except FileNotFoundError:
+                        # removed while scanning or a broken symbolic link
+                        pass
+        except FileNotFoundError:
+            return None
+        return _DirectoryEntry(
+            mtime_ns=mtime_ns, file_size=file_size, subdirectory_lst=subdirectory_lst
         )
-        * pint.UnitRegistry().byte
+
+
+folder_size_cache = FolderSizeCache()
+
+
+def invalidate_job_size(job):
+    """
+    Invalidate the cached size of the directories of a job, the directory of its HDF5 file and its working directory.
+
+    Args:
+        job (JobCore): job object
+    """
+    folder_size_cache.invalidate(path=job.project_hdf5.file_path)
+    folder_size_cache.invalidate(
+        path=job.project_hdf5.working_directory, recursive=True
     )
-    return _size_conversion(size)
+
+
+def get_folder_size(path, use_cache=True, max_workers=None):
+    """
+    Get the total size of all files in a directory and its sub directories.
+
+    Args:
+        path (str): directory
+        use_cache (bool): only scan the directories which changed since the last call - default=True
+        max_workers (int): number of threads scanning directories, defaults to the ThreadPoolExecutor default
+
+    Returns:
+        pint.Quantity: size with a binary prefix
+    """
+    if use_cache:
+        size = folder_size_cache.get_size(path=path, max_workers=max_workers)
+    else:
+        size = FolderSizeCache().get_size(path=path, max_workers=max_workers)
+    return _size_conversion(size * _get_unit_registry().byte)
@@ -95,6 +95,23 @@ class Settings(metaclass=Singleton):
             the working directory warning files to inform users about possibly modified content. (Default is True).
         config_file_permissions_warning / CONFIG_FILE_PERMISSIONS_WARNING / PYIRONCONFIGFILEPERMISSIONSWARNING (bool):
             Whether to print a warning message, when the permission of the .pyiron config file, let others access it.
+        hdf_file_pool_size / HDF_FILE_POOL_SIZE / PYIRONHDFFILEPOOLSIZE (int): Maximum number of HDF5 file handles
+            which are kept open for reading and reused across the process. (Default is 0, which disables the pool.)
+        sql_pool_size / SQL_POOL_SIZE / PYIRONSQLPOOLSIZE (int): Number of connections to a Postgres or MySQL database
+            which are kept open and shared by all database objects of the process. (Default is 0, which disables the
+            pool and opens a new connection after the connection timeout.)
+        sql_pool_recycle / SQL_POOL_RECYCLE / PYIRONSQLPOOLRECYCLE (int): Time in seconds after which a connection in
+            the pool is replaced by a new one. (Default is 3600.)
+        job_compression / JOB_COMPRESSION / PYIRONJOBCOMPRESSION ("tar"|"gz"|"bz2"|"xz"): Compression codec used to
+            compress the working directory and to archive the HDF5 file of a job. (Default is "bz2".)
+        job_compression_level / JOB_COMPRESSION_LEVEL / PYIRONJOBCOMPRESSIONLEVEL (int): Compression level of the
+            job compression codec. (Default is None, which uses the default level of the codec.)
+        job_status_refresh_interval / JOB_STATUS_REFRESH_INTERVAL / PYIRONJOBSTATUSREFRESHINTERVAL (float): Minimal
+            time in seconds between two reads of the status of a job from the database, status changes made by the
+            current process are always visible immediately. (Default is 1.0.)
+        file_table_index / FILE_TABLE_INDEX / PYIRONFILETABLEINDEX (bool): Whether the file based job table, which is
+            used when the database is disabled, stores the metadata of the indexed HDF5 files in a SQLite file at the
+            root of the index, so new processes only have to read the HDF5 files which changed. (Default is False.)
 
 
     Properties:
@@ -194,6 +211,13 @@ class Settings(metaclass=Singleton):
                 "credentials_file": None,
                 "write_work_dir_warnings": True,
                 "config_file_permissions_warning": True,
+                "hdf_file_pool_size": 0,
+                "sql_pool_size": 0,
+                "sql_pool_recycle": 3600,
+                "job_compression": "bz2",
+                "job_compression_level": None,
+                "job_status_refresh_interval": 1.0,
+                "file_table_index": False,
             }
         )
 
@@ -220,6 +244,13 @@ class Settings(metaclass=Singleton):
             "PYIRONCREDENTIALSFILE": "credentials_file",
             "PYIRONWRITEWORKDIRWARNINGS": "write_work_dir_warnings",
             "PYIRONCONFIGFILEPERMISSIONSWARNING": "config_file_permissions_warning",
+            "PYIRONHDFFILEPOOLSIZE": "hdf_file_pool_size",
+            "PYIRONSQLPOOLSIZE": "sql_pool_size",
+            "PYIRONSQLPOOLRECYCLE": "sql_pool_recycle",
+            "PYIRONJOBCOMPRESSION": "job_compression",
+            "PYIRONJOBCOMPRESSIONLEVEL": "job_compression_level",
+            "PYIRONJOBSTATUSREFRESHINTERVAL": "job_status_refresh_interval",
+            "PYIRONFILETABLEINDEX": "file_table_index",
         }
 
     @property
@@ -247,6 +278,13 @@ class Settings(metaclass=Singleton):
             "CREDENTIALS_FILE": "credentials_file",
             "WRITE_WORK_DIR_WARNINGS": "write_work_dir_warnings",
             "CONFIG_FILE_PERMISSIONS_WARNING": "config_file_permissions_warning",
+            "HDF_FILE_POOL_SIZE": "hdf_file_pool_size",
+            "SQL_POOL_SIZE": "sql_pool_size",
+            "SQL_POOL_RECYCLE": "sql_pool_recycle",
+            "JOB_COMPRESSION": "job_compression",
+            "JOB_COMPRESSION_LEVEL": "job_compression_level",
+            "JOB_STATUS_REFRESH_INTERVAL": "job_status_refresh_interval",
+            "FILE_TABLE_INDEX": "file_table_index",
         }
 
     @property
@@ -494,11 +532,24 @@ class Settings(metaclass=Singleton):
                 self._configuration[key] = self._convert_to_list_of_paths(
                     value, ensure_ends_with="/" if key == "project_paths" else None
                 )
-            elif key == "connection_timeout":
+            elif key in [
+                "connection_timeout",
+                "hdf_file_pool_size",
+                "sql_pool_size",
+                "sql_pool_recycle",
+            ]:
                 self._configuration[key] = int(value)
+            elif key == "job_compression_level":
+                self._configuration[key] = None if value is None else int(value)
+            elif key == "job_status_refresh_interval":
+                self._configuration[key] = float(value)
             elif key == "sql_file":
                 self._configuration[key] = self.convert_path_to_abs_posix(value)
-            elif key in ["project_check_enabled", "disable_database"]:
+            elif key in [
+                "project_check_enabled",
+                "disable_database",
+                "file_table_index",
+            ]:
                 self._configuration[key] = (
                     value if isinstance(value, bool) else strtobool(value)
                 )
@@ -565,7 +616,7 @@ class Settings(metaclass=Singleton):
     @staticmethod
     def _fix_boolean_var_in_config(config):
         for k, v in config.items():
-            if k in ["project_check_enabled", "disable_database"]:
+            if k in ["project_check_enabled", "disable_database", "file_table_index"]:
                 config[k] = ast.literal_eval(v)
         return config
 
@@ -180,6 +180,11 @@ class FlattenedStorage(Lockable, HasHDF):
     >>> all(store.get_array("even", "second") == store.get_array("even", 1))
     True
 
+    The indices of many chunks can be looked up at once with :meth:`.find_chunks`.
+
+    >>> store.find_chunks(["second", "0"])
+    array([1, 0])
+
     When adding new arrays follow the convention that per-structure arrays should be named in singular and per-atom
     arrays should be named in plural.
 
@@ -234,6 +239,8 @@ class FlattenedStorage(Lockable, HasHDF):
         np.dtype("uint64"): 0,
         str: "_default",
     }
+    # maps the identifiers to the chunk indices, built on the first lookup by identifier
+    _identifier_index = None
 
     def __init__(self, num_chunks=1, num_elements=1, lock_method="error", **kwargs):
         """
@@ -279,6 +286,7 @@ class FlattenedStorage(Lockable, HasHDF):
             self.add_chunk(chunk_length, **{k: c for k, c in zip(keys, chunk_list)})
 
     def _init_arrays(self):
+        self._identifier_index = None
         self._per_element_arrays = {}
 
         self._per_chunk_arrays = {
@@ -330,10 +338,46 @@ class FlattenedStorage(Lockable, HasHDF):
         Raises:
             KeyError: if identifier is not found in storage
         """
-        for i, name in enumerate(self._per_chunk_arrays["identifier"]):
-            if name == identifier:
-                return i
-        raise KeyError(f"No chunk named {identifier}")
+        try:
+            return self._get_identifier_index()[identifier]
+        except KeyError:
+            raise KeyError(f"No chunk named {identifier}") from None
+
+    def find_chunks(self, identifiers: Iterable[str]) -> np.ndarray:
+        """
+        Return integer indices for given identifiers.
+
+        Args:
+            identifiers (list of str): names of chunks previously passed to :meth:`.add_chunk`
+
+        Returns:
+            numpy.ndarray: integer index for each chunk
+
+        Raises:
+            KeyError: if any identifier is not found in storage
+        """
+        index = self._get_identifier_index()
+        identifiers = list(identifiers)
+        missing = [i for i in identifiers if i not in index]
+        if len(missing) > 0:
+            raise KeyError(f"No chunks named {missing}")
+        return np.fromiter(
+            (index[i] for i in identifiers), dtype=np.int64, count=len(identifiers)
+        )
+
+    def _get_identifier_index(self):
+        if self._identifier_index is None:
+            identifiers = self._per_chunk_arrays["identifier"][: self.num_chunks]
+            # build in reverse, so that the first chunk is kept for duplicated identifiers
+            self._identifier_index = dict(
+                zip(identifiers[::-1].tolist(), range(len(identifiers) - 1, -1, -1))
+            )
+        return self._identifier_index
+
+    def _add_to_identifier_index(self, identifiers, start):
+        if self._identifier_index is not None:
+            for i, identifier in enumerate(identifiers, start=start):
+                self._identifier_index.setdefault(identifier, i)
 
     def _get_per_element_slice(self, frame):
         start = self._per_chunk_arrays["start_index"][frame]
@@ -586,6 +630,8 @@ class FlattenedStorage(Lockable, HasHDF):
                     self._per_chunk_arrays[name], strlen
                 )
             self._per_chunk_arrays[name][frame] = value
+            if name == "identifier":
+                self._identifier_index = None
         else:
             raise KeyError(f"no array named {name}")
 
@@ -608,6 +654,8 @@ class FlattenedStorage(Lockable, HasHDF):
             del self._per_element_arrays[name]
         elif name in self._per_chunk_arrays:
             del self._per_chunk_arrays[name]
+            if name == "identifier":
+                self._identifier_index = None
         elif not ignore_missing:
             raise KeyError(name)
 
@@ -721,6 +769,11 @@ class FlattenedStorage(Lockable, HasHDF):
                 raise ValueError(f"Array name {k} not present in FlattenedStorage!")
 
         split = copy.copy(self)
+        # copy the dictionaries, so that removing arrays from the split does not remove them from self
+        split._per_element_arrays = self._per_element_arrays.copy()
+        split._per_chunk_arrays = self._per_chunk_arrays.copy()
+        if self._identifier_index is not None:
+            split._identifier_index = self._identifier_index.copy()
         for k in list(split._per_element_arrays):
             if k not in array_names:
                 del split._per_element_arrays[k]
@@ -875,6 +928,13 @@ class FlattenedStorage(Lockable, HasHDF):
             self._per_chunk_arrays["identifier"], len(identifier)
         )
         self._per_chunk_arrays["identifier"][chunk_ind] = identifier
+        if chunk_ind + 1 < self.num_chunks:
+            # overwrites an existing chunk
+            self._identifier_index = None
+        else:
+            self._add_to_identifier_index(
+                identifiers=[str(identifier)], start=chunk_ind
+            )
 
         for k, a in arrays.items():
             a = np.asarray(a)
@@ -920,6 +980,12 @@ class FlattenedStorage(Lockable, HasHDF):
             FlattenedStorage: return this storage
         """
         self._check_compatible_fill_values(other=other)
+        self._add_to_identifier_index(
+            identifiers=other._per_chunk_arrays["identifier"][
+                : other.num_chunks
+            ].tolist(),
+            start=self.num_chunks,
+        )
 
         combined_num_chunks = self.num_chunks + other.num_chunks
         combined_num_elements = self.num_elements + other.num_elements
@@ -1050,6 +1116,7 @@ class FlattenedStorage(Lockable, HasHDF):
             num_chunks = hdf["num_structures"]
             num_elements = hdf["num_atoms"]
 
+        self._identifier_index = None
         self._num_chunks_alloc = self.num_chunks = self.current_chunk_index = num_chunks
         self._num_elements_alloc = self.num_elements = self.current_element_index = (
             num_elements
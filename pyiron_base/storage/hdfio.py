@@ -6,6 +6,7 @@ Classes to map the Python objects to HDF5 data structures
 """
 
 import numbers
+import h5py
 from h5io_browser import Pointer
 from h5io_browser.base import (
     _open_hdf,
@@ -22,6 +23,7 @@ import sys
 from typing import Union, Optional, Any, Tuple
 
 from pyiron_base.utils.deprecate import deprecate
+from pyiron_base.storage.hdfpool import hdf_file_pool
 from pyiron_base.storage.helper_functions import (
     get_h5_path,
     list_groups_and_nodes,
@@ -44,6 +46,18 @@ __status__ = "production"
 __date__ = "Sep 1, 2017"
 
 
+# group types h5io uses to store python objects, these groups are nodes from the perspective of FileHDFio
+_H5IO_TYPES = (
+    "dict",
+    "list",
+    "tuple",
+    "pd_dataframe",
+    "pd_series",
+    "multiarray",
+    "json",
+)
+
+
 # for historic reasons we write str(class) into the HDF 'TYPE' field of objects, so we need to parse this back out
 def _extract_fully_qualified_name(type_field: str) -> str:
     return type_field.split("'")[1]
@@ -132,11 +146,19 @@ def _to_object(hdf, class_name=None, **kwargs):
     else:
         init_args = {}
 
+    is_job = static_isinstance(
+        obj=class_object, obj_type="pyiron_base.jobs.job.generic.GenericJob"
+    )
+    # jobs are loaded lazily after they are initialized, so the lazy parameter is not passed to the init
+    lazy = kwargs.pop("lazy", False) if is_job else False
     init_args.update(kwargs)
 
     obj = class_object(**init_args)
+    if lazy:
+        obj._lazy_load = True
     obj.from_hdf(hdf=hdf.open(".."), group_name=hdf.h5_path.split("/")[-1])
-    if static_isinstance(obj=obj, obj_type="pyiron_base.jobs.job.generic.GenericJob"):
+    if is_job:
+        obj._lazy_load = False
         module_name = module_path.split(".")[0]
         module = importlib.import_module(module_name)
         if hasattr(module, "Project"):
@@ -219,9 +241,10 @@ class FileHDFio(HasGroups, Pointer):
                 # underlying file once, this reduces the number of file opens in the most-likely case from 2 to 1 (1 to
                 # check whether the data is there and 1 to read it) and increases in the worst case from 1 to 2 (1 to
                 # try to read it here and one more time to verify it's not a group below).
-                return _read_hdf(
-                    hdf_filehandle=self.file_name, h5_path=self._get_h5_path(item)
-                )
+                with hdf_file_pool.open(self.file_name) as hdf:
+                    return _read_hdf(
+                        hdf_filehandle=hdf, h5_path=self._get_h5_path(item)
+                    )
             except (ValueError, OSError, RuntimeError, NotImplementedError):
                 # h5io couldn't find a dataset with name item, but there still might be a group with that name, which we
                 # check in the rest of the method
@@ -314,12 +337,54 @@ class FileHDFio(HasGroups, Pointer):
         ):
             value.to_hdf(self, key)
             return
+        hdf_file_pool.release(self.file_name)
         _write_hdf5_with_json_support(
             hdf_filehandle=self.file_name,
             h5_path=self._get_h5_path(key),
             data=value,
         )
 
+    def __delitem__(self, key):
+        """
+        Delete item from the HDF5 file
+
+        Args:
+            key (str): key of the item to delete
+        """
+        hdf_file_pool.release(self.file_name)
+        super().__delitem__(key)
+
+    def write_dict(self, data_dict, compression=4):
+        """
+        Write dictionary to HDF5 file
+
+        Args:
+            data_dict (dict): Dictionary of data objects to be stored in the HDF5 file, the keys provide the path
+                              relative to the current h5_path and the values the data to be stored in those nodes.
+            compression (int): Compression level to use (0-9) to compress data using gzip.
+        """
+        hdf_file_pool.release(self.file_name)
+        super().write_dict(data_dict=data_dict, compression=compression)
+
+    def copy_to(self, destination, file_name=None, maintain_name=True):
+        """
+        Copy the content of the HDF5 file to a new location
+
+        Args:
+            destination (FileHDFio): FileHDFio object pointing to the new location
+            file_name (str): name of the new HDF5 file - optional
+            maintain_name (bool): by default the names of the HDF5 groups are maintained
+
+        Returns:
+            FileHDFio: FileHDFio object pointing to a file which now contains the same content as file of the current
+                       FileHDFio object.
+        """
+        hdf_file_pool.release(destination.file_name if file_name is None else file_name)
+        hdf_file_pool.release(self.file_name)
+        return super().copy_to(
+            destination=destination, file_name=file_name, maintain_name=maintain_name
+        )
+
     @property
     def base_name(self):
         """
@@ -380,6 +445,7 @@ class FileHDFio(HasGroups, Pointer):
             FileHDFio: FileHDFio object pointing to the new group
         """
         full_name = self._get_h5_path(name)
+        hdf_file_pool.release(self.file_name)
         with _open_hdf(self.file_name, mode="a") as h:
             try:
                 h.create_group(full_name, track_order=track_order)
@@ -392,6 +458,7 @@ class FileHDFio(HasGroups, Pointer):
         """
         Remove an HDF5 group - if it exists. If the group does not exist no error message is raised.
         """
+        hdf_file_pool.release(self.file_name)
         try:
             with _open_hdf(self.file_name, mode="a") as hdf_file:
                 del hdf_file[self.h5_path]
@@ -447,6 +514,7 @@ class FileHDFio(HasGroups, Pointer):
         Remove the HDF5 file with all the related content
         """
         if self.file_exists:
+            hdf_file_pool.release(self.file_name)
             os.remove(self.file_name)
 
     def get_from_table(self, path, name):
@@ -501,6 +569,57 @@ class FileHDFio(HasGroups, Pointer):
             else:
                 raise
 
+    def read_many(self, keys, ignore_missing=False, fallback=True):
+        """
+        Read multiple datasets and groups from the HDF5 file with a single file open.
+
+        Groups are returned as :class:`FileHDFio` objects pointing to the group, like in :meth:`__getitem__`. Keys which
+        cannot be resolved inside the HDF5 file, e.g. relative paths leaving the HDF5 file via "..", fall back to
+        :meth:`__getitem__`.
+
+        Args:
+            keys (list): paths to the data relative to the current h5_path
+            ignore_missing (bool): skip keys which do not exist, instead of raising a ValueError - default=False
+            fallback (bool): resolve the keys which cannot be read from the HDF5 file with :meth:`__getitem__`, if False
+                             these keys are skipped and left to the caller - default=True
+
+        Returns:
+            dict: dictionary with the keys as keys and the corresponding data or data objects as values
+
+        Raises:
+            ValueError: a key cannot be found and ignore_missing is False
+        """
+        values, fallback_keys = {}, []
+        if self.file_exists:
+            with hdf_file_pool.open(self.file_name) as hdf:
+                for key in keys:
+                    h5_path = self._get_h5_path(key)
+                    if ".." in key.split("/") or h5_path not in hdf:
+                        fallback_keys.append(key)
+                    elif (
+                        isinstance(hdf[h5_path], h5py.Group)
+                        and str(hdf[h5_path].attrs.get("TITLE", "")) not in _H5IO_TYPES
+                    ):
+                        hdf_group = self.copy()
+                        hdf_group.h5_path = h5_path
+                        values[key] = hdf_group
+                    else:
+                        try:
+                            values[key] = _read_hdf(hdf_filehandle=hdf, h5_path=h5_path)
+                        except (ValueError, OSError, RuntimeError, NotImplementedError):
+                            fallback_keys.append(key)
+        else:
+            fallback_keys = list(keys)
+        if not fallback:
+            return values
+        for key in fallback_keys:
+            try:
+                values[key] = self[key]
+            except ValueError:
+                if not ignore_missing:
+                    raise
+        return values
+
     def put(self, key, value):
         """
         Store data inside the HDF5 file
@@ -519,9 +638,9 @@ class FileHDFio(HasGroups, Pointer):
             dict: {'groups': [list of groups], 'nodes': [list of nodes]}
         """
         if self.file_exists:
-            with _open_hdf(self.file_name) as hdf:
+            with hdf_file_pool.open(self.file_name) as hdf:
                 groups, nodes = list_groups_and_nodes(hdf=hdf, h5_path=self.h5_path)
-            iopy_nodes = self._filter_io_objects(set(groups))
+                iopy_nodes = self._filter_io_objects(set(groups), hdf=hdf)
             return {
                 "groups": sorted(list(set(groups) - iopy_nodes)),
                 "nodes": sorted(list((set(nodes) - set(groups)).union(iopy_nodes))),
@@ -678,6 +797,7 @@ class FileHDFio(HasGroups, Pointer):
                 )
             )
         self.remove_file()
+        hdf_file_pool.release(hdf_new.file_name)
         os.rename(hdf_new.file_name, file_name)
 
     def __str__(self):
@@ -723,7 +843,8 @@ class FileHDFio(HasGroups, Pointer):
         Returns:
             dict, list, float, int: data or data object
         """
-        return _read_hdf(hdf_filehandle=self.file_name, h5_path=self._get_h5_path(item))
+        with hdf_file_pool.open(self.file_name) as hdf:
+            return _read_hdf(hdf_filehandle=hdf, h5_path=self._get_h5_path(item))
 
     def write_dict_to_hdf(self, data_dict):
         """
@@ -779,40 +900,39 @@ class FileHDFio(HasGroups, Pointer):
         """
         return get_h5_path(h5_path=self.h5_path, name=name)
 
-    def _get_h5io_type(self, name):
+    def _get_h5io_type(self, name, hdf=None):
         """
         Internal function to get h5io type
 
         Args:
             name (str): HDF5 key
+            hdf (h5py.File): open HDF5 file handle to reuse - optional
 
         Returns:
             str: h5io type
         """
-        with _open_hdf(self.file_name) as store:
+        if hdf is not None:
+            return str(hdf[self.h5_path][name].attrs.get("TITLE", ""))
+        with hdf_file_pool.open(self.file_name) as store:
             return str(store[self.h5_path][name].attrs.get("TITLE", ""))
 
-    def _filter_io_objects(self, groups):
+    def _filter_io_objects(self, groups, hdf=None):
         """
         Internal function to extract h5io objects (which have the same type as normal groups)
 
         Args:
             groups (list, set): list of groups (as obtained e.g. from listdirs
+            hdf (h5py.File): open HDF5 file handle to reuse - optional
 
         Returns:
             set: h5io objects
         """
-        h5io_types = (
-            "dict",
-            "list",
-            "tuple",
-            "pd_dataframe",
-            "pd_series",
-            "multiarray",
-            "json",
-        )
         group_h5io = set(
-            [group for group in groups if self._get_h5io_type(group) in h5io_types]
+            [
+                group
+                for group in groups
+                if self._get_h5io_type(group, hdf=hdf) in _H5IO_TYPES
+            ]
         )
         return group_h5io
 
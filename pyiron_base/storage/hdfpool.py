@@ -0,0 +1,207 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+"""
+A process wide pool of open HDF5 file handles.
+
+Every read through :class:`~pyiron_base.storage.hdfio.FileHDFio` used to open and close the underlying HDF5 file. On
+network file systems each open is an expensive metadata operation, so walking the content of a single job can easily
+open the same file hundreds of times. The :class:`HDFFilePool` keeps a limited number of recently used handles open
+and hands them out again, as long as the file on disk was not modified in the meantime.
+
+The pool is disabled by default, it is enabled by setting the `hdf_file_pool_size` configuration key to the maximum
+number of handles which should be kept open.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+import os
+import threading
+
+from h5io_browser.base import _open_hdf
+
+from pyiron_base.interfaces.singleton import Singleton
+from pyiron_base.state.settings import settings
+
+__author__ = "agent"
+__copyright__ = (
+    "Copyright 2026, Max-Planck-Institut für Eisenforschung GmbH - "
+    "Computational Materials Design (CM) Department"
+)
+__version__ = "1.0"
+__maintainer__ = "Jan Janssen"
+__email__ = "agent@local"
+__status__ = "development"
+__date__ = "Oct 18, 2026"
+
+
+class _PoolEntry:
+    """
+    Open file handle in the pool together with the file stats it was opened with and the number of active users.
+
+    Args:
+        handle (h5py.File): open HDF5 file handle
+        stat (tuple): inode, size and modification time of the file at the time it was opened
+    """
+
+    __slots__ = ("handle", "stat", "users", "expired")
+
+    def __init__(self, handle, stat):
+        self.handle = handle
+        self.stat = stat
+        self.users = 0
+        self.expired = False
+
+
+def _file_stat(file_name):
+    """
+    Get the file stats used to decide if a pooled handle is still valid.
+
+    Args:
+        file_name (str): absolute path of the HDF5 file
+
+    Returns:
+        tuple: inode, size and modification time in nanoseconds
+    """
+    stat = os.stat(file_name)
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+class HDFFilePool(metaclass=Singleton):
+    """
+    Least recently used cache of open :class:`h5py.File` handles, keyed by the absolute file name and the file mode.
+
+    A handle is only reused when the inode, size and modification time of the file did not change since it was opened,
+    otherwise it is closed and the file is opened again. Writers in the current process have to call :meth:`release`
+    before opening the file for writing, as HDF5 does not allow to open a file for writing while it is still open
+    read-only within the same process. Pooled handles hold the regular HDF5 file lock, so when other processes write to
+    the same files, HDF5 file locking should be disabled by setting the environment variable
+    `HDF5_USE_FILE_LOCKING=FALSE`.
+
+    The size of the pool is defined by the `hdf_file_pool_size` configuration key, a size of zero disables the pool and
+    every call to :meth:`open` opens and closes the file directly.
+    """
+
+    def __init__(self):
+        self._handles = OrderedDict()
+        self._lock = threading.RLock()
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    @property
+    def max_size(self):
+        """
+        Maximum number of file handles kept open
+
+        Returns:
+            int: maximum number of handles, zero if the pool is disabled
+        """
+        return settings.configuration["hdf_file_pool_size"]
+
+    @property
+    def enabled(self):
+        """
+        Check if the pool is enabled
+
+        Returns:
+            bool: [True/False]
+        """
+        return self.max_size > 0
+
+    def __len__(self):
+        return len(self._handles)
+
+    @contextmanager
+    def open(self, file_name, mode="r"):
+        """
+        Get an open HDF5 file handle, either from the pool or by opening the file.
+
+        Args:
+            file_name (str): path of the HDF5 file
+            mode (str): file mode, see :func:`h5py.File`
+
+        Yields:
+            h5py.File: open HDF5 file handle, must not be closed by the caller
+        """
+        if not self.enabled:
+            if len(self._handles) > 0:
+                self.clear()
+            with _open_hdf(file_name, mode=mode) as hdf:
+                yield hdf
+            return
+        key = (os.path.abspath(file_name), mode)
+        entry = self._checkout(key=key)
+        try:
+            yield entry.handle
+        finally:
+            self._checkin(key=key, entry=entry)
+
+    def release(self, file_name):
+        """
+        Close all pooled handles of a given file, e.g. before the file is opened for writing. Handles which are
+        currently in use are closed as soon as they are returned to the pool.
+
+        Args:
+            file_name (str): path of the HDF5 file
+        """
+        if len(self._handles) == 0:
+            return
+        file_name = os.path.abspath(file_name)
+        with self._lock:
+            for key in [k for k in self._handles.keys() if k[0] == file_name]:
+                self._expire(key=key)
+
+    def clear(self):
+        """
+        Close all pooled handles.
+        """
+        with self._lock:
+            for key in list(self._handles.keys()):
+                self._expire(key=key)
+
+    def _checkout(self, key):
+        with self._lock:
+            try:
+                stat = _file_stat(file_name=key[0])
+            except OSError:
+                if key in self._handles:
+                    self._expire(key=key)
+                raise
+            entry = self._handles.get(key, None)
+            if entry is not None and entry.stat != stat:
+                self._expire(key=key)
+                entry = None
+            if entry is None:
+                entry = _PoolEntry(handle=_open_hdf(key[0], mode=key[1]), stat=stat)
+                self._handles[key] = entry
+            else:
+                self._handles.move_to_end(key)
+            entry.users += 1
+            self._trim()
+            return entry
+
+    def _checkin(self, key, entry):
+        with self._lock:
+            entry.users -= 1
+            if entry.expired and entry.users == 0:
+                entry.handle.close()
+            else:
+                self._trim()
+
+    def _expire(self, key):
+        entry = self._handles.pop(key)
+        entry.expired = True
+        if entry.users == 0:
+            entry.handle.close()
+
+    def _trim(self):
+        idle_keys = [k for k, e in self._handles.items() if e.users == 0]
+        for key in idle_keys[: max(len(self._handles) - self.max_size, 0)]:
+            self._expire(key=key)
+
+    def _reset_after_fork(self):
+        # the handles belong to the parent process, so the child starts with an empty pool
+        self._handles = OrderedDict()
+        self._lock = threading.RLock()
+
+
+hdf_file_pool = HDFFilePool()
@@ -1,7 +1,9 @@
-from h5io_browser.base import _open_hdf, _read_hdf
+from h5io_browser.base import _read_hdf
 import h5py
 import posixpath
 
+from pyiron_base.storage.hdfpool import hdf_file_pool
+
 
 def list_groups_and_nodes(hdf, h5_path):
     """
@@ -129,7 +131,7 @@ def read_dict_from_hdf(
             " parameter. Specifying both lead to this ValueError.",
         )
 
-    with _open_hdf(file_name, mode="r") as store:
+    with hdf_file_pool.open(file_name, mode="r") as store:
         output_dict = get_dict_from_nodes(store=store, h5_path=h5_path, slash=slash)
         if h5_path == "/" and recursive:
             group_paths = [g[1:] for g in get_groups_hdf(hdf=store, h5_path=h5_path)]
@@ -0,0 +1,439 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+"""
+Tar archives compressed in parallel with random access to their members.
+In order to be accessible from anywhere in pyiron, they *must* remain free of any imports from pyiron!
+
+The archive is compressed in independent blocks, in the same way as pigz does it. The concatenated blocks form a valid
+gzip, bzip2 or xz file, which can be read by tarfile and the usual command line tools. As every member of the archive
+starts a new block, the compressed offset of each member is stored in an index block behind the end of the tar archive,
+so a single member can be read without decompressing the archive up to this member. The index is located by a small
+trailer block at the very end of the file. Both are ignored by tar, which stops reading at the end of archive marker.
+"""
+
+import bz2
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import gzip
+import io
+import json
+import lzma
+import os
+import struct
+import tarfile
+
+__author__ = "agent"
+__copyright__ = (
+    "Copyright 2026, Max-Planck-Institut für Eisenforschung GmbH - "
+    "Computational Materials Design (CM) Department"
+)
+__version__ = "1.0"
+__maintainer__ = "Jan Janssen"
+__email__ = "agent@local"
+__status__ = "development"
+__date__ = "Oct 18, 2026"
+
+
+COMPRESSION_SUFFIX_DICT = {
+    "tar": ".tar",
+    "gz": ".tar.gz",
+    "bz2": ".tar.bz2",
+    "xz": ".tar.xz",
+}
+INDEX_MAGIC = b"PYIRONTARINDEX"
+TRAILER_MAGIC = b"PYIRONTARTRAILER"
+_TRAILER_SIZE = len(TRAILER_MAGIC) + struct.calcsize("<Q")
+_STREAM_MAGIC_DICT = {
+    "gz": b"\x1f\x8b\x08",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+}
+
+
+def _get_compress_function(codec, compresslevel=None):
+    """
+    Get the function to compress a single block.
+
+    Args:
+        codec (str): compression codec - ["tar", "gz", "bz2", "xz"]
+        compresslevel (int): compression level, the default of the codec is used if None
+
+    Returns:
+        callable/None: function which compresses a bytes object, None for an uncompressed archive
+    """
+    if codec == "tar":
+        return None
+    elif codec == "gz":
+        return partial(
+            gzip.compress,
+            compresslevel=9 if compresslevel is None else compresslevel,
+            mtime=0,
+        )
+    elif codec == "bz2":
+        return partial(
+            bz2.compress, compresslevel=9 if compresslevel is None else compresslevel
+        )
+    elif codec == "xz":
+        return partial(lzma.compress, preset=compresslevel)
+    else:
+        _raise_unknown_codec(codec=codec)
+
+
+def _get_decompress_function(codec):
+    """
+    Get the function to decompress one or more concatenated blocks.
+
+    Args:
+        codec (str): compression codec - ["tar", "gz", "bz2", "xz"]
+
+    Returns:
+        callable/None: function which decompresses a bytes object, None for an uncompressed archive
+    """
+    if codec == "tar":
+        return None
+    elif codec == "gz":
+        return gzip.decompress
+    elif codec == "bz2":
+        return bz2.decompress
+    elif codec == "xz":
+        return lzma.decompress
+    else:
+        _raise_unknown_codec(codec=codec)
+
+
+def _raise_unknown_codec(codec):
+    raise ValueError(
+        "The compression codec "
+        + str(codec)
+        + " is not supported, choose from "
+        + str(list(COMPRESSION_SUFFIX_DICT.keys()))
+    )
+
+
+def get_codec(file_name):
+    """
+    Get the compression codec from the file name of an archive.
+
+    Args:
+        file_name (str): file name of the archive
+
+    Returns:
+        str: compression codec
+    """
+    for codec, suffix in COMPRESSION_SUFFIX_DICT.items():
+        if codec != "tar" and file_name.endswith(suffix):
+            return codec
+    return "tar"
+
+
+class ParallelCompressionWriter(io.RawIOBase):
+    """
+    Write-only file object which compresses the data written to it in blocks using multiple threads.
+
+    The data is split into blocks of block_size bytes which are compressed independently. Only a bounded number of
+    blocks is kept in memory at any time. With start_member() a new block is started, so the following data can be
+    decompressed starting from the compressed offset of this block.
+
+    Args:
+        fileobj (file): binary file object the compressed data is written to
+        codec (str): compression codec - ["tar", "gz", "bz2", "xz"], "tar" writes the data uncompressed
+        compresslevel (int): compression level, the default of the codec is used if None
+        max_workers (int): number of compression threads, defaults to the number of CPU cores
+        block_size (int): size of the uncompressed blocks in bytes
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        codec="gz",
+        compresslevel=None,
+        max_workers=None,
+        block_size=2**22,
+    ):
+        super().__init__()
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self._fileobj = fileobj
+        self._compress = _get_compress_function(
+            codec=codec, compresslevel=compresslevel
+        )
+        self._block_size = block_size
+        self._buffer = bytearray()
+        self._position = 0
+        self._max_pending = 2 * max_workers
+        self._pending = deque()
+        self._block_offset_lst = []
+        self._compressed_size = 0
+        if self._compress is not None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = None
+
+    @property
+    def block_offset_lst(self):
+        """
+        Compressed offsets of the blocks written so far.
+
+        Returns:
+            list: offset of each block in bytes
+        """
+        return self._block_offset_lst
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        while len(self._buffer) >= self._block_size:
+            self._submit(bytes(self._buffer[: self._block_size]))
+            del self._buffer[: self._block_size]
+        return len(data)
+
+    @property
+    def compressed_size(self):
+        """
+        Number of compressed bytes written to the file object so far.
+
+        Returns:
+            int: compressed size in bytes
+        """
+        return self._compressed_size
+
+    def flush(self):
+        """
+        Compress the buffered data as a block and wait until all pending blocks are written to the file object.
+        """
+        if not self.closed:
+            self.start_member()
+            while len(self._pending) > 0:
+                self._write_block(self._pending.popleft().result())
+
+    def start_member(self):
+        """
+        Start a new block, the data written next is the start of a block.
+
+        Returns:
+            int: number of the new block, its offset is available in block_offset_lst after the writer was closed
+        """
+        if len(self._buffer) > 0:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+        return len(self._block_offset_lst) + len(self._pending)
+
+    def _submit(self, block):
+        if self._compress is None:
+            self._write_block(block)
+            return
+        # zlib, bz2 and lzma release the GIL, so the blocks are compressed in parallel
+        self._pending.append(self._executor.submit(self._compress, block))
+        while len(self._pending) > self._max_pending:
+            self._write_block(self._pending.popleft().result())
+
+    def _write_block(self, block):
+        self._block_offset_lst.append(self._compressed_size)
+        self._fileobj.write(block)
+        self._compressed_size += len(block)
+
+    def close(self):
+        if not self.closed:
+            try:
+                if len(self._buffer) > 0 or (
+                    self._compress is not None
+                    and len(self._block_offset_lst) + len(self._pending) == 0
+                ):
+                    # an empty compressed file still requires a valid header
+                    self._submit(bytes(self._buffer))
+                    self._buffer = bytearray()
+                while len(self._pending) > 0:
+                    self._write_block(self._pending.popleft().result())
+            finally:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                super().close()
+
+
+class _IndexedTarFile(tarfile.TarFile):
+    """
+    TarFile which starts a new block of the ParallelCompressionWriter for every member and records the block number.
+    """
+
+    def addfile(self, tarinfo, fileobj=None):
+        self.member_block_dict[tarinfo.name] = self.fileobj.start_member()
+        super().addfile(tarinfo, fileobj)
+
+
+def write_archive(
+    file_name,
+    path_lst,
+    arcname_lst=None,
+    codec="gz",
+    compresslevel=None,
+    max_workers=None,
+    write_index=True,
+):
+    """
+    Write files and directories to a compressed tar archive.
+
+    Args:
+        file_name (str): path of the archive
+        path_lst (list): files and directories to add, directories are added recursively
+        arcname_lst (list): names of the files and directories in the archive, defaults to the paths
+        codec (str): compression codec - ["tar", "gz", "bz2", "xz"]
+        compresslevel (int): compression level, the default of the codec is used if None
+        max_workers (int): number of compression threads, defaults to the number of CPU cores
+        write_index (bool): append the index of the members behind the end of the tar archive
+    """
+    if arcname_lst is None:
+        arcname_lst = path_lst
+    with open(file_name, "wb") as f:
+        with ParallelCompressionWriter(
+            f, codec=codec, compresslevel=compresslevel, max_workers=max_workers
+        ) as writer:
+            with _IndexedTarFile.open(fileobj=writer, mode="w") as tar:
+                tar.member_block_dict = {}
+                for path, arcname in zip(path_lst, arcname_lst):
+                    tar.add(path, arcname=arcname)
+                member_block_dict = tar.member_block_dict
+                file_name_set = {m.name for m in tar.getmembers() if m.isfile()}
+            if write_index:
+                writer.flush()
+                index_dict = {
+                    name: writer.block_offset_lst[block]
+                    for name, block in member_block_dict.items()
+                    if name in file_name_set
+                }
+                index_offset = writer.compressed_size
+                writer.write(INDEX_MAGIC + json.dumps(index_dict).encode())
+                writer.flush()
+                writer.write(TRAILER_MAGIC + struct.pack("<Q", index_offset))
+
+
+def _read_trailer(f, codec):
+    """
+    Locate the index block of an archive from the trailer block at the end of the file.
+
+    Args:
+        f (file): archive opened in binary mode
+        codec (str): compression codec - ["tar", "gz", "bz2", "xz"]
+
+    Returns:
+        tuple/None: compressed offset of the index block and of the trailer block, None if the archive has no trailer
+    """
+    file_size = f.seek(0, os.SEEK_END)
+    tail_size = min(file_size, _TRAILER_SIZE if codec == "tar" else 512)
+    f.seek(file_size - tail_size)
+    tail = f.read(tail_size)
+    decompress = _get_decompress_function(codec=codec)
+    if decompress is None:
+        start_lst = [tail_size - _TRAILER_SIZE]
+    else:
+        # the compressed size of the trailer is not fixed, so every start of a compressed stream is tried from the end
+        magic = _STREAM_MAGIC_DICT[codec]
+        start_lst, start = [], tail.rfind(magic)
+        while start >= 0:
+            start_lst.append(start)
+            start = tail.rfind(magic, 0, start)
+    for start in start_lst:
+        try:
+            trailer = tail[start:] if decompress is None else decompress(tail[start:])
+        except (OSError, EOFError, ValueError, lzma.LZMAError):
+            continue
+        if len(trailer) == _TRAILER_SIZE and trailer.startswith(TRAILER_MAGIC):
+            index_offset = struct.unpack("<Q", trailer[len(TRAILER_MAGIC) :])[0]
+            return index_offset, file_size - tail_size + start
+    return None
+
+
+def read_index(file_name):
+    """
+    Read the index of an archive.
+
+    Args:
+        file_name (str): path of the archive
+
+    Returns:
+        dict/None: compressed offset of each file in the archive, None if the archive has no index
+    """
+    codec = get_codec(file_name)
+    with open(file_name, "rb") as f:
+        offsets = _read_trailer(f=f, codec=codec)
+        if offsets is None:
+            return None
+        index_offset, trailer_offset = offsets
+        f.seek(index_offset)
+        data = f.read(trailer_offset - index_offset)
+    decompress = _get_decompress_function(codec=codec)
+    if decompress is not None:
+        data = decompress(data)
+    if not data.startswith(INDEX_MAGIC):
+        return None
+    return json.loads(data[len(INDEX_MAGIC) :].decode())
+
+
+def list_archive_files(file_name):
+    """
+    List the files in an archive, the archive is only decompressed when it has no index.
+
+    Args:
+        file_name (str): path of the archive
+
+    Returns:
+        list: names of the files in the archive
+    """
+    index_dict = read_index(file_name=file_name)
+    if index_dict is not None:
+        return list(index_dict.keys())
+    with tarfile.open(file_name, "r") as tar:
+        return [member.name for member in tar.getmembers() if member.isfile()]
+
+
+def _open_decompressed(fileobj, codec):
+    if codec == "gz":
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    elif codec == "bz2":
+        return bz2.BZ2File(fileobj, mode="rb")
+    elif codec == "xz":
+        return lzma.LZMAFile(fileobj, mode="rb")
+    else:
+        return fileobj
+
+
+def read_archive_file(file_name, member_name):
+    """
+    Read a single file from an archive. With an index only the blocks of this file are decompressed, otherwise the
+    archive is decompressed up to this file.
+
+    Args:
+        file_name (str): path of the archive
+        member_name (str): name of the file in the archive
+
+    Returns:
+        bytes: content of the file
+
+    Raises:
+        FileNotFoundError: if the file is not part of the archive
+    """
+    index_dict = read_index(file_name=file_name)
+    if index_dict is not None:
+        if member_name not in index_dict:
+            raise FileNotFoundError(member_name)
+        with open(file_name, "rb") as f:
+            f.seek(index_dict[member_name])
+            with tarfile.open(
+                fileobj=_open_decompressed(fileobj=f, codec=get_codec(file_name)),
+                mode="r|",
+            ) as tar:
+                return tar.extractfile(tar.next()).read()
+    # the streaming readers of tarfile stop after the first compressed block, so the archive is opened seekable
+    with tarfile.open(file_name, "r") as tar:
+        for member in tar:
+            if member.name == member_name and member.isfile():
+                return tar.extractfile(member).read()
+    raise FileNotFoundError(member_name)
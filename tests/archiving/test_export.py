@@ -1,7 +1,16 @@
 import os
 import unittest
 from pyiron_base import Project
-from pyiron_base.project.archiving.export_archive import export_database
+from pyiron_base.project.archiving.export_archive import (
+    export_database,
+    export_files_to_tar,
+)
+from pyiron_base.project.archiving.import_archive import extract_archive
+from pyiron_base.utils.compression import ParallelCompressionWriter
+import gzip
+import io
+import tarfile
+import tempfile
 import pandas as pd
 from pandas._testing import assert_frame_equal
 from filecmp import dircmp
@@ -92,5 +101,110 @@ class TestPack(PyironTestCase):
         self.assertListEqual(desirable_lst, content_tmp)
 
 
+class TestStreamingArchive(PyironTestCase):
+    def test_parallel_gzip_writer(self):
+        data = os.urandom(1000) * 50
+        buffer = io.BytesIO()
+        with ParallelCompressionWriter(
+            buffer, codec="gz", max_workers=2, block_size=4096
+        ) as gz:
+            gz.write(data[:10000])
+            gz.write(data[10000:])
+        self.assertEqual(gzip.decompress(buffer.getvalue()), data)
+        buffer = io.BytesIO()
+        with ParallelCompressionWriter(buffer, codec="gz") as gz:
+            pass
+        self.assertEqual(gzip.decompress(buffer.getvalue()), b"")
+
+    def test_deduplicate(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tempdir:
+            project_dir = os.path.join(tempdir, "project")
+            os.makedirs(os.path.join(project_dir, "sub"))
+            file_lst = [
+                os.path.join(project_dir, "a.h5"),
+                os.path.join(project_dir, "sub", "b.h5"),
+                os.path.join(project_dir, "c.h5"),
+            ]
+            for file_name, content in zip(file_lst, ["same", "same", "diff"]):
+                with open(file_name, "w") as f:
+                    f.write(content)
+            archive = os.path.join(tempdir, "archive")
+            export_files_to_tar(
+                file_lst=file_lst,
+                directory_to_transfer=project_dir,
+                archive_file=archive + ".tar.gz",
+                csv_content="id\n",
+                deduplicate=True,
+            )
+            with tarfile.open(archive + ".tar.gz", "r:gz") as tar:
+                member_lst = tar.getmembers()
+            member_dict = {m.name: m for m in member_lst}
+            self.assertEqual(member_lst[0].name, "project")
+            self.assertTrue(member_dict["project/sub/b.h5"].islnk())
+            self.assertFalse(member_dict["project/c.h5"].islnk())
+            self.assertIn("project/export.csv", member_dict.keys())
+            extract_dir = os.path.join(tempdir, "extract")
+            os.makedirs(extract_dir)
+            os.chdir(extract_dir)
+            try:
+                extract_archive(archive)
+            finally:
+                os.chdir(cwd)
+            extracted = os.path.join(extract_dir, "project", "sub", "b.h5")
+            with open(extracted) as f:
+                self.assertEqual(f.read(), "same")
+            self.assertEqual(os.stat(extracted).st_nlink, 1)
+
+    def test_extract_multiple_blocks(self):
+        cwd = os.getcwd()
+        data = os.urandom(5 * 2**20)
+        with tempfile.TemporaryDirectory() as tempdir:
+            project_dir = os.path.join(tempdir, "project")
+            os.makedirs(project_dir)
+            file_lst = [
+                os.path.join(project_dir, "large.h5"),
+                os.path.join(project_dir, "small.h5"),
+            ]
+            for file_name, content in zip(file_lst, [data, b"small"]):
+                with open(file_name, "wb") as f:
+                    f.write(content)
+            archive = os.path.join(tempdir, "archive")
+            export_files_to_tar(
+                file_lst=file_lst,
+                directory_to_transfer=project_dir,
+                archive_file=archive + ".tar.gz",
+                csv_content="id\n",
+            )
+            extract_dir = os.path.join(tempdir, "extract")
+            os.makedirs(extract_dir)
+            os.chdir(extract_dir)
+            try:
+                extract_archive(archive)
+            finally:
+                os.chdir(cwd)
+            with open(os.path.join(extract_dir, "project", "large.h5"), "rb") as f:
+                self.assertEqual(f.read(), data)
+            self.assertTrue(
+                os.path.exists(os.path.join(extract_dir, "project", "export.csv"))
+            )
+
+    def test_pack_unpack(self):
+        pr = Project("test_stream")
+        job = pr.create_job(job_type=ToyJob, job_name="toy")
+        job.run()
+        pr.pack(destination_path="stream_archive", max_workers=2, deduplicate=True)
+        pr.remove(enable=True)
+        pr_imp = Project("stream_archive", unpack=True)
+        try:
+            self.assertEqual(pr_imp.path, pr.path)
+            self.assertEqual(len(pr_imp.job_table()), 1)
+            self.assertEqual(pr_imp.load("toy").status, "finished")
+        finally:
+            pr_imp.remove(enable=True)
+            os.remove("stream_archive.tar.gz")
+            os.remove("export.csv")
+
+
 if __name__ == "__main__":
     unittest.main()
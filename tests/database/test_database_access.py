@@ -13,12 +13,15 @@ Murat Han Celik
 
 import unittest
 import os
+import time
 from datetime import datetime
 from random import choice
 from string import ascii_uppercase
-from pyiron_base.database.generic import DatabaseAccess
+from pyiron_base.database.generic import DatabaseAccess, PooledConnection
 from pyiron_base._tests import PyironTestCase
+from unittest import mock
 from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
 
 
 class TestDatabaseAccess(PyironTestCase):
@@ -182,6 +185,113 @@ class TestDatabaseAccess(PyironTestCase):
                 "Unexpectedly, item_update raises an Error with types of ids which should be usable"
             )
 
+    def test_add_items_dicts(self):
+        """
+        Tests add_items_dicts function
+        Returns:
+        """
+        par_dict_lst = [
+            {
+                "chemicalformula": formula,
+                "job": "bulk_" + formula,
+                "project": "database.testing/",
+                "status": "created",
+            }
+            for formula in ["BO", "H2", "Fe"]
+        ]
+        key_lst = self.database.add_items_dicts(par_dict_lst)
+        self.assertEqual(len(key_lst), 3)
+        self.assertEqual(len(set(key_lst)), 3)
+        for key, par_dict in zip(key_lst, par_dict_lst):
+            self.assertIsInstance(key, int)
+            self.assertTrue(
+                par_dict.items() <= self.database.get_item_by_id(key).items()
+            )
+        self.assertEqual(self.database.add_items_dicts([]), [])
+
+    def test_items_update(self):
+        """
+        Tests item_update and set_job_status with multiple ids
+        Returns:
+        """
+        key_lst = [self.add_items(formula)["id"] for formula in ["BO", "H2", "Fe"]]
+        self.database.item_update({"job": "testing_bulk"}, key_lst[:2])
+        self.assertEqual(
+            [self.database.get_item_by_id(key)["job"] for key in key_lst],
+            ["testing_bulk", "testing_bulk", "testing"],
+        )
+        self.database._items_update({"status": "aborted"}, key_lst[1:])
+        self.assertEqual(
+            [self.database.get_item_by_id(key)["status"] for key in key_lst],
+            ["KAAAA", "aborted", "aborted"],
+        )
+
+    def test_get_child_status_lst(self):
+        """
+        Tests get_child_status_lst function
+        Returns:
+        """
+        master_id = self.add_items("BO")["id"]
+        child_id_lst = [self.add_items(formula)["id"] for formula in ["H2", "Fe"]]
+        self.database.item_update({"masterid": master_id}, child_id_lst)
+        self.database.item_update({"status": "finished"}, child_id_lst[0])
+        self.assertEqual(
+            sorted(self.database.get_child_status_lst(master_id=master_id)),
+            ["KAAAA", "finished"],
+        )
+        self.assertEqual(
+            self.database.get_child_status_lst(master_id=child_id_lst[0]), []
+        )
+
+    def test_update_job_status(self):
+        """
+        Tests update_job_status function
+        Returns:
+        """
+        key = self.add_items("BO")["id"]
+        write_count = self.database.get_status_write_count()
+        self.assertTrue(self.database.update_job_status(job_id=key, status="running"))
+        self.assertEqual(self.database.get_job_status(key), "running")
+        self.assertEqual(self.database.get_status_write_count(), write_count + 1)
+        self.assertFalse(self.database.update_job_status(job_id=key, status="running"))
+        self.assertEqual(self.database.get_status_write_count(), write_count + 1)
+        self.assertFalse(
+            self.database.update_job_status(
+                job_id=key, status="finished", expected_status="submitted"
+            )
+        )
+        self.assertEqual(self.database.get_job_status(key), "running")
+        self.assertTrue(
+            self.database.update_job_status(
+                job_id=key, status="finished", expected_status="running"
+            )
+        )
+        self.assertEqual(self.database.get_job_status(key), "finished")
+        self.assertFalse(
+            self.database.update_job_status(job_id=key + 1000, status="finished")
+        )
+
+    def test_get_job_status_dict(self):
+        """
+        Tests get_job_status_dict function
+        Returns:
+        """
+        key_lst = [self.add_items(formula)["id"] for formula in ["H2", "Fe"]]
+        self.database.item_update({"status": "finished"}, key_lst[1])
+        self.assertEqual(
+            self.database.get_job_status_dict(job_id_lst=key_lst + [key_lst[1] + 1000]),
+            {key_lst[0]: "KAAAA", key_lst[1]: "finished"},
+        )
+
+    def test_wait_for_job_status_change(self):
+        """
+        Tests wait_for_job_status_change function, SQLite databases can not notify and wait for the full timeout
+        Returns:
+        """
+        start = time.time()
+        self.assertFalse(self.database.wait_for_job_status_change(timeout=0.1))
+        self.assertGreaterEqual(time.time() - start, 0.1)
+
     def test_delete_item(self):
         """
         Tests delete_item function
@@ -217,6 +327,29 @@ class TestDatabaseAccess(PyironTestCase):
         result = self.database.get_item_by_id(key)
         self.assertTrue(par_dict.items() <= result.items())
 
+    def test_get_job_status(self):
+        """
+        Tests get_job_status function
+        Returns:
+        """
+        key = self.add_items("BO")["id"]
+        self.assertEqual(self.database.get_job_status(key), "KAAAA")
+        self.assertEqual(self.database.get_job_status(str(key)), "KAAAA")
+        self.assertIsNone(self.database.get_job_status(None))
+        self.assertRaises(IndexError, self.database.get_job_status, key + 1)
+
+    def test_sqlite_not_pooled(self):
+        """
+        SQLite databases keep using a single connection even if a pool size is given
+        Returns:
+        """
+        database = DatabaseAccess(
+            "sqlite:///test_database.db", "simulation", pool_size=2
+        )
+        self.assertFalse(database._pooled)
+        self.assertNotIsInstance(database.conn, PooledConnection)
+        database.conn.close()
+
     def test_get_items_dict_and(self):
         """
         Tests the 'and' functionality of get_items_dict function
@@ -363,5 +496,73 @@ class TestDatabaseAccess(PyironTestCase):
         return par_dict
 
 
+class TestPooledConnection(PyironTestCase):
+    """
+    Unittest of the PooledConnection class with an engine which behaves like the engine of a Postgres database
+    """
+
+    def setUp(self):
+        self.engine = mock.MagicMock()
+        self.conn = self.engine.begin.return_value.__enter__.return_value
+        self.conn.execute.return_value.returns_rows = False
+        self.pooled = PooledConnection(self.engine, retries=3)
+
+    @staticmethod
+    def _operational_error(connection_invalidated):
+        return OperationalError(
+            "select",
+            {},
+            Exception("server closed the connection"),
+            connection_invalidated=connection_invalidated,
+        )
+
+    def test_execute(self):
+        self.assertIs(self.pooled.execute("select"), self.conn.execute.return_value)
+        self.conn.execute.assert_called_once_with("select")
+
+    def test_connection_lost(self):
+        self.conn.execute.side_effect = [
+            self._operational_error(connection_invalidated=True),
+            self.conn.execute.return_value,
+        ]
+        with mock.patch("pyiron_base.utils.error.time.sleep"):
+            self.pooled.execute("select")
+        self.assertEqual(self.conn.execute.call_count, 2)
+
+    def test_connection_lost_permanently(self):
+        self.conn.execute.side_effect = self._operational_error(
+            connection_invalidated=True
+        )
+        with mock.patch("pyiron_base.utils.error.time.sleep"):
+            self.assertRaises(OperationalError, self.pooled.execute, "select")
+        self.assertEqual(self.conn.execute.call_count, 3)
+
+    def test_operational_error(self):
+        self.conn.execute.side_effect = self._operational_error(
+            connection_invalidated=False
+        )
+        self.assertRaises(OperationalError, self.pooled.execute, "select")
+        self.assertEqual(self.conn.execute.call_count, 1)
+
+    def test_database_access_no_retry(self):
+        database = DatabaseAccess.__new__(DatabaseAccess)
+        database._pooled = True
+        database._listen_connection = None
+        database._keep_connection = True
+        database._engine = self.engine
+        database.conn = self.pooled
+        self.conn.execute.side_effect = self._operational_error(
+            connection_invalidated=False
+        )
+        self.assertRaises(
+            OperationalError,
+            database._execute_update,
+            query_lst=["update"],
+            par_dict={"status": "finished"},
+        )
+        self.assertRaises(OperationalError, database._execute_query, query="select")
+        self.assertEqual(self.conn.execute.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -97,6 +97,77 @@ class TestDatabaseAccess(PyironTestCase):
                 "Unexpectedly, item_update raises an Error with types of ids which should be usable"
             )
 
+    def test_add_items_dicts(self):
+        """
+        Tests add_items_dicts function
+        Returns:
+        """
+        par_dict_lst = [
+            {
+                "chemicalformula": formula,
+                "job": "bulk_" + formula,
+                "project": "database.testing/",
+                "status": "created",
+            }
+            for formula in ["BO", "H2", "Fe"]
+        ]
+        key_lst = self.database.add_items_dicts(par_dict_lst)
+        self.assertEqual(len(key_lst), 3)
+        self.assertEqual(len(set(key_lst)), 3)
+        for key, par_dict in zip(key_lst, par_dict_lst):
+            self.assertIsInstance(key, int)
+            self.assertTrue(
+                par_dict.items() <= self.database.get_item_by_id(key).items()
+            )
+        self.assertEqual(self.database.add_items_dicts([]), [])
+
+    def test_items_update(self):
+        """
+        Tests item_update and set_job_status with multiple ids
+        Returns:
+        """
+        key_lst = [self.add_items(formula)["id"] for formula in ["BO", "H2", "Fe"]]
+        self.database.item_update({"job": "testing_bulk"}, key_lst[:2])
+        self.assertEqual(
+            [self.database.get_item_by_id(key)["job"] for key in key_lst],
+            ["testing_bulk", "testing_bulk", "testing"],
+        )
+        self.database._items_update({"status": "aborted"}, key_lst[1:])
+        self.assertEqual(
+            [self.database.get_item_by_id(key)["status"] for key in key_lst],
+            ["KAAAA", "aborted", "aborted"],
+        )
+
+    def test_get_child_status_lst(self):
+        """
+        Tests get_child_status_lst function
+        Returns:
+        """
+        master_id = self.add_items("BO")["id"]
+        child_id_lst = [self.add_items(formula)["id"] for formula in ["H2", "Fe"]]
+        self.database.item_update({"masterid": master_id}, child_id_lst)
+        self.database.item_update({"status": "finished"}, child_id_lst[0])
+        self.assertEqual(
+            sorted(self.database.get_child_status_lst(master_id=master_id)),
+            ["KAAAA", "finished"],
+        )
+        self.assertEqual(
+            self.database.get_child_status_lst(master_id=child_id_lst[0]), []
+        )
+        self.assertRaises(
+            IndexError,
+            self.database._update_hdf5_status,
+            job_id=[master_id, 123456789],
+            status="aborted",
+        )
+        self.assertRaises(
+            IndexError,
+            self.database.set_job_status,
+            job_id=[master_id, 123456789],
+            status="aborted",
+        )
+        self.assertEqual(self.database.get_item_by_id(master_id)["status"], "KAAAA")
+
     def test_delete_item(self):
         """
         Tests delete_item function
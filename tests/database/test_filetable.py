@@ -2,13 +2,18 @@
 # Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
-from os import mkdir, rmdir
-from os.path import abspath, dirname, join
+from os import mkdir, rmdir, stat, utime
+from os.path import abspath, dirname, exists, join
 from time import perf_counter as time
+from unittest import mock
+
+import h5py
+from h5io_browser.base import _write_hdf
 
 from pyiron_base._tests import PyironTestCase, ToyJob
 
-from pyiron_base.database.filetable import FileTable
+import pyiron_base.database.filetable
+from pyiron_base.database.filetable import FileTable, FileTableIndex
 from pyiron_base.project.generic import Project
 
 
@@ -67,6 +72,46 @@ class TestFileTable(PyironTestCase):
             ft is another_ft, msg="New paths should create new FileTable instances"
         )
 
+    def test_lookup(self):
+        # a separate path, as the file tables of loc1 and loc2 are created in test_re_initialization
+        path = join(dirname(abspath(__file__)), "ft_test_lookup")
+        mkdir(path)
+        ft = FileTable(path)
+        master_id = ft.add_item_dict({"job": "master", "project": path + "/"})
+        child_ids = ft.add_items_dicts(
+            [
+                {
+                    "job": "child_" + str(i),
+                    "project": path + "/master_hdf5/",
+                    "masterid": master_id,
+                }
+                for i in range(3)
+            ]
+        )
+        self.assertEqual(ft.get_job_id("master", project=path + "/"), master_id)
+        self.assertEqual(
+            ft.get_job_id("child_1", project=path), child_ids[1], msg="LIKE match"
+        )
+        self.assertEqual(ft.get_child_ids("master", project=path + "/"), child_ids)
+        self.assertEqual(
+            [d["id"] for d in ft.get_items_dict({"masterid": master_id})], child_ids
+        )
+        self.assertEqual(ft.get_item_by_id(child_ids[2])["job"], "child_2")
+        with self.assertRaises(IndexError):
+            ft.get_item_by_id(max(child_ids) + 1)
+
+        ft.item_update({"job": "renamed", "masterid": None}, child_ids[0])
+        self.assertIsNone(ft.get_job_id("child_0", project=path))
+        self.assertEqual(ft.get_job_id("renamed", project=path), child_ids[0])
+        self.assertEqual(ft.get_child_status_lst(master_id), ["initialized"] * 2)
+        ft.delete_item(child_ids[1])
+        self.assertIsNone(ft.get_job_id("child_1", project=path))
+        self.assertEqual(ft.get_item_by_id(child_ids[2])["job"], "child_2")
+        for job_id in [master_id, child_ids[0], child_ids[2]]:
+            ft.delete_item(job_id)
+        self.assertEqual(len(ft._job_table), 0)
+        rmdir(path)
+
     def test_job_table(self):
         pr = Project(dirname(__file__) + "test_filetable_test_job_table")
         job = pr.create_job(job_type=ToyJob, job_name="toy_1")
@@ -93,3 +138,93 @@ class TestFileTable(PyironTestCase):
                 "duplicate jobs in the job table.",
             )
         pr.remove_jobs(recursive=True, progress=False, silently=True)
+
+    def test_update_changed_status(self):
+        pr = Project(dirname(__file__) + "test_filetable_test_update_changed_status")
+        job = pr.create_job(job_type=ToyJob, job_name="toy_1")
+        job.run()
+        ft = FileTable(index_from=pr.path)
+        ft.update()
+        with mock.patch.object(
+            pyiron_base.database.filetable,
+            "get_job_status_from_file",
+            wraps=pyiron_base.database.filetable.get_job_status_from_file,
+        ) as get_job_status_from_file:
+            ft.update()
+            self.assertEqual(
+                get_job_status_from_file.call_count,
+                0,
+                msg="Unmodified HDF5 files should not be read again",
+            )
+            file_name = job.project_hdf5.file_name
+            _write_hdf(
+                hdf_filehandle=file_name,
+                data="aborted",
+                h5_path="toy_1/status",
+                overwrite="update",
+            )
+            mtime_ns = stat(file_name).st_mtime_ns + 10**9
+            utime(file_name, ns=(mtime_ns, mtime_ns))
+            ft.update()
+            self.assertEqual(get_job_status_from_file.call_count, 1)
+        self.assertEqual(ft.get_job_status(job_id=ft.get_job_id("toy_1")), "aborted")
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+
+    def test_extract_errors(self):
+        pr = Project(dirname(__file__) + "test_filetable_test_extract_errors")
+        for job_name in ["toy_1", "toy_2"]:
+            pr.create_job(job_type=ToyJob, job_name=job_name).run()
+        foreign_file = join(pr.path, "foreign.h5")
+        with h5py.File(foreign_file, "w") as f:
+            f["data"] = [1, 2, 3]
+        for min_files in [FileTable.extract_parallel_min_files, 0]:
+            with self.subTest(extract_parallel_min_files=min_files):
+                ft = FileTable(index_from=pr.path)
+                with mock.patch.object(ft, "extract_parallel_min_files", min_files):
+                    ft.force_reset()
+                self.assertEqual(
+                    sorted(ft._job_table.job.values.tolist()), ["toy_1", "toy_2"]
+                )
+                self.assertEqual(ft._job_table.hamilton.values.tolist(), 2 * ["ToyJob"])
+                self.assertEqual(ft._job_table.status.values.tolist(), 2 * ["finished"])
+                self.assertEqual(list(ft.extract_errors.keys()), [foreign_file])
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+        pr.remove(enable=True)
+
+    def test_persistent_index(self):
+        pr = Project(dirname(__file__) + "test_filetable_test_persistent_index")
+        for job_name in ["toy_1", "toy_2"]:
+            pr.create_job(job_type=ToyJob, job_name=job_name).run()
+        file_name = pr.load("toy_1").project_hdf5.file_name
+        settings_configuration = pr.state.settings.configuration.copy()
+        pr.state.update({"file_table_index": True})
+        try:
+            ft = FileTable(index_from=pr.path)
+            ft.force_reset()
+            index = FileTableIndex(path=pr.path)
+            self.assertTrue(exists(index.path))
+            self.assertEqual(len(index.load()), 2)
+            with mock.patch.object(
+                pyiron_base.database.filetable,
+                "get_job_metadata_from_file",
+                wraps=pyiron_base.database.filetable.get_job_metadata_from_file,
+            ) as get_job_metadata_from_file:
+                ft._metadata_dict = {}
+                ft.force_reset()
+                self.assertEqual(
+                    get_job_metadata_from_file.call_count,
+                    0,
+                    msg="Unmodified HDF5 files should be read from the index",
+                )
+                self.assertEqual(
+                    sorted(ft._job_table.job.values.tolist()), ["toy_1", "toy_2"]
+                )
+                self.assertEqual(ft._job_table.hamilton.values.tolist(), 2 * ["ToyJob"])
+                mtime_ns = stat(file_name).st_mtime_ns + 10**9
+                utime(file_name, ns=(mtime_ns, mtime_ns))
+                ft.force_reset()
+                self.assertEqual(get_job_metadata_from_file.call_count, 1)
+        finally:
+            pr.state.update(settings_configuration)
+        pr.remove_jobs(recursive=True, progress=False, silently=True)
+        pr.remove(enable=True)
@@ -224,6 +224,49 @@ class TestFlattenedStorage(TestWithProject):
         ):
             store.find_chunk("asdf")
 
+    def test_find_chunks(self):
+        """find_chunks() should return the indices and stay consistent when the identifiers change."""
+
+        store = FlattenedStorage()
+        store.add_chunk(2, "first", integers=[1, 2])
+        store.add_chunk(3, integers=[3, 4, 5])
+        self.assertEqual(store.find_chunks(["1", "first"]).tolist(), [1, 0])
+
+        store.add_chunk(1, "third", integers=[5])
+        self.assertEqual(
+            store.find_chunk("third"), 2, "Index not updated by add_chunk!"
+        )
+        store.set_array("identifier", 0, "renamed")
+        self.assertEqual(
+            store.find_chunk("renamed"), 0, "Index not updated by set_array!"
+        )
+        with self.assertRaises(KeyError, msg="Index not updated by set_array!"):
+            store.find_chunk("first")
+
+        other = FlattenedStorage()
+        other.add_chunk(1, "fourth", integers=[6])
+        other.add_chunk(1, "third", integers=[7])
+        store.extend(other)
+        self.assertEqual(
+            store.find_chunks(["fourth", "third"]).tolist(),
+            [3, 2],
+            "Index not updated by extend or duplicates not resolved to the first chunk!",
+        )
+
+        split = store.split(["integers"])
+        split.set_array("identifier", 1, "split")
+        self.assertEqual(store.find_chunk("1"), 1, "Index shared with split!")
+        self.assertEqual(store.get_array("identifier", 1), "1")
+        self.assertEqual(split.find_chunk("split"), 1)
+
+        sample = store.sample(lambda s, i: i % 2 == 1)
+        self.assertEqual(sample.find_chunks(["1", "fourth"]).tolist(), [0, 1])
+
+        with self.assertRaises(
+            KeyError, msg="No KeyError raised on non-existing identifier!"
+        ):
+            store.find_chunks(["first", "third"])
+
     def test_add_chunk_add_array(self):
         """Adding arrays via add_chunk and add_array should be equivalent."""
 
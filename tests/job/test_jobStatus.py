@@ -3,7 +3,9 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import os
+from concurrent.futures import Future
 from datetime import datetime
+from unittest import mock
 from pyiron_base.project.generic import Project
 from pyiron_base.database.generic import DatabaseAccess
 from pyiron_base.jobs.job.extension.jobstatus import JobStatus
@@ -277,6 +279,73 @@ class TestJobStatus(PyironTestCase):
         self.assertNotEqual(new_status, str(self.jobstatus_database))
         self.assertEqual(finished_status, str(self.jobstatus_database))
 
+    def test_refresh_interval(self):
+        job_id = self.database.add_item_dict(
+            {"job": "refresh", "status": "running", "project": "database.testing"}
+        )
+        status = JobStatus(db=self.database, job_id=job_id)
+        self.assertTrue(status.running)
+        with mock.patch.object(
+            self.database, "get_job_status", wraps=self.database.get_job_status
+        ) as get_job_status:
+            for _ in range(10):
+                self.assertTrue(status.running)
+            self.assertEqual(get_job_status.call_count, 0)
+            status.refresh_status()
+            self.assertEqual(get_job_status.call_count, 1)
+            # status changes made by this process are visible immediately
+            self.database.set_job_status(job_id=job_id, status="collect")
+            self.assertTrue(status.collect)
+            self.assertEqual(get_job_status.call_count, 2)
+            status.string = "finished"
+            self.assertEqual(get_job_status.call_count, 2)
+            self.assertEqual(self.database.get_item_by_id(job_id)["status"], "finished")
+            self.assertTrue(status.finished)
+            self.assertEqual(get_job_status.call_count, 2)
+
+    def test_refresh_expired(self):
+        job_id = self.database.add_item_dict(
+            {"job": "expire", "status": "running", "project": "database.testing"}
+        )
+        status = JobStatus(db=self.database, job_id=job_id)
+        future = Future()
+        status.expire_when_done(future=future)
+        # simulate a status change by another process, which does not invalidate the local copy
+        self.database.conn.execute(
+            self.database.simulation_table.update()
+            .where(self.database.simulation_table.c["id"] == job_id)
+            .values(status="finished")
+        )
+        self.database.conn.commit()
+        self.assertTrue(status.running)
+        future.set_result(None)
+        self.assertTrue(status.finished)
+
+    def test_refresh_status_lst(self):
+        job_id_lst = [
+            self.database.add_item_dict(
+                {
+                    "job": "batch_" + str(i),
+                    "status": "running",
+                    "project": "database.testing",
+                }
+            )
+            for i in range(3)
+        ]
+        status_lst = [
+            JobStatus(db=self.database, job_id=job_id) for job_id in job_id_lst
+        ]
+        self.database.set_job_status(job_id=job_id_lst[1:], status="finished")
+        with mock.patch.object(
+            self.database, "get_job_status", wraps=self.database.get_job_status
+        ) as get_job_status:
+            JobStatus.refresh_status_lst(status_lst)
+            self.assertEqual(
+                [str(status) for status in status_lst],
+                ["running", "finished", "finished"],
+            )
+            self.assertEqual(get_job_status.call_count, 0)
+
 
 class JobStatusIntegration(PyironTestCase):
     @classmethod
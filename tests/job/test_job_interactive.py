@@ -3,7 +3,13 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
-from pyiron_base.jobs.job.interactive import InteractiveBase
+import h5py
+import numpy as np
+from pyiron_base.jobs.job.interactive import (
+    InteractiveBase,
+    InteractiveCache,
+    InteractiveCacheBuffer,
+)
 from pyiron_base._tests import TestWithProject
 
 
@@ -20,3 +26,125 @@ class TestJobInteractive(TestWithProject):
         with job.interactive_open() as job_int:
             job_int.to_hdf()
         self.assertTrue(job.server.run_mode.interactive)
+
+    def test_interactive_flush(self):
+        job = self.project.create_job(InteractiveBase, "job_flush")
+        job.interactive_chunk_size = 4
+        job.interactive_compression = "gzip"
+        job.to_hdf()
+        for step in range(3):
+            job.interactive_cache = {
+                "energy": [float(i) for i in range(5 * step, 5 * step + 5)],
+                "positions": [np.ones((2, 3)) * i for i in range(5)],
+            }
+            job.interactive_flush(path="interactive")
+        self.assertEqual(
+            job["output/interactive/energy"].tolist(), [float(i) for i in range(15)]
+        )
+        self.assertEqual(job["output/interactive/positions"].shape, (15, 2, 3))
+        with h5py.File(job.project_hdf5.file_name, "r") as hdf:
+            dataset = hdf[job.job_name + "/output/interactive/energy"]
+            self.assertEqual(dataset.maxshape, (None,))
+            self.assertEqual(dataset.chunks, (4,))
+            self.assertEqual(dataset.compression, "gzip")
+        self.assertFalse(job._interactive_hdf_rewritten)
+        job_loaded = self.project.create_job(InteractiveBase, "job_flush")
+        job_loaded.from_hdf()
+        self.assertEqual(job_loaded.interactive_chunk_size, 4)
+        self.assertEqual(job_loaded.interactive_compression, "gzip")
+
+    def test_interactive_async_flush(self):
+        job = self.project.create_job(InteractiveBase, "job_async_flush")
+        job.interactive_async_flush = True
+        job.to_hdf()
+        for step in range(3):
+            job.interactive_cache = {
+                "energy": [float(i) for i in range(5 * step, 5 * step + 5)],
+            }
+            job.interactive_flush(path="interactive")
+            self.assertEqual(len(job.interactive_cache["energy"]), 0)
+        job._interactive_flush_thread_wait()
+        self.assertEqual(
+            job["output/interactive/energy"].tolist(), [float(i) for i in range(15)]
+        )
+        job.interactive_cache["energy"] = [15.0]
+        job.interactive_close()
+        self.assertIsNone(job._interactive_flush_thread)
+        self.assertEqual(
+            job["output/interactive/energy"].tolist(), [float(i) for i in range(16)]
+        )
+        job_loaded = self.project.create_job(InteractiveBase, "job_async_flush")
+        job_loaded.from_hdf()
+        self.assertTrue(job_loaded.interactive_async_flush)
+
+    def test_interactive_async_flush_error(self):
+        def write_cache(cache, path, include_last_step=False):
+            raise ValueError("write failed")
+
+        job = self.project.create_job(InteractiveBase, "job_async_error")
+        job.interactive_async_flush = True
+        job._interactive_write_cache = write_cache
+        job.interactive_cache = {"energy": [1.0]}
+        job.interactive_flush(path="interactive")
+        with self.assertRaises(ValueError):
+            job._interactive_flush_thread_wait()
+        job._interactive_flush_thread_stop()
+
+    def test_extend_hdf(self):
+        job = self.project.create_job(InteractiveBase, "job_extend")
+        job.to_hdf()
+        with job.project_hdf5.open("output") as h5:
+            h5["interactive/energy"] = np.arange(3)
+            self.assertFalse(
+                job._extend_hdf(
+                    h5=h5, path="interactive", key="energy", data=np.arange(2.0)
+                )
+            )
+            self.assertTrue(
+                job._extend_hdf(
+                    h5=h5, path="interactive", key="energy", data=np.arange(2)
+                )
+            )
+            self.assertEqual(h5["interactive/energy"].tolist(), [0, 1, 2, 0, 1, 0, 1])
+            self.assertEqual(h5["interactive/energy"].dtype, np.float64)
+
+
+class TestInteractiveCacheBuffer(unittest.TestCase):
+    def test_append(self):
+        buffer = InteractiveCacheBuffer()
+        for i in range(40):
+            buffer.append(np.ones((2, 3)) * i)
+        self.assertEqual(len(buffer), 40)
+        self.assertEqual(buffer.get_data().shape, (40, 2, 3))
+        self.assertEqual(buffer[-1].tolist(), (np.ones((2, 3)) * 39).tolist())
+        self.assertEqual(np.array(buffer)[1, 0, 0], 1.0)
+
+    def test_dtype_promotion(self):
+        buffer = InteractiveCacheBuffer()
+        buffer.append(1)
+        buffer.append(2.5)
+        self.assertEqual(buffer.get_data().tolist(), [1.0, 2.5])
+        buffer.append("three")
+        self.assertEqual(buffer.get_data(), [1.0, 2.5, "three"])
+
+    def test_write_frequency(self):
+        for length in [2, 3, 4, 9, 10, 11]:
+            for include_last in [True, False]:
+                buffer = InteractiveCacheBuffer(write_frequency=3)
+                for i in range(length):
+                    buffer.append(float(i))
+                self.assertEqual(
+                    list(buffer.get_data(include_last=include_last)),
+                    InteractiveBase._include_last_step(
+                        array=[float(i) for i in range(length)],
+                        step=3,
+                        include_last=include_last,
+                    ),
+                )
+
+    def test_cache(self):
+        cache = InteractiveCache({"energy": [1.0, 2.0, 3.0]}, write_frequency=2)
+        self.assertIsInstance(cache["energy"], InteractiveCacheBuffer)
+        self.assertEqual(cache["energy"].get_data().tolist(), [1.0, 3.0])
+        cache["energy"] = []
+        self.assertEqual(len(cache["energy"]), 0)
@@ -1,6 +1,8 @@
 import os
 import time
-from pyiron_base._tests import TestWithCleanProject
+import unittest
+from pyiron_base._tests import TestWithCleanProject, ToyJob
+from pyiron_base.jobs.worker import AdaptiveSleep
 
 
 class TestWorker(TestWithCleanProject):
@@ -28,3 +30,51 @@ class TestWorker(TestWithCleanProject):
         df = self.sub_project.job_table()
         self.assertEqual(len(df[df.status == "finished"]), 1)
         time.sleep(10)  # Wait for the worker process to finish
+
+    def test_worker_in_process(self):
+        worker = self.project.create.job.WorkerJob("runner_in_process")
+        worker.project_to_watch = self.project.open("sub_in_process")
+        worker.server.run_mode.thread = True
+        worker.input.run_in_process = True
+        worker.input.maxtasksperchild = 2
+        worker.input.sleep_interval = 1
+        worker.run()
+        for i in range(3):
+            job = worker.project_to_watch.create_job(ToyJob, "toy_" + str(i))
+            job.server.run_mode.worker = True
+            job.master_id = worker.job_id
+            job.run()
+        worker.project_to_watch.wait_for_jobs()
+        worker.status.collect = True
+        df = worker.project_to_watch.job_table()
+        self.assertEqual(len(df[df.status == "finished"]), 3)
+        time.sleep(5)  # Wait for the worker process to finish
+
+
+class TestAdaptiveSleep(unittest.TestCase):
+    def test_backoff(self):
+        backoff = AdaptiveSleep(max_interval=0.04, min_interval=0.01)
+        self.assertEqual(backoff.interval, 0.01)
+        self.assertFalse(backoff.sleep())
+        self.assertEqual(backoff.interval, 0.02)
+        backoff.sleep()
+        backoff.sleep()
+        self.assertEqual(backoff.interval, 0.04)
+        backoff.reset()
+        self.assertEqual(backoff.interval, 0.01)
+
+    def test_notification(self):
+        timeout_lst = []
+
+        def wait_function(timeout):
+            timeout_lst.append(timeout)
+            return len(timeout_lst) > 2
+
+        backoff = AdaptiveSleep(
+            max_interval=10, min_interval=1, wait_function=wait_function
+        )
+        self.assertFalse(backoff.sleep())
+        self.assertFalse(backoff.sleep())
+        self.assertTrue(backoff.sleep())
+        self.assertEqual(timeout_lst, [1, 2, 4])
+        self.assertEqual(backoff.interval, 1)
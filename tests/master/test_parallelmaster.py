@@ -3,6 +3,7 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+from unittest import mock
 from pyiron_base import JobGenerator, ParallelMaster
 from pyiron_base._tests import TestWithProject, ToyJob
 
@@ -79,6 +80,49 @@ class TestParallelMaster(TestWithProject):
         self.assertFalse(self.master_toy.convergence_check())
         self.assertTrue(self.master_toy.status.not_converged)
 
+    def test_aggregate_child_output(self):
+        master = self.project.create_job(TestMaster, "master_aggregate")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.run()
+        output = master.aggregate_child_output(
+            output_paths={
+                "job_id": "job_id",
+                "data_out": "storage/output__index_1/data_out__index_0",
+            },
+            max_workers=2,
+        )
+        job_id_lst = sorted(master.child_ids)
+        self.assertEqual(output["job_id"].tolist(), job_id_lst)
+        self.assertEqual(output["data_out"].tolist(), 10 * [101])
+        self.assertEqual(master.project_hdf5["output/job_id"].tolist(), job_id_lst)
+        df = master.output_to_pandas()
+        self.assertEqual(df["data_out"].tolist(), 10 * [101])
+        storage = master.aggregate_child_output(
+            output_paths=["storage/output__index_1/data_out__index_0"],
+            h5_path="output_flattened",
+            storage="flattened",
+        )
+        self.assertEqual(len(storage), 10)
+        self.assertEqual(storage.get_array("data_out__index_0", "test_3"), 101)
+        with self.assertRaises(ValueError):
+            master.aggregate_child_output(output_paths=["job_id"], storage="dataframe")
+
+    def test_save_child_jobs(self):
+        master = self.project.create_job(TestMaster, "master_bulk")
+        master.ref_job = self.project.create_job(ToyJob, "ref")
+        master.save()
+        job_lst = [master.create_child_job("bulk_{}".format(i)) for i in range(3)]
+        with mock.patch.object(
+            self.project.db, "add_items_dicts", wraps=self.project.db.add_items_dicts
+        ) as add_items_dicts:
+            master._save_child_jobs(job_lst=job_lst)
+        add_items_dicts.assert_called_once()
+        for job in job_lst:
+            self.assertIsNotNone(job.job_id)
+            self.assertTrue(job.status.created)
+            self.assertEqual(self.project.load(job.job_id).job_name, job.job_name)
+            self.assertEqual(job.project_hdf5["job_id"], job.job_id)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,7 +3,9 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 from pyiron_base._tests import TestWithFilledProject, ToyJob
+from pyiron_base.interfaces.lockable import Locked
 from pyiron_base.jobs.job.path import JobPath
+from pyiron_base.storage.hdfstub import HDFStub
 
 
 class TestLoaders(TestWithFilledProject):
@@ -45,6 +47,33 @@ class TestLoaders(TestWithFilledProject):
             "project",
         )
 
+    def test_load_lazy(self):
+        job = self.project.load("toy_1")
+        loaded = self.project.load("toy_1", lazy=True)
+        self.assertIsInstance(loaded, ToyJob, msg="Expected to load the full object")
+        self.assertNotIn("_server", loaded.__dict__)
+        self.assertIsInstance(
+            loaded.storage._store[loaded.storage._indices["output"]],
+            HDFStub,
+            msg="Expected the output to be read on access",
+        )
+        self.assertEqual(loaded.output.data_out, job.output.data_out)
+        self.assertNotIn(
+            "_server", loaded.__dict__, msg="Expected the server to be read on access"
+        )
+        self.assertEqual(loaded.server.to_dict(), job.server.to_dict())
+        self.assertTrue(
+            loaded.server.run_mode.modal, msg="Expected the server to be restored"
+        )
+        with self.assertRaises(Locked, msg="Expected the server to be locked"):
+            loaded.server.cores = 2
+        self.assertEqual(loaded.restart_file_list, job.restart_file_list)
+        self.assertEqual(loaded.input.data_in, job.input.data_in)
+        self.assertEqual(
+            [j.job_name for j in self.project.iter_jobs(progress=False, lazy=True)],
+            [j.job_name for j in self.project.iter_jobs(progress=False)],
+        )
+
     def test_inspect(self):
         not_fully_loaded = self.project.load("toy_1", convert_to_object=False)
         self.assertIsInstance(
@@ -1,3 +1,4 @@
+import h5py
 import numpy as np
 from pyiron_base._tests import TestWithFilledProject
 from pyiron_base import GenericJob
@@ -11,6 +12,8 @@ class TestMaintenance(TestWithFilledProject):
     def setUp(self) -> None:
         super().setUp()
         job: GenericJob = self.project["toy_1"]
+        # start from the layout written by pyiron, independent of previous repacks
+        job.project_hdf5.rewrite_hdf5()
         job["user/some"] = _test_array(5)
         job["user/some"] = _test_array()
         self.initial_toy_1_hdf_file_size = job.project_hdf5.file_size()
@@ -40,6 +43,52 @@ class TestMaintenance(TestWithFilledProject):
         self.project.maintenance.local.defragment_storage()
         self._assert_hdf_rewrite()
 
+    def test_local_defragment_storage_parallel(self):
+        self._assert_setup()
+        df = self.project.maintenance.local.defragment_storage(
+            max_workers=2, progress=False
+        )
+        self._assert_hdf_rewrite()
+        toy_1 = df[df.job == "toy_1"].iloc[0]
+        self.assertTrue(toy_1.repacked)
+        self.assertEqual(toy_1.size_before, self.initial_toy_1_hdf_file_size)
+        self.assertEqual(
+            toy_1.reclaimed,
+            self.initial_toy_1_hdf_file_size
+            - self.project["toy_1"].project_hdf5.file_size(),
+        )
+        self.assertGreater(toy_1.reclaimed, 0)
+        self.assertEqual(len(df), len(set(df.file)))
+
+    def test_local_defragment_storage_min_free_ratio(self):
+        df = self.project.maintenance.local.defragment_storage(
+            min_free_ratio=0.5, progress=False
+        )
+        self.assertTrue(df[df.job == "toy_1"].iloc[0].repacked)
+        df = self.project.maintenance.local.defragment_storage(
+            min_free_ratio=0.5, progress=False
+        )
+        self.assertFalse(df.repacked.any())
+        self.assertTrue((df.reclaimed == 0).all())
+        self.assertEqual(self.project["toy_1/user/some"], _test_array())
+
+    def test_local_defragment_storage_compression(self):
+        job = self.pr_sub["toy_3"]
+        job["user/large"] = np.arange(10000)
+        df = self.project.maintenance.local.defragment_storage(
+            compression="lzf",
+            compression_min_size=1000,
+            progress=False,
+            job="toy_3",
+        )
+        self.assertEqual(list(df.job), ["toy_3"])
+        with h5py.File(job.project_hdf5.file_name, "r") as hdf:
+            self.assertEqual(hdf["toy_3/user/large"].compression, "lzf")
+            self.assertEqual(hdf["toy_3/server"].compression, "gzip")
+        self.assertTrue(
+            np.array_equal(self.pr_sub["toy_3/user/large"], np.arange(10000))
+        )
+
     def test_update_base_to_current(self):
         self._assert_setup()
 
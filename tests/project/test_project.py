@@ -5,11 +5,13 @@
 import unittest
 from os.path import dirname, join, abspath, exists, islink
 import os
+import shutil
 import tempfile
 import pint
 import pickle
+from unittest import mock
 from pyiron_base.project.generic import Project
-from pyiron_base.project.size import _size_conversion
+from pyiron_base.project.size import _size_conversion, FolderSizeCache
 from pyiron_base._tests import (
     PyironTestCase,
     TestWithProject,
@@ -85,6 +87,34 @@ class TestProjectOperations(TestWithFilledProject):
     def test_size(self):
         self.assertTrue(self.project.size > 0)
 
+    def test_size_cache(self):
+        self.assertEqual(self.project.size, self.project.size)
+        with tempfile.TemporaryDirectory() as path:
+            os.makedirs(os.path.join(path, "a", "b"))
+            for file_name, size in [("f", 10), ("a/f", 100), ("a/b/f", 1000)]:
+                with open(os.path.join(path, file_name), "wb") as f:
+                    f.write(b"0" * size)
+            for directory in [
+                path,
+                os.path.join(path, "a"),
+                os.path.join(path, "a", "b"),
+            ]:
+                os.utime(directory, ns=(0, 0))
+            cache = FolderSizeCache()
+            self.assertEqual(cache.get_size(path=path, max_workers=2), 1110)
+            self.assertEqual(len(cache), 3)
+            with open(os.path.join(path, "a", "g"), "wb") as f:
+                f.write(b"0" * 5)
+            self.assertEqual(cache.get_size(path=path), 1115)
+            with open(os.path.join(path, "a", "b", "f"), "ab") as f:
+                f.write(b"0" * 1000)
+            # files growing in place are only noticed after invalidating their directory
+            self.assertEqual(cache.get_size(path=path), 1115)
+            cache.invalidate(path=os.path.join(path, "a"), recursive=True)
+            self.assertEqual(cache.get_size(path=path), 2115)
+            shutil.rmtree(os.path.join(path, "a"))
+            self.assertEqual(cache.get_size(path=path), 10)
+
     def test__size_conversion(self):
         conv_check = {
             -2000: (-1.953125, "kibibyte"),
@@ -208,6 +238,70 @@ class TestProjectOperations(TestWithFilledProject):
             0,
         )
         self.assertRaises(ValueError, self.project.job_table, gibberish=True)
+        df = self.project.job_table(
+            recursive=True, columns=["job"], all_columns=False, status="finished"
+        )
+        self.assertEqual(len(df), n_finished_jobs)
+        self.assertEqual(sorted(df.columns), ["id", "job"])
+        job_id_lst = sorted(self.project.job_table(recursive=True).id)
+        self.assertEqual(
+            len(self.project.job_table(recursive=True, id=(job_id_lst[1], None))),
+            n_jobs - 1,
+        )
+        self.assertEqual(
+            len(
+                self.project.job_table(
+                    recursive=True, id=(job_id_lst[1], job_id_lst[2]), job="toy*"
+                )
+            ),
+            2,
+        )
+        self.assertEqual(
+            self.project.db._get_database_filter_dict(
+                status="finished", job="toy_*", hamilton="[A-Z]*", id=(1, None)
+            ),
+            {"status": "finished", "job": "toy_%", "id": (1, None)},
+        )
+        self.assertEqual(
+            self.project.db._get_database_filter_dict(mode="regex", job="^toy"), {}
+        )
+
+    def test_job_table_cache(self):
+        cache = self.project.get_job_table_cache(max_age=3600)
+        self.assertIs(cache, self.project.get_job_table_cache(max_age=3600))
+        df = cache.job_table()
+        df_reference = self.project.job_table()
+        self.assertEqual(df.id.tolist(), df_reference.id.tolist())
+        self.assertEqual(df.status.tolist(), df_reference.status.tolist())
+        suspended_id = int(df[df.status == "suspended"].id.values[0])
+        finished_id = int(df[df.status == "finished"].id.values[0])
+        try:
+            self.project.db.set_job_status(job_id=suspended_id, status="running")
+            self.project.db.set_job_status(job_id=finished_id, status="aborted")
+            with mock.patch.object(cache, "_query", wraps=cache._query) as query:
+                df = cache.job_table()
+            # all columns are only queried for the changed job and the jobs added since the last call
+            self.assertEqual(
+                [call.kwargs["id"] for call in query.call_args_list],
+                [
+                    (suspended_id, suspended_id),
+                    (suspended_id, suspended_id),
+                    (int(df.id.max()) + 1, None),
+                ],
+            )
+            self.assertEqual(
+                query.call_args_list[0].kwargs["columns"], ["id", "status"]
+            )
+            self.assertEqual(df[df.id == suspended_id].status.values[0], "running")
+            self.assertEqual(df[df.id == finished_id].status.values[0], "finished")
+            self.assertEqual(len(df), self.n_jobs_filled_with)
+            cache.invalidate()
+            df = cache.job_table()
+            self.assertEqual(df[df.id == finished_id].status.values[0], "aborted")
+        finally:
+            self.project.db.set_job_status(job_id=suspended_id, status="suspended")
+            self.project.db.set_job_status(job_id=finished_id, status="finished")
+            cache.invalidate()
 
     def test_get_iter_jobs(self):
         self.assertEqual(
@@ -219,6 +313,17 @@ class TestProjectOperations(TestWithFilledProject):
             ],
             [101] * self.n_jobs_filled_with,
         )
+        self.assertEqual(
+            [
+                values
+                for values in self.project.iter_jobs(
+                    path=["status", "NAME", "does/not/exist"],
+                    recursive=True,
+                    status="finished",
+                )
+            ],
+            [{"status": "finished", "NAME": "ToyJob", "does/not/exist": None}] * 3,
+        )
         self.assertEqual(
             [
                 val
@@ -356,5 +461,40 @@ class TestToolRegistration(TestWithProject):
             self.project.register_tools("load", self.tools)  # Already another method
 
 
+class TestCompressJobs(TestWithProject):
+    def test_compress_jobs_parallel(self):
+        state = self.project.state
+        job_lst = []
+        for i in range(3):
+            job = self.project.create_job(ToyJob, "toy_compress_" + str(i))
+            job.run()
+            job.decompress()
+            with open(join(job.working_directory, "output.log"), "w") as f:
+                f.write("line 1\nline " + str(i) + "\n")
+            job_lst.append(job)
+        previous_codec = state.settings.configuration["job_compression"]
+        state.settings.configuration["job_compression"] = "gz"
+        try:
+            self.project.compress_jobs(parallel=2)
+        finally:
+            state.settings.configuration["job_compression"] = previous_codec
+        for i, job in enumerate(job_lst):
+            self.assertTrue(job.is_compressed())
+            self.assertTrue(
+                exists(join(job.working_directory, job.job_name + ".tar.gz"))
+            )
+            self.assertFalse(exists(join(job.working_directory, "output.log")))
+            self.assertIn("output.log", job.files.list())
+            self.assertEqual(
+                job.files.output_log.list(), ["line 1\n", "line " + str(i) + "\n"]
+            )
+            job.decompress()
+            self.assertFalse(job.is_compressed())
+            self.assertIn("output.log", os.listdir(job.working_directory))
+            self.assertFalse(
+                exists(join(job.working_directory, job.job_name + ".tar.gz"))
+            )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -306,6 +306,36 @@ class TestFileHDFio(PyironTestCase):
     def test_get_pandas(self):
         pass
 
+    def test_read_many(self):
+        values = self.full_hdf5.read_many(
+            ["content/array", "content/dict", "content/group", "content/.."]
+        )
+        self.assertEqual(values["content/array"], np.array([1, 2, 3, 4, 5, 6]))
+        self.assertEqual(values["content/dict"], {"key_1": 1, "key_2": "hallo"})
+        self.assertIsInstance(values["content/group"], FileHDFio)
+        self.assertEqual(values["content/group"].h5_path, "/content/group")
+        self.assertEqual(values["content/group"]["some_entry"], "present")
+        self.assertEqual(values["content/.."].path, self.full_hdf5.file_path + "/")
+        with self.assertRaises(ValueError):
+            self.full_hdf5.read_many(["content/array", "doesnotexist"])
+        self.assertEqual(
+            list(
+                self.full_hdf5.read_many(
+                    ["doesnotexist", "content/indices"], ignore_missing=True
+                ).keys()
+            ),
+            ["content/indices"],
+        )
+        self.assertEqual(self.empty_hdf5.read_many([], ignore_missing=True), {})
+        self.assertEqual(
+            list(
+                self.full_hdf5.read_many(
+                    ["doesnotexist", "content/..", "content/indices"], fallback=False
+                ).keys()
+            ),
+            ["content/indices"],
+        )
+
     def test_get(self):
         self.assertEqual(
             self.full_hdf5.get("doesnotexist", default=42),
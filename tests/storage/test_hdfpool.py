@@ -0,0 +1,78 @@
+# coding: utf-8
+# Copyright (c) Max-Planck-Institut für Eisenforschung GmbH - Computational Materials Design (CM) Department
+# Distributed under the terms of "New BSD License", see the LICENSE file.
+
+import os
+import unittest
+from pyiron_base._tests import PyironTestCase
+from pyiron_base.state import state
+from pyiron_base.storage.hdfio import FileHDFio
+from pyiron_base.storage.hdfpool import hdf_file_pool
+from pyiron_base.storage.helper_functions import read_dict_from_hdf
+
+
+class TestHDFFilePool(PyironTestCase):
+    def setUp(self):
+        super().setUp()
+        self.current_dir = os.path.dirname(os.path.abspath(__file__)).replace(
+            "\\", "/"
+        )
+        self.file_names = [
+            os.path.join(self.current_dir, "pool_{}.h5".format(i)) for i in range(3)
+        ]
+        for file_name in self.file_names:
+            hdf = FileHDFio(file_name=file_name)
+            hdf["a"] = 1
+            hdf["group/b"] = 2
+        self._pool_size = state.settings.configuration["hdf_file_pool_size"]
+        state.settings.configuration["hdf_file_pool_size"] = 2
+
+    def tearDown(self):
+        hdf_file_pool.clear()
+        state.settings.configuration["hdf_file_pool_size"] = self._pool_size
+        for file_name in self.file_names:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def test_reuse_handle(self):
+        with hdf_file_pool.open(self.file_names[0]) as first:
+            pass
+        with hdf_file_pool.open(self.file_names[0]) as second:
+            self.assertIs(first, second)
+            self.assertTrue(bool(second))
+        self.assertEqual(len(hdf_file_pool), 1)
+
+    def test_size_limit(self):
+        for file_name in self.file_names:
+            self.assertEqual(FileHDFio(file_name=file_name)["a"], 1)
+        self.assertEqual(len(hdf_file_pool), 2)
+
+    def test_modified_file(self):
+        hdf = FileHDFio(file_name=self.file_names[0])
+        with hdf_file_pool.open(self.file_names[0]) as first:
+            pass
+        hdf["a"] = 3
+        self.assertFalse(bool(first), msg="Writing should release pooled handles.")
+        self.assertEqual(hdf["a"], 3)
+        self.assertEqual(
+            read_dict_from_hdf(file_name=self.file_names[0], h5_path="/group"),
+            {"b": 2},
+        )
+
+    def test_release_in_use(self):
+        with hdf_file_pool.open(self.file_names[0]) as hdf:
+            hdf_file_pool.release(self.file_names[0])
+            self.assertEqual(len(hdf_file_pool), 0)
+            self.assertEqual(hdf["a"][()], 1)
+        self.assertFalse(bool(hdf))
+
+    def test_disabled(self):
+        state.settings.configuration["hdf_file_pool_size"] = 0
+        with hdf_file_pool.open(self.file_names[0]) as hdf:
+            self.assertEqual(hdf["a"][()], 1)
+        self.assertFalse(bool(hdf))
+        self.assertEqual(len(hdf_file_pool), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
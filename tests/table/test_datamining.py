@@ -3,10 +3,17 @@
 # Distributed under the terms of "New BSD License", see the LICENSE file.
 
 import unittest
+from unittest import mock
 import numpy as np
 
 import pyiron_base
 from pyiron_base._tests import TestWithProject, ToyJob
+from pyiron_base.jobs.datamining import (
+    FunctionContainer,
+    _get_function_hash,
+    _get_shard_size,
+    _get_wrapped_function,
+)
 
 
 try:
@@ -17,6 +24,16 @@ except ImportError:
     skip_parallel_test = True
 
 
+def get_item_function(key):
+    return lambda j: j[key]
+
+
+def get_name_fail_on_c(job):
+    if job.name == "test_c":
+        raise RuntimeError("Analysis interrupted.")
+    return job.name
+
+
 class TestProjectData(TestWithProject):
     @classmethod
     def setUpClass(cls):
@@ -70,6 +87,138 @@ class TestProjectData(TestWithProject):
             isinstance(df.array[0], np.ndarray), "Numpy values not read correctly."
         )
 
+    def test_db_filter(self):
+        """Filters on the job table should not load any job."""
+        table = self.project.create.table("test_db_filter")
+        table.db_filter_function = table.filter.db_job_name_contains("_c")
+        table.add["name"] = lambda j: j.name
+        with mock.patch.object(
+            type(self.project),
+            "inspect",
+            new_callable=mock.PropertyMock,
+            side_effect=AssertionError("job was loaded"),
+        ):
+            table.run()
+        self.assertEqual(["test_c"], table.get_dataframe().name.to_list())
+        self.assertEqual(
+            [],
+            table.pyiron_table._collect_job_update_lst(job_status_list=["aborted"]),
+        )
+        self.project.remove_job(table.name)
+
+    def test_changed_function(self):
+        """Redefined functions should be re-evaluated on update, unchanged ones not."""
+        self.table.add["name"] = lambda j: j.name.upper()
+        self.table.update_table()
+        df = self.table.get_dataframe()
+        self.assertEqual(["TEST_A", "TEST_B"], df.name.to_list())
+        self.assertEqual(2, len(df))
+        table_loaded = self.project.load(self.table.name)
+        table_loaded.add["name"] = lambda j: j.name.upper()
+        self.assertEqual(
+            [],
+            table_loaded.pyiron_table._get_changed_functions(
+                table_loaded.project_hdf5["input"]
+            ),
+        )
+
+    def test_function_hash(self):
+        """Functions from the same factory should only share a hash if their closures are equal."""
+        self.assertEqual(
+            _get_function_hash(get_item_function("a")),
+            _get_function_hash(get_item_function("a")),
+        )
+        self.assertNotEqual(
+            _get_function_hash(get_item_function("a")),
+            _get_function_hash(get_item_function("b")),
+        )
+        self.assertIsNone(_get_function_hash(get_item_function(object())))
+        self.assertIsNotNone(_get_function_hash(get_name_fail_on_c))
+
+    def test_function_hash_stored_tables(self):
+        """Hashes computed for tables stored without hashes have to match the hashes of the added functions."""
+        container = FunctionContainer()
+        container["name"] = get_name_fail_on_c
+        container["string"] = "job.job_name"
+        self.assertEqual(
+            _get_function_hash(
+                item=_get_wrapped_function(container._user_function_dict["name"])
+            ),
+            container._user_function_hash_dict["name"],
+        )
+        self.assertIsNone(
+            _get_wrapped_function(container._user_function_dict["string"])
+        )
+
+    def test_shard_size(self):
+        self.assertEqual(_get_shard_size(job_number=80, max_workers=2), 10)
+        self.assertEqual(_get_shard_size(job_number=80, max_workers=40), 1)
+        self.assertEqual(_get_shard_size(job_number=8000, max_workers=2), 100)
+
+    def test_modified_job(self):
+        """Jobs which were modified after they were analysed should be re-evaluated."""
+        table = self.project.create.table("test_modified")
+        table.filter_function = lambda j: j.name in ["test_a", "test_b"]
+        table.add["marker"] = lambda j: j["user/marker"]
+        table.run()
+        self.assertEqual([None, None], table.get_dataframe().marker.to_list())
+        job = self.project.inspect("test_a")
+        job.project_hdf5["user/marker"] = "modified"
+        try:
+            table_loaded = self.project.load(table.name)
+            table_loaded.update_table()
+            df = table_loaded.get_dataframe()
+            self.assertEqual(2, len(df))
+            self.assertEqual(
+                {"test_a": "modified", "test_b": None},
+                dict(
+                    zip(
+                        df.job_id.map(lambda i: self.project.inspect(i).name), df.marker
+                    )
+                ),
+            )
+        finally:
+            del job.project_hdf5["user/marker"]
+            self.project.remove_job(table.name)
+
+    def test_checkpoint(self):
+        """An interrupted table should keep the finished batches and continue with the remaining jobs."""
+        table = self.project.create.table("test_checkpoint")
+        table.batch_size = 1
+        table.filter_function = lambda j: j.name in [
+            "test_a",
+            "test_b",
+            "test_c",
+            "test_d",
+        ]
+        table.add["name"] = get_name_fail_on_c
+        with self.assertRaises(RuntimeError):
+            table.run()
+        self.assertTrue(table.status.aborted)
+        table_loaded = self.project.load(table.name)
+        self.assertEqual(1, table_loaded.batch_size)
+        self.assertEqual(
+            ["test_a", "test_b"], table_loaded.get_dataframe().name.to_list()
+        )
+        table_loaded.add["name"] = lambda j: j.name
+        table_loaded.update_table()
+        self.assertEqual(
+            ["test_a", "test_b", "test_c", "test_d"],
+            table_loaded.get_dataframe().name.to_list(),
+        )
+        self.project.remove_job(table.name)
+
+    def test_process_pool(self):
+        """The table should be evaluated with the process pool executor from the standard library."""
+        table = self.project.create.table("test_process_pool")
+        table.filter_function = lambda j: j.name in ["test_a", "test_b"]
+        table.add["name"] = lambda j: j.name
+        table.executor_type = "concurrent.futures.ProcessPoolExecutor"
+        table.server.cores = 2
+        table.run()
+        self.assertEqual(["test_a", "test_b"], table.get_dataframe().name.to_list())
+        self.project.remove_job(table.name)
+
 
 @unittest.skipIf(
     skip_parallel_test,
@@ -0,0 +1,114 @@
+import bz2
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+
+from pyiron_base.utils.compression import (
+    ParallelCompressionWriter,
+    list_archive_files,
+    read_archive_file,
+    read_index,
+    write_archive,
+)
+
+
+class TestCompression(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = self.tempdir.name
+        os.makedirs(os.path.join(self.path, "sub"))
+        self.content_dict = {
+            "a.txt": b"first file\n",
+            "sub/b.txt": os.urandom(20000),
+            "c.txt": b"third file\n" * 1000,
+        }
+        for name, content in self.content_dict.items():
+            with open(os.path.join(self.path, name), "wb") as f:
+                f.write(content)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def _write_archive(self, codec, write_index=True):
+        file_name = os.path.join(self.path, "archive.tar." + codec)
+        write_archive(
+            file_name=file_name,
+            path_lst=[os.path.join(self.path, n) for n in ["a.txt", "sub", "c.txt"]],
+            arcname_lst=["a.txt", "sub", "c.txt"],
+            codec=codec,
+            max_workers=2,
+            write_index=write_index,
+        )
+        return file_name
+
+    def test_codecs(self):
+        for codec in ["tar", "gz", "bz2", "xz"]:
+            with self.subTest(codec):
+                file_name = self._write_archive(codec=codec)
+                self.assertEqual(
+                    sorted(read_index(file_name=file_name).keys()),
+                    sorted(self.content_dict.keys()),
+                )
+                with tarfile.open(file_name, "r") as tar:
+                    self.assertEqual(
+                        sorted(m.name for m in tar.getmembers() if m.isfile()),
+                        sorted(self.content_dict.keys()),
+                    )
+                    self.assertEqual(
+                        tar.extractfile("sub/b.txt").read(),
+                        self.content_dict["sub/b.txt"],
+                    )
+                self.assertEqual(
+                    sorted(list_archive_files(file_name=file_name)),
+                    sorted(self.content_dict.keys()),
+                )
+                for name, content in self.content_dict.items():
+                    self.assertEqual(
+                        read_archive_file(file_name=file_name, member_name=name),
+                        content,
+                    )
+                with self.assertRaises(FileNotFoundError):
+                    read_archive_file(file_name=file_name, member_name="sub")
+                self.assertEqual(
+                    [f for f in os.listdir(self.path) if f.startswith("archive")],
+                    [os.path.basename(file_name)],
+                )
+                os.remove(file_name)
+
+    def test_without_index(self):
+        file_name = self._write_archive(codec="gz", write_index=False)
+        self.assertIsNone(read_index(file_name=file_name))
+        self.assertEqual(
+            sorted(list_archive_files(file_name=file_name)),
+            sorted(self.content_dict.keys()),
+        )
+        self.assertEqual(
+            read_archive_file(file_name=file_name, member_name="c.txt"),
+            self.content_dict["c.txt"],
+        )
+        with self.assertRaises(FileNotFoundError):
+            read_archive_file(file_name=file_name, member_name="d.txt")
+
+    def test_writer_blocks(self):
+        data = os.urandom(1000) * 50
+        buffer = io.BytesIO()
+        with ParallelCompressionWriter(
+            buffer, codec="bz2", max_workers=2, block_size=4096
+        ) as writer:
+            writer.write(data[:10000])
+            self.assertEqual(writer.start_member(), 3)
+            writer.write(data[10000:])
+            self.assertEqual(writer.tell(), len(data))
+        self.assertEqual(len(writer.block_offset_lst), 13)
+        buffer.seek(writer.block_offset_lst[3])
+        self.assertEqual(bz2.decompress(buffer.read()), data[10000:])
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            ParallelCompressionWriter(io.BytesIO(), codec="zip")
+
+
+if __name__ == "__main__":
+    unittest.main()